@@ -0,0 +1,322 @@
+"""Latency and throughput of the main API endpoints at several data sizes.
+
+For each size a temporary SQLite file is filled with the synthetic seed
+generator, then the app is driven in-process through httpx's ASGI transport,
+or through a real uvicorn server with --server. Every scenario reports
+p50/p95/p99 latency, throughput and error count. Each size runs in its own
+interpreter so settings and engines are fresh.
+
+    python -m benchmarks.api --sizes 1000 100000 --output results.json
+    python -m benchmarks.api --baseline baseline.json --tolerance 0.2
+
+The cold start of the app (see benchmarks.startup) is measured first and
+reported under "startup". Results are written as JSON; keep one as the
+baseline for later runs. With --baseline, scenarios whose p95 latency grew or
+whose throughput dropped by more than the tolerance, or that started failing,
+and a slower import or startup, are listed as regressions and the command
+exits with status 1.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from benchmarks.startup import measure_startup
+
+SCENARIOS = ("login", "list", "get", "create", "patch", "delete")
+LIST_QUERIES = (
+    "/tasks?limit=20",
+    "/tasks?status=todo&limit=20",
+    "/tasks?status=done&sort_order=desc&limit=50&include_total=false",
+    "/tasks?status=in_progress&offset=100&limit=20",
+    "/tasks?q=review&limit=20",
+)
+TASKS_PER_USER = 50
+SAMPLE_TASKS = 500
+WARMUP_REQUESTS = 20
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)]
+
+
+def summarize(latencies: list[float], elapsed: float, errors: int) -> dict[str, float]:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def measure(
+    call: Callable[[int], Awaitable[Any]],
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """Run `call(i)` for i in range(requests), at most `concurrency` at a time."""
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await call(i)
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def uvicorn_server() -> Any:
+    """Serve project.main:app with uvicorn in a subprocess and yield its base URL."""
+    import httpx
+
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "project.main:app", "--port", str(port), "--log-level", "warning"],
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                httpx.get(f"{base_url}/health").raise_for_status()
+                break
+            except httpx.TransportError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def run_size(size: int, db_file: str, args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Seed a database with `size` tasks and benchmark every scenario against it."""
+    os.environ["DB_URL"] = f"sqlite:///{db_file}"
+
+    import httpx
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session
+
+    from project.db.db import get_engine
+    from project.db.migrate import upgrade
+    from project.db.models.task import Task
+    from project.db.models.user import Role, User
+    from project.db.seed import SYNTHETIC_PASSWORD, seed_synthetic
+    from project.security import encrypt_password
+    from project.services.auth_service import create_user_token
+
+    engine = get_engine()
+    upgrade(engine)
+    with contextlib.redirect_stdout(sys.stderr):
+        seed_synthetic(engine, users=max(size // TASKS_PER_USER, 10), tasks=size, seed=args.seed)
+
+    with Session(engine) as session:
+        admin = User(
+            uuid=uuid4(),
+            username="bench-admin",
+            email="bench-admin@example.com",
+            password_hash=encrypt_password(SYNTHETIC_PASSWORD),
+            role=Role.ADMIN.value,
+        )
+        session.add(admin)
+        session.commit()
+        token = create_user_token(admin).access_token
+        task_uuids = session.scalars(select(Task.uuid).order_by(Task.uuid).limit(SAMPLE_TASKS)).all()
+
+    login_form = {"username": "bench-admin", "password": SYNTHETIC_PASSWORD}
+    headers = {"Authorization": f"Bearer {token}"}
+    created: list[str] = []
+
+    async def create(client: httpx.AsyncClient, i: int) -> httpx.Response:
+        response = await client.post("/tasks", json={"title": f"Benchmark task {i}", "priority": i % 5 + 1})
+        if response.status_code == 201:
+            created.append(response.json()["uuid"])
+        return response
+
+    scenarios: dict[str, tuple[Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]], int]] = {
+        "login": (lambda client, i: client.post("/auth/login", data=login_form), args.login_requests),
+        "list": (lambda client, i: client.get(LIST_QUERIES[i % len(LIST_QUERIES)]), args.requests),
+        "get": (lambda client, i: client.get(f"/tasks/{task_uuids[i % len(task_uuids)]}"), args.requests),
+        "create": (create, args.requests),
+        "patch": (
+            lambda client, i: client.patch(f"/tasks/{task_uuids[i % len(task_uuids)]}", json={"priority": i % 5 + 1}),
+            args.requests,
+        ),
+        # sized at call time: deletes the tasks made by the create scenario
+        "delete": (lambda client, i: client.delete(f"/tasks/{created[i]}"), 0),
+    }
+
+    async def main(client: httpx.AsyncClient) -> dict[str, dict[str, float]]:
+        for i in range(WARMUP_REQUESTS):
+            await client.get(LIST_QUERIES[i % len(LIST_QUERIES)])
+
+        results = {}
+        for name in args.scenarios:
+            call, requests = scenarios[name]
+            if name == "delete":
+                requests = len(created)
+            if not requests:
+                continue
+            results[name] = await measure(lambda i: call(client, i), requests, args.concurrency)
+            print(f"  {size:>9,} {name:<7} {format_stats(results[name])}", file=sys.stderr)
+        return results
+
+    async def run(base_url: str | None) -> dict[str, dict[str, float]]:
+        if base_url:
+            client = httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60)
+        else:
+            from project.main import create_app
+
+            transport = httpx.ASGITransport(app=create_app())
+            client = httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers, timeout=60)
+        async with client:
+            return await main(client)
+
+    if args.server:
+        with uvicorn_server() as base_url:
+            return asyncio.run(run(base_url))
+    return asyncio.run(run(None))
+
+
+def format_stats(stats: dict[str, float]) -> str:
+    return (
+        f"{stats['throughput']:8.1f} req/s  p50 {stats['p50_ms']:7.1f} ms  "
+        f"p95 {stats['p95_ms']:7.1f} ms  p99 {stats['p99_ms']:7.1f} ms  errors {stats['errors']}"
+    )
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Describe every scenario that regressed against the baseline by more than `tolerance`."""
+    regressions = []
+    for name, value in results.get("startup", {}).items():
+        base = baseline.get("startup", {}).get(name)
+        if base is not None and value > base * (1 + tolerance):
+            regressions.append(f"startup / {name.removesuffix('_ms')}: {base:.1f} ms -> {value:.1f} ms")
+    for size, scenarios in results["results"].items():
+        for name, stats in scenarios.items():
+            base = baseline["results"].get(size, {}).get(name)
+            if base is None:
+                continue
+            label = f"{int(size):,} tasks / {name}"
+            if stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+                regressions.append(f"{label}: p95 {base['p95_ms']:.1f} ms -> {stats['p95_ms']:.1f} ms")
+            if stats["throughput"] < base["throughput"] * (1 - tolerance):
+                regressions.append(f"{label}: {base['throughput']:.1f} -> {stats['throughput']:.1f} req/s")
+            if stats["errors"] > base["errors"]:
+                regressions.append(f"{label}: errors {base['errors']} -> {stats['errors']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Tasks seeded per run")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=50, help="Logins measured; each one hashes a password")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--server", action="store_true", help="Run against a uvicorn server instead of ASGI")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--startup-runs", type=int, default=10, help="Fresh interpreters timed for cold start")
+    parser.add_argument("--output", default="api-benchmark.json")
+    parser.add_argument("--baseline", help="Earlier --output file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown (default 0.2)")
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.size:
+        with open(args.result, "w") as f:
+            json.dump(run_size(args.size, args.db, args), f)
+        return
+
+    results: dict[str, Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "mode": "server" if args.server else "asgi",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "startup": {},
+        "results": {},
+    }
+    if args.startup_runs:
+        results["startup"] = measure_startup(args.startup_runs)
+        print(
+            f"  startup: import {results['startup']['import_ms']:.0f} ms  "
+            f"startup {results['startup']['startup_ms']:.1f} ms",
+            file=sys.stderr,
+        )
+    child_args = sys.argv[1:]
+    for size in args.sizes:
+        print(f"Seeding {size:,} tasks...", file=sys.stderr)
+        with tempfile.TemporaryDirectory() as tmp:
+            result_file = os.path.join(tmp, "result.json")
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.api",
+                    *child_args,
+                    "--size",
+                    str(size),
+                    "--db",
+                    os.path.join(tmp, "bench.sqlite"),
+                    "--result",
+                    result_file,
+                ],
+                check=True,
+            )
+            with open(result_file) as f:
+                results["results"][str(size)] = json.load(f)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("mode") != results["mode"]:
+            print(f"Note: baseline was measured in {baseline.get('mode')} mode, this run in {results['mode']} mode")
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
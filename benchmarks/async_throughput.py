@@ -0,0 +1,131 @@
+"""Compare request throughput of the sync and async database paths.
+
+Runs the app in-process behind httpx's ASGI transport against a temporary
+SQLite file and fires concurrent authenticated requests at a mix of task
+endpoints. Each mode runs in its own interpreter so settings and engines
+are fresh.
+
+    python -m benchmarks.async_throughput --requests 2000 --concurrency 200
+
+The async mode needs aiosqlite and greenlet installed.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from uuid import uuid4
+
+MODES = ("sync", "async")
+
+
+def run_mode(mode: str, db_file: str, requests: int, concurrency: int, tasks: int) -> None:
+    """Benchmark one mode in this process; settings are read from the environment."""
+    os.environ["DB_URL"] = f"sqlite:///{db_file}"
+    os.environ["DB_ASYNC"] = "true" if mode == "async" else "false"
+
+    import httpx
+    from sqlalchemy.orm import Session
+
+    from project.db.db import get_engine
+    from project.db.migrate import upgrade
+    from project.db.models.task import Task
+    from project.db.models.user import Role, User
+    from project.main import create_app
+    from project.services.auth_service import create_user_token
+
+    engine = get_engine()
+    upgrade(engine)
+    with Session(engine) as session:
+        user = User(
+            uuid=uuid4(),
+            username=f"bench-{uuid4().hex[:8]}",
+            email=f"{uuid4().hex[:8]}@example.com",
+            password_hash="unused",
+            role=Role.ADMIN.value,
+        )
+        session.add(user)
+        session.flush()
+        task_uuids = [uuid4() for _ in range(tasks)]
+        session.add_all(
+            Task(uuid=task_uuid, title=f"Task {i}", priority=i % 5 + 1, created_by=user.uuid)
+            for i, task_uuid in enumerate(task_uuids)
+        )
+        session.commit()
+        token = create_user_token(user).access_token
+
+    app = create_app()
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = ["/tasks?limit=20", "/tasks?status=todo&limit=20", *(f"/tasks/{u}" for u in task_uuids[:20])]
+
+    async def main() -> tuple[float, list[float], int]:
+        latencies: list[float] = []
+        errors = 0
+        semaphore = asyncio.Semaphore(concurrency)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+
+            async def one(i: int) -> None:
+                nonlocal errors
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get(paths[i % len(paths)])
+                    latencies.append(time.perf_counter() - start)
+                    errors += response.status_code >= 400
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(requests)))
+            return time.perf_counter() - start, latencies, errors
+
+    elapsed, latencies, errors = asyncio.run(main())
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:>5}: {requests / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  errors {errors}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks seeded before the run")
+    parser.add_argument("--mode", choices=MODES, help="Run a single mode in this process")
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        db_file = args.db or os.path.join(tempfile.mkdtemp(), "bench.sqlite")
+        run_mode(args.mode, db_file, args.requests, args.concurrency, args.tasks)
+        return
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {args.tasks} tasks")
+    for mode in MODES:
+        with tempfile.TemporaryDirectory() as tmp:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.async_throughput",
+                    "--mode",
+                    mode,
+                    "--db",
+                    os.path.join(tmp, "bench.sqlite"),
+                    "--requests",
+                    str(args.requests),
+                    "--concurrency",
+                    str(args.concurrency),
+                    "--tasks",
+                    str(args.tasks),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare SQLite read/write throughput with default and tuned engines.
+
+"default" is a plain create_engine (rollback journal, synchronous=FULL, no
+busy timeout); "tuned" is get_engine() with the pool settings and pragmas
+from Settings. Writer threads commit one task per transaction while
+reader threads page through the task list, all against one database file.
+
+    python -m benchmarks.engine_tuning --seconds 5 --writers 4 --readers 8
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from uuid import uuid4
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from project.config import Settings
+from project.db.db import get_engine
+from project.db.migrate import upgrade
+from project.db.models.task import TaskCreate
+from project.db.models.user import Role, User
+from project.services import task_service
+from project.utils.pagination import PaginationParams
+
+
+def default_engine(url: str) -> Engine:
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def tuned_engine(url: str) -> Engine:
+    return get_engine(Settings(DB_URL=url))
+
+
+def run(engine: Engine, seconds: float, writers: int, readers: int, seed_tasks: int) -> Counter:
+    upgrade(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    with factory(expire_on_commit=False) as session:
+        user = User(
+            uuid=uuid4(),
+            username="bench",
+            email="bench@example.com",
+            password_hash="unused",
+            role=Role.USER.value,
+        )
+        session.add(user)
+        session.commit()
+        task_service.create_tasks_bulk(session, [TaskCreate(title=f"Seed {i}") for i in range(seed_tasks)], user)
+
+    counts: Counter = Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def writer() -> None:
+        done = errors = 0
+        with factory() as session:
+            while time.perf_counter() < deadline:
+                try:
+                    task_service.create_task(session, TaskCreate(title="Bench task"), user)
+                    done += 1
+                except OperationalError:
+                    session.rollback()
+                    errors += 1
+        with lock:
+            counts["writes"] += done
+            counts["write_errors"] += errors
+
+    def reader() -> None:
+        done = errors = 0
+        with factory() as session:
+            while time.perf_counter() < deadline:
+                try:
+                    task_service.get_tasks(session, PaginationParams(limit=20, include_total=False))
+                    session.rollback()
+                    done += 1
+                except OperationalError:
+                    session.rollback()
+                    errors += 1
+        with lock:
+            counts["reads"] += done
+            counts["read_errors"] += errors
+
+    threads = [threading.Thread(target=writer) for _ in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    engine.dispose()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seed-tasks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{args.seconds:g}s, {args.writers} writers, {args.readers} readers, {args.seed_tasks} seeded tasks")
+    for name, make_engine in (("default", default_engine), ("tuned", tuned_engine)):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.sqlite')}"
+            counts = run(make_engine(url), args.seconds, args.writers, args.readers, args.seed_tasks)
+
+        print(
+            f"{name:>7}: writes {counts['writes'] / args.seconds:8.1f}/s ({counts['write_errors']} errors)  "
+            f"reads {counts['reads'] / args.seconds:8.1f}/s ({counts['read_errors']} errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
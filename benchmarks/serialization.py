@@ -0,0 +1,98 @@
+"""Cost of turning a page of tasks into JSON, per page size.
+
+Loads pages of ORM tasks from an in-memory SQLite database and times:
+
+    response_model  a model per row, then FastAPI validating and dumping
+                    the returned model again through response_model
+    models          a model per row wrapped in PaginatedResponse, dumped once
+    adapter         encode_json: one TypeAdapter pass from ORM objects to bytes
+    loaded          page_json: the same pass over each row's loaded values,
+                    skipping ORM attribute instrumentation (what list_tasks uses)
+
+next to the query that loads the page.
+
+    python -m benchmarks.serialization --sizes 10 50 100 --iterations 500
+"""
+
+import argparse
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from project.db.models import Base
+from project.db.models.task import Task, TaskResponse
+from project.db.models.user import Role, User
+from project.routers.tasks import page_json
+from project.services import task_service
+from project.utils.pagination import PaginatedData, PaginatedResponse, PaginationParams
+from project.utils.serialization import encode_json
+
+PAGE_ADAPTER = TypeAdapter(PaginatedResponse[TaskResponse])
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def models(page: PaginatedData[Task]) -> PaginatedResponse[TaskResponse]:
+    return PaginatedResponse[TaskResponse](
+        total=page.total,
+        offset=page.offset,
+        limit=page.limit,
+        results=[TaskResponse.model_validate(task) for task in page.results],
+        has_next=page.has_next,
+        next_cursor=page.next_cursor,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(uuid=uuid4(), username="bench", email="bench@example.com", password_hash="x", role=Role.USER.value)
+        session.add(user)
+        session.add_all(
+            Task(
+                uuid=uuid4(),
+                title=f"Task {i}",
+                description="Synthetic task description " * 3,
+                priority=i % 5 + 1,
+                due_date=datetime(2026, 1, 1),
+                created_by=user.uuid,
+                assigned_to=user.uuid if i % 2 else None,
+            )
+            for i in range(max(args.sizes) + 1)
+        )
+        session.commit()
+
+    print(f"{'rows':>5} {'query':>9} {'response_model':>15} {'models':>9} {'adapter':>9} {'loaded':>9}  (us per page)")
+    with Session(engine) as session:
+        for size in args.sizes:
+            pagination = PaginationParams(limit=size, include_total=False)
+            query = per_call_us(lambda: task_service.get_tasks(session, pagination), args.iterations // 5)
+            page = task_service.get_tasks(session, pagination)
+
+            assert page_json(page) == encode_json(PAGE_ADAPTER, page) == models(page).model_dump_json().encode("utf-8")
+            revalidated = per_call_us(
+                lambda: PAGE_ADAPTER.dump_json(PAGE_ADAPTER.validate_python(models(page))), args.iterations
+            )
+            dumped = per_call_us(lambda: models(page).model_dump_json().encode("utf-8"), args.iterations)
+            adapter = per_call_us(lambda: encode_json(PAGE_ADAPTER, page), args.iterations)
+            loaded = per_call_us(lambda: page_json(page), args.iterations)
+            print(f"{size:>5} {query:9.0f} {revalidated:15.0f} {dumped:9.0f} {adapter:9.0f} {loaded:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
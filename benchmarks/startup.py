@@ -0,0 +1,75 @@
+"""Cold start time of the app: importing project.main and running its startup.
+
+Each run is a fresh interpreter against a migrated temporary SQLite file and
+reports the time to import project.main, to run the lifespan startup (the
+schema check) and to answer a first request.
+
+    python -m benchmarks.startup --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD_CODE = """
+import asyncio, json, time
+
+start = time.perf_counter()
+import project.main
+imported = time.perf_counter()
+
+import httpx
+
+async def main():
+    app = project.main.create_app()
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            (await client.get("/health")).raise_for_status()
+        first_request = time.perf_counter()
+    return started, first_request
+
+started, first_request = asyncio.run(main())
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (started - imported) * 1000,
+    "first_request_ms": (first_request - started) * 1000,
+}))
+"""
+
+
+def measure_startup(runs: int) -> dict[str, float]:
+    """Median timings over `runs` fresh interpreters, in milliseconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "DB_URL": f"sqlite:///{os.path.join(tmp, 'startup.sqlite')}"}
+        subprocess.run([sys.executable, "-m", "project.db.migrate"], env=env, check=True, capture_output=True)
+
+        samples = [
+            json.loads(
+                subprocess.run([sys.executable, "-c", CHILD_CODE], env=env, check=True, capture_output=True).stdout
+            )
+            for _ in range(runs)
+        ]
+
+    return {key: round(statistics.median(sample[key] for sample in samples), 1) for key in samples[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    timings = measure_startup(args.runs)
+    print(
+        f"median of {args.runs}: import {timings['import_ms']:.0f} ms  startup {timings['startup_ms']:.1f} ms  "
+        f"first request {timings['first_request_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
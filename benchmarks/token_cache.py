@@ -0,0 +1,61 @@
+"""Microbenchmark of the auth dependency with and without the token cache.
+
+Times decode_credentials (JWT verification) and the full claims-mode
+get_principal dependency with a warm principal cache, so no query runs.
+
+    python -m benchmarks.token_cache --iterations 20000
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import project.dependencies as dependencies
+import project.security as security
+from project.config import get_settings
+from project.db.models.user import Role
+from project.security import Principal, TokenPayload, create_access_token
+from project.services.auth_service import get_principal_cache
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    principal = Principal(uuid=uuid4(), username="bench", role=Role.USER.value)
+    token = create_access_token(
+        TokenPayload(username=principal.username, role=principal.role, user_uuid=str(principal.uuid))
+    ).access_token
+    get_principal_cache().set(principal.username, principal)
+    session = Mock()
+
+    async def principal_loop() -> None:
+        for _ in range(args.iterations):
+            await dependencies.get_principal(token, session)
+
+    for enabled in (False, True):
+        settings = get_settings().model_copy(update={"TOKEN_CACHE_ENABLED": enabled})
+        security.get_token_cache.cache_clear()
+
+        with patch.object(security, "get_settings", new=lambda: settings):
+            decode = per_call_us(lambda: dependencies.decode_credentials(token), args.iterations)
+            start = time.perf_counter()
+            asyncio.run(principal_loop())
+            full = (time.perf_counter() - start) / args.iterations * 1e6
+
+        label = "cached" if enabled else "uncached"
+        print(f"{label:>8}: decode_credentials {decode:6.1f} us/call  get_principal {full:6.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,81 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # "test" is a fast salted SHA-256 for test fixtures only; logins rehash
+    # bcrypt passwords whose cost differs from PASSWORD_HASH_ROUNDS
+    PASSWORD_HASH_SCHEME: Literal["bcrypt", "test"] = "bcrypt"
+    PASSWORD_HASH_ROUNDS: int = 12
+
+    # bcrypt runs on its own pool; logins beyond workers + queue get 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_HASH_PROCESSES: bool = False
+
+    # verified tokens are cached until they expire
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+
+    # "claims" trusts the identity and role in the token and only re-checks the
+    # user row once per AUTH_USER_CACHE_TTL_SECONDS, so deleted users and role
+    # changes take up to that long to apply; "database" loads the user per request
+    AUTH_MODE: Literal["database", "claims"] = "database"
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10_000
+
+    # log per-request time, SQL statement count/time and auth, endpoint and
+    # serialization spans; the header exposes the same breakdown to clients
+    REQUEST_TIMING_ENABLED: bool = True
+    REQUEST_TIMING_HEADER: bool = False
+
+    # Prometheus /metrics; with several workers, point METRICS_MULTIPROC_DIR at
+    # a directory emptied on startup so every worker's numbers are merged; each
+    # worker writes its numbers there every METRICS_FLUSH_SECONDS
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: str | None = None
+    METRICS_FLUSH_SECONDS: float = 1.0
+
     # database
     DB_TYPE: Literal["sqlite", "postgres"] = "sqlite"
     DB_URL: str = "sqlite:///./app.db"
     SQLALCHEMY_ECHO: bool = False
 
+    # on startup the app only checks that `python -m project.db.migrate` ran for the
+    # current models: "error" refuses to start otherwise, "migrate" runs it instead
+    DB_SCHEMA_CHECK: Literal["error", "migrate", "off"] = "error"
+
+    # read-only replicas for GET /tasks and GET /tasks/{uuid}, as a JSON list;
+    # a client's reads stay on the primary for DB_READ_YOUR_WRITES_SECONDS after
+    # it writes (tracked with a cookie, so clients must keep cookies)
+    DB_REPLICA_URLS: list[str] = []
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # connection pool (ignored for in-memory SQLite, which keeps one connection)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = False
+
+    # pragmas applied to every new SQLite connection
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64_000  # negative values are KiB
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+
+    # serve requests through an async engine (needs aiosqlite or asyncpg);
+    # DB_ASYNC_URL defaults to DB_URL with the matching async driver
+    DB_ASYNC: bool = False
+    DB_ASYNC_URL: str | None = None
+
+    # task list response cache, "memory" or a "package.module:ClassName" backend
+    # (the in-process cache is only invalidated by writes in the same process)
+    TASK_CACHE_ENABLED: bool = False
+    TASK_CACHE_BACKEND: str = "memory"
+    TASK_CACHE_TTL_SECONDS: float = 30.0
+    TASK_CACHE_MAX_ENTRIES: int = 1024
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -31,6 +101,13 @@ class Settings(BaseSettings):
             raise ValueError("DB_URL cannot be empty")
         return v
 
+    @field_validator("PASSWORD_HASH_ROUNDS")
+    @classmethod
+    def validate_hash_rounds(cls, v: int) -> int:
+        if not 4 <= v <= 31:
+            raise ValueError("PASSWORD_HASH_ROUNDS must be between 4 and 31")
+        return v
+
     @field_validator("ACCESS_TOKEN_EXPIRE_MINUTES", mode="before")
     @classmethod
     def validate_token_expiry(cls, v: int) -> int:
@@ -0,0 +1,71 @@
+"""Revisions and tombstones behind GET /tasks/changes.
+
+Every task write takes the next number from the single ``task_revision``
+row and stamps it on the tasks it changes, or on the tombstones of the
+tasks it deletes. Taking the number updates that row, which stays locked
+until the transaction ends, so task writes commit in revision order: a
+reader that sees revision N has seen every revision before it, and a client
+that synced up to N only needs what comes after. The task service takes
+the revision before updating the stats counters and writing tasks, so every
+writer locks them in the same order, and a bulk write that counts the tasks
+it is about to change sees every earlier task write committed.
+
+Rows inserted without a revision (synthetic seeds, raw SQL) get 1, which
+clients only pick up on a full sync from revision 0.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Connection, Select, func, insert, literal, select, tuple_, update
+
+from project.db.models.task import Task, TaskRevision, TaskTombstone
+
+task_revision = TaskRevision.__table__
+task_tombstone = TaskTombstone.__table__
+
+REVISION_ROW = 1
+
+
+def current_revision(connection: Connection) -> int:
+    """Highest revision stamped on a task or tombstone, 0 for an empty database."""
+    return max(
+        connection.execute(select(func.coalesce(func.max(Task.revision), 0))).scalar_one(),
+        connection.execute(select(func.coalesce(func.max(task_tombstone.c.revision), 0))).scalar_one(),
+    )
+
+
+def init_revision(connection: Connection) -> None:
+    """Create the revision row, continuing after existing tasks and tombstones."""
+    connection.execute(insert(task_revision).values(id=REVISION_ROW, revision=current_revision(connection)))
+
+
+def next_revision(connection: Connection) -> int:
+    """Take the next revision in the connection's transaction, locking the revision row until it ends."""
+    result = connection.execute(
+        update(task_revision).where(task_revision.c.id == REVISION_ROW).values(revision=task_revision.c.revision + 1)
+    )
+    if result.rowcount == 0:
+        # tables made by create_all rather than the migration
+        init_revision(connection)
+        return next_revision(connection)
+    return connection.execute(select(task_revision.c.revision)).scalar_one()
+
+
+def add_tombstones(connection: Connection, uuids: Select, revision: int) -> None:
+    """Record the tasks selected by `uuids` (a one-column select) as deleted at `revision`."""
+    query = select(
+        uuids.subquery().c[0],
+        literal(revision, task_tombstone.c.revision.type),
+        literal(datetime.now(), task_tombstone.c.deleted_at.type),
+    )
+    connection.execute(insert(task_tombstone).from_select(["uuid", "revision", "deleted_at"], query))
+
+
+def changed_after(
+    revision: ColumnElement[int], uuid: ColumnElement[UUID], since: int, after: UUID | None
+) -> ColumnElement[bool]:
+    """Criteria for rows past revision `since`, or past (since, after) when resuming inside a revision."""
+    if after is None:
+        return revision > since
+    return tuple_(revision, uuid) > tuple_(since, after)
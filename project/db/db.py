@@ -1,10 +1,74 @@
-from collections.abc import Generator
+import itertools
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import Any, Concatenate, ParamSpec, TypeVar
 
-from sqlalchemy import Engine, create_engine
+from anyio import from_thread
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
 
 from project.config import Settings, get_settings
 
+P = ParamSpec("P")
+T = TypeVar("T")
+F = TypeVar("F")
+
+# async drivers used when DB_ASYNC is enabled and DB_URL names a sync driver
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def is_memory_sqlite(url: str) -> bool:
+    """True for in-memory SQLite URLs, which use a single-connection pool."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def engine_options(settings: Settings, url: str) -> dict[str, Any]:
+    """Pool keyword arguments for create_engine / create_async_engine."""
+    if is_memory_sqlite(url):
+        return {}
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    """PRAGMA statements run on every new SQLite connection."""
+    return [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE:d}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE:d}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS:d}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+    ]
+
+
+def apply_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    """Register a connect hook that applies the SQLite pragmas from settings."""
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 
 def get_engine(settings: Settings | None = None) -> Engine:
     """Create SQLAlchemy engine based on settings."""
@@ -15,18 +79,220 @@ def get_engine(settings: Settings | None = None) -> Engine:
     if settings.DB_TYPE == "sqlite":
         connect_args["check_same_thread"] = False
 
-    return create_engine(
+    engine = create_engine(
         settings.DB_URL,
         echo=settings.SQLALCHEMY_ECHO,
         connect_args=connect_args,
+        **engine_options(settings, settings.DB_URL),
+    )
+
+    if settings.DB_TYPE == "sqlite":
+        apply_sqlite_pragmas(engine, settings)
+
+    return engine
+
+
+def get_async_url(settings: Settings) -> str:
+    """Return the async driver URL for the configured database."""
+    if settings.DB_ASYNC_URL:
+        return settings.DB_ASYNC_URL
+
+    url = make_url(settings.DB_URL)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)).render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_engine(settings: Settings | None = None) -> AsyncEngine:
+    """Create an async SQLAlchemy engine (aiosqlite / asyncpg) based on settings."""
+    if settings is None:
+        settings = get_settings()
+
+    url = get_async_url(settings)
+    engine = create_async_engine(
+        url,
+        echo=settings.SQLALCHEMY_ECHO,
+        **engine_options(settings, url),
     )
 
+    if settings.DB_TYPE == "sqlite":
+        apply_sqlite_pragmas(engine.sync_engine, settings)
+
+    return engine
+
+
+def replica_settings(settings: Settings) -> list[Settings]:
+    """Settings for each read replica, identical to the primary except for the URL."""
+    return [settings.model_copy(update={"DB_URL": url, "DB_ASYNC_URL": None}) for url in settings.DB_REPLICA_URLS]
+
+
+_replica_counter = itertools.count()
+
+# Session.info key set on sessions bound to a read replica
+REPLICA_SESSION = "replica"
+
 
-engine = get_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def pick_replica(factories: list[F]) -> F | None:
+    """Round-robin over replica session factories, None when there are none."""
+    if not factories:
+        return None
+    return factories[next(_replica_counter) % len(factories)]
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Dependency that provides a database session."""
-    with SessionLocal() as session:
+def is_replica_session(session: Session | AsyncSession) -> bool:
+    """True for sessions bound to a read replica, whose reads may lag behind the primary."""
+    return session.info.get(REPLICA_SESSION, False)
+
+
+class Database:
+    """Engines and session factories for one app, built from its settings.
+
+    create_app keeps one on ``app.state.db``, so apps with different settings
+    never share connections and shutting one down leaves the others' alone.
+    Every engine is created on first use, so creating an app never touches
+    the database and the async driver stays optional.
+    """
+
+    ENGINE_ATTRIBUTES = (
+        "primary_engine",
+        "session_factory",
+        "async_session_factory",
+        "replica_session_factories",
+        "async_replica_session_factories",
+    )
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+    @cached_property
+    def primary_engine(self) -> Engine:
+        """Engine for DB_URL."""
+        return get_engine(self.settings)
+
+    @cached_property
+    def session_factory(self) -> sessionmaker[Session]:
+        """Sync session factory bound to the primary engine."""
+        return sessionmaker(autocommit=False, autoflush=False, bind=self.primary_engine)
+
+    @cached_property
+    def async_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Async session factory bound to the async engine for DB_URL."""
+        return async_sessionmaker(get_async_engine(self.settings), autoflush=False, expire_on_commit=False)
+
+    @cached_property
+    def replica_session_factories(self) -> list[sessionmaker[Session]]:
+        """Session factories for the configured read replicas, if any."""
+        return [
+            sessionmaker(autocommit=False, autoflush=False, bind=get_engine(settings))
+            for settings in replica_settings(self.settings)
+        ]
+
+    @cached_property
+    def async_replica_session_factories(self) -> list[async_sessionmaker[AsyncSession]]:
+        """Async session factories for the configured read replicas, if any."""
+        return [
+            async_sessionmaker(get_async_engine(settings), autoflush=False, expire_on_commit=False)
+            for settings in replica_settings(self.settings)
+        ]
+
+    def _created(self, name: str) -> Any:
+        return self.__dict__.get(name)
+
+    def active_engines(self) -> dict[str, Engine]:
+        """Engines created so far, by role, for pool metrics; async engines as their sync side."""
+        engines = {}
+        if self._created("primary_engine") is not None:
+            engines["primary"] = self.primary_engine
+        if self._created("async_session_factory") is not None:
+            engines["primary_async"] = self.async_session_factory.kw["bind"].sync_engine
+        for i, factory in enumerate(self._created("replica_session_factories") or []):
+            engines[f"replica{i}"] = factory.kw["bind"]
+        for i, factory in enumerate(self._created("async_replica_session_factories") or []):
+            engines[f"replica{i}_async"] = factory.kw["bind"].sync_engine
+        return engines
+
+    async def dispose(self) -> None:
+        """Close every pooled connection and forget the engines, so the next use creates them afresh.
+
+        Called when the app shuts down; engines belong to one app lifetime.
+        """
+        for name in ("async_replica_session_factories", "replica_session_factories"):
+            for factory in self._created(name) or []:
+                await dispose(factory.kw["bind"])
+        if self._created("async_session_factory") is not None:
+            await dispose(self.async_session_factory.kw["bind"])
+        if self._created("primary_engine") is not None:
+            await dispose(self.primary_engine)
+
+        for name in self.ENGINE_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+
+    @asynccontextmanager
+    async def open_session(self, read_only: bool = False) -> AsyncIterator[Session | AsyncSession]:
+        """Open an async or sync session, per the DB_ASYNC setting.
+
+        With ``read_only`` the session is bound to a read replica when any are
+        configured, and to the primary otherwise.
+        """
+        if self.settings.DB_ASYNC:
+            replica = pick_replica(self.async_replica_session_factories) if read_only else None
+            async with (replica or self.async_session_factory)(info={REPLICA_SESSION: replica is not None}) as session:
+                yield session
+            return
+
+        replica = pick_replica(self.replica_session_factories) if read_only else None
+        session = (replica or self.session_factory)(info={REPLICA_SESSION: replica is not None})
+        try:
+            yield session
+        finally:
+            # closing rolls back any open transaction, which is network I/O
+            await run_in_threadpool(session.close)
+
+
+async def dispose(engine: Engine | AsyncEngine) -> None:
+    if isinstance(engine, AsyncEngine):
+        await engine.dispose()
+    else:
+        await run_in_threadpool(engine.dispose)
+
+
+def get_database(request: Request) -> Database:
+    """The engines of the app handling `request`."""
+    return request.app.state.db
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[Session | AsyncSession, None]:
+    """Dependency that provides a primary session, async or sync per DB_ASYNC."""
+    async with get_database(request).open_session() as session:
         yield session
+
+
+async def run_in_session(
+    session: Session | AsyncSession,
+    fn: Callable[Concatenate[Session, P], T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """Run a sync service function without blocking the event loop.
+
+    On an AsyncSession the function runs through ``run_sync`` and its queries
+    go through the async driver; a sync Session is used from the threadpool.
+    """
+    if isinstance(session, AsyncSession):
+        return await session.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, session, *args, **kwargs)
+
+
+def iterate_from_thread(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """Consume an async iterator from a worker thread.
+
+    Lets sync generators, such as a StreamingResponse body that Starlette
+    drives from the threadpool, read rows from an async streaming result.
+    """
+    done = object()
+
+    async def step() -> Any:
+        return await anext(iterator, done)
+
+    while (item := from_thread.run(step)) is not done:
+        yield item
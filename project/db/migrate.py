@@ -0,0 +1,127 @@
+"""Bring an existing database in line with the models without rebuilding it.
+
+    python -m project.db.migrate
+
+The app does not change the schema itself: on startup it only compares
+the fingerprint recorded by the last migration with the current models.
+"""
+
+import hashlib
+
+from sqlalchemy import Column, Engine, MetaData, String, Table, delete, insert, inspect, select, text
+from sqlalchemy.schema import CreateColumn
+
+from project.db.changes import init_revision
+from project.db.models import Base, TaskRevision, TaskStat
+from project.db.search import create_search_index
+from project.db.stats import rebuild_task_stats
+
+# kept out of Base.metadata so it is not part of the fingerprint it records
+schema_version = Table("schema_version", MetaData(), Column("fingerprint", String(32), nullable=False))
+
+
+def schema_fingerprint() -> str:
+    """Digest of the tables, columns and indexes declared on the models."""
+    digest = hashlib.blake2b(digest_size=16)
+    for table in Base.metadata.sorted_tables:
+        digest.update(f"table {table.name}\n".encode("utf-8"))
+        for column in table.columns:
+            digest.update(f"column {column.name} {column.type!r} {column.nullable}\n".encode("utf-8"))
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            digest.update(f"index {index.name}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def schema_is_current(engine: Engine) -> bool:
+    """True when the last migration ran against the current models; one or two cheap queries."""
+    with engine.connect() as connection:
+        if not inspect(connection).has_table(schema_version.name):
+            return False
+        recorded = connection.execute(select(schema_version.c.fingerprint)).scalar_one_or_none()
+    return recorded == schema_fingerprint()
+
+
+def stamp_schema(engine: Engine) -> None:
+    """Record the current models' fingerprint as migrated."""
+    schema_version.create(bind=engine, checkfirst=True)
+    with engine.begin() as connection:
+        connection.execute(delete(schema_version))
+        connection.execute(insert(schema_version).values(fingerprint=schema_fingerprint()))
+
+
+def add_missing_columns(engine: Engine) -> list[str]:
+    """Add columns declared on the models that existing tables lack.
+
+    New columns must be nullable or carry a server default so existing rows
+    get a value.
+    """
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    added = []
+
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+
+            column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+            with engine.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"))
+            added.append(f"{table.name}.{column.name}")
+
+    return added
+
+
+def create_missing_indexes(engine: Engine) -> list[str]:
+    """Create indexes declared on the models that the database lacks."""
+    inspector = inspect(engine)
+    created = []
+
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                index.create(bind=engine)
+                created.append(index.name)
+
+    return created
+
+
+def upgrade(engine: Engine) -> list[str]:
+    """Create missing tables, columns and indexes, leaving existing data untouched.
+
+    A newly created task_stat table is filled from the existing tasks, and
+    a newly created task_revision table continues after their revisions.
+    """
+    inspector = inspect(engine)
+    had_task_stats = inspector.has_table(TaskStat.__tablename__)
+    had_task_revision = inspector.has_table(TaskRevision.__tablename__)
+    Base.metadata.create_all(bind=engine)
+    created = add_missing_columns(engine)
+    created.extend(create_missing_indexes(engine))
+
+    with engine.begin() as connection:
+        if create_search_index(connection):
+            created.append("task search index")
+        if not had_task_stats:
+            rebuild_task_stats(connection)
+            created.append("task counters")
+        if not had_task_revision:
+            init_revision(connection)
+
+    stamp_schema(engine)
+    return created
+
+
+if __name__ == "__main__":
+    from project.db.db import get_engine
+
+    created = upgrade(get_engine())
+    print(f"Created {len(created)} schema objects: {', '.join(created) or '-'}")
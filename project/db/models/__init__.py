@@ -1,5 +1,19 @@
 from project.db.models.base import Base
-from project.db.models.task import Task, TaskCreate, TaskResponse, TaskStatus, TaskUpdate
+from project.db.models.task import (
+    BulkCreateResponse,
+    BulkItemError,
+    BulkMutationResponse,
+    Task,
+    TaskChangesResponse,
+    TaskCreate,
+    TaskResponse,
+    TaskRevision,
+    TaskStat,
+    TaskStatsResponse,
+    TaskStatus,
+    TaskTombstone,
+    TaskUpdate,
+)
 from project.db.models.user import Role, User, UserCreate, UserResponse
 
 __all__ = [
@@ -13,4 +27,15 @@ __all__ = [
     "TaskUpdate",
     "TaskResponse",
     "TaskStatus",
+    "TaskStat",
+    "TaskStatsResponse",
+    "TaskRevision",
+    "TaskTombstone",
+    "TaskChangesResponse",
+    "BulkItemError",
+    "BulkCreateResponse",
+    "BulkMutationResponse",
 ]
+
+# registers the full-text index DDL that runs when the task table is created
+import project.db.search  # noqa: E402, F401
@@ -1,11 +1,13 @@
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Uuid
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from project.db.models.base import Base
 from project.db.models.base import BaseModel as BaseDBModel
 
 
@@ -17,12 +19,32 @@ class TaskStatus(str, Enum):
 
 class Task(BaseDBModel):
     __tablename__ = "task"
+    __table_args__ = (
+        # list queries filter on status / assigned_to and page by (created_at, uuid)
+        Index("ix_task_created_at_uuid", "created_at", "uuid"),
+        Index("ix_task_status_created_at_uuid", "status", "created_at", "uuid"),
+        Index("ix_task_assigned_to_created_at_uuid", "assigned_to", "created_at", "uuid"),
+        Index("ix_task_created_by", "created_by"),
+        # delta sync pages by (revision, uuid)
+        Index("ix_task_revision_uuid", "revision", "uuid"),
+        # open tasks by deadline; done tasks are the bulk of the table and never overdue
+        Index(
+            "ix_task_open_due_date",
+            "due_date",
+            sqlite_where=text("status != 'done'"),
+            postgresql_where=text("status != 'done'"),
+        ),
+    )
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(20), default=TaskStatus.TODO.value, nullable=False)
     priority: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
     due_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # bumped on every update, used for optimistic locking and ETags
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1", nullable=False)
+    # global write counter at the task's last change, see project.db.changes
+    revision: Mapped[int] = mapped_column(BigInteger, server_default="1", nullable=False)
 
     # foreign keys
     created_by: Mapped[UUID] = mapped_column(Uuid(), ForeignKey("user.uuid"), nullable=False)
@@ -40,6 +62,38 @@ class Task(BaseDBModel):
         foreign_keys=[assigned_to],
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
+
+class TaskRevision(Base):
+    """Single row holding the last revision handed out to a task write."""
+
+    __tablename__ = "task_revision"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    revision: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class TaskTombstone(Base):
+    """Marks a deleted task, so delta sync can tell clients to drop it."""
+
+    __tablename__ = "task_tombstone"
+    __table_args__ = (Index("ix_task_tombstone_revision_uuid", "revision", "uuid"),)
+
+    uuid: Mapped[UUID] = mapped_column(Uuid(), primary_key=True)
+    revision: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(), default=datetime.now, nullable=False)
+
+
+class TaskStat(Base):
+    """How many tasks have one value of one dimension, maintained by project.db.stats."""
+
+    __tablename__ = "task_stat"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    key: Mapped[str] = mapped_column(String(36), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
 
 class TaskCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
@@ -78,3 +132,49 @@ class TaskResponse(BaseModel):
     created_at: datetime
     created_by: UUID
     assigned_to: UUID | None
+
+
+@lru_cache(maxsize=128)
+def sparse_task_response(fields: tuple[str, ...]) -> type[BaseModel]:
+    """TaskResponse trimmed to `fields`, which must be TaskResponse field names."""
+    return create_model(
+        "SparseTaskResponse",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (TaskResponse.model_fields[name].annotation, ...) for name in fields},
+    )
+
+
+class TaskStatsResponse(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    by_priority: dict[int, int]
+    # assigned tasks per user, users without tasks are left out
+    by_assignee: dict[UUID, int]
+    unassigned: int
+    # open tasks whose due date has passed
+    overdue: int
+
+
+class TaskChangesResponse(BaseModel):
+    changed: list[TaskResponse]
+    deleted: list[UUID]
+    # pass back as `since` once has_more is false
+    revision: int
+    has_more: bool
+    next_cursor: str | None
+
+
+class BulkItemError(BaseModel):
+    index: int
+    detail: str
+
+
+class BulkCreateResponse(BaseModel):
+    created: int
+    uuids: list[UUID]
+    errors: list[BulkItemError]
+
+
+class BulkMutationResponse(BaseModel):
+    affected: int
+    dry_run: bool
@@ -0,0 +1,76 @@
+"""Read-your-writes tracking for read replica routing."""
+
+import math
+import time
+from collections.abc import Mapping
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LAST_WRITE_COOKIE = "last_write"
+
+# set on the request scope's state by write endpoints, see track_writes
+WROTE_STATE = "wrote"
+
+
+class ReadYourWrites:
+    """Keeps a client's reads off the replicas for ``window`` seconds after it writes.
+
+    The time of the client's last write travels with the client in a cookie,
+    so every worker and every instance routes its next read the same way.
+    ``window`` should cover the replicas' replication lag. Clients that do not
+    keep cookies read from the replicas straight away, and a client sending a
+    forged time can only send its own reads to the primary.
+    """
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+
+    def cookie(self, now: float | None = None) -> str:
+        """Set-Cookie value recording a write at `now` (wall clock seconds), expiring with the window."""
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[LAST_WRITE_COOKIE] = f"{time.time() if now is None else now:.3f}"
+        cookie[LAST_WRITE_COOKIE]["max-age"] = math.ceil(self.window)
+        cookie[LAST_WRITE_COOKIE]["path"] = "/"
+        cookie[LAST_WRITE_COOKIE]["httponly"] = True
+        cookie[LAST_WRITE_COOKIE]["samesite"] = "lax"
+        return cookie[LAST_WRITE_COOKIE].OutputString()
+
+    def recently_wrote(self, cookies: Mapping[str, str], now: float | None = None) -> bool:
+        """True while the write recorded in the client's cookies is inside the window."""
+        if self.window <= 0:
+            return False
+        try:
+            written = float(cookies[LAST_WRITE_COOKIE])
+        except (KeyError, ValueError):
+            return False
+        return (time.time() if now is None else now) - written < self.window
+
+
+class ReadYourWritesMiddleware:
+    """Send the last write cookie with successful responses of write endpoints.
+
+    Set when the response starts, so the recorded time is after the write
+    committed.
+    """
+
+    def __init__(self, app: ASGIApp, read_your_writes: ReadYourWrites) -> None:
+        self.app = app
+        self.read_your_writes = read_your_writes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.read_your_writes.window <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and scope.get("state", {}).get(WROTE_STATE)
+            ):
+                MutableHeaders(scope=message).append("Set-Cookie", self.read_your_writes.cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
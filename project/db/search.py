@@ -0,0 +1,140 @@
+"""Full-text search index over task title and description.
+
+SQLite uses an FTS5 table kept in sync by triggers, so every write to
+``task`` (single or bulk) updates the index in the same transaction.
+PostgreSQL uses a GIN expression index on the task's tsvector, which the
+database maintains itself.
+"""
+
+import re
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    MetaData,
+    Subquery,
+    Table,
+    Text,
+    Uuid,
+    event,
+    func,
+    inspect,
+    literal_column,
+    select,
+    text,
+)
+
+from project.db.models.task import Task
+
+SEARCH_CONFIG = "english"
+
+# weights for bm25(): uuid is only stored for lookups, title outranks description
+SQLITE_RANK_WEIGHTS = (0.0, 10.0, 1.0)
+
+task_fts = Table(
+    "task_fts",
+    MetaData(),
+    Column("uuid", Uuid()),
+    Column("title", Text),
+    Column("description", Text),
+)
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE task_fts USING fts5(uuid, title, description)",
+    """CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN
+        INSERT INTO task_fts (uuid, title, description) VALUES (new.uuid, new.title, new.description);
+    END""",
+    """CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN
+        DELETE FROM task_fts WHERE task_fts MATCH 'uuid:"' || old.uuid || '"';
+    END""",
+    """CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description ON task BEGIN
+        UPDATE task_fts SET title = new.title, description = new.description
+        WHERE task_fts MATCH 'uuid:"' || old.uuid || '"';
+    END""",
+    "INSERT INTO task_fts (uuid, title, description) SELECT uuid, title, description FROM task",
+]
+
+# the query expression must match the indexed expression for the planner to use it
+POSTGRES_DOCUMENT = "to_tsvector('{config}', coalesce({prefix}title, '') || ' ' || coalesce({prefix}description, ''))"
+
+POSTGRES_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_task_search ON task USING gin ("
+    + POSTGRES_DOCUMENT.format(config=SEARCH_CONFIG, prefix="")
+    + ")",
+]
+
+
+def create_search_index(connection: Connection) -> bool:
+    """Create and backfill the search index if it is missing, returns True if created."""
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        if inspect(connection).has_table(task_fts.name):
+            return False
+        statements = SQLITE_DDL
+    elif dialect == "postgresql":
+        if "ix_task_search" in {index["name"] for index in inspect(connection).get_indexes(Task.__tablename__)}:
+            return False
+        statements = POSTGRES_DDL
+    else:
+        return False
+
+    for statement in statements:
+        connection.execute(text(statement))
+    return True
+
+
+def drop_search_index(connection: Connection) -> None:
+    """Drop the search index, e.g. before a bulk load; create_search_index rebuilds it."""
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        for trigger in ("task_fts_insert", "task_fts_delete", "task_fts_update"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {task_fts.name}"))
+    elif dialect == "postgresql":
+        connection.execute(text("DROP INDEX IF EXISTS ix_task_search"))
+
+
+@event.listens_for(Task.__table__, "after_create")
+def _create_search_index_with_table(target: Table, connection: Connection, **kw) -> None:
+    create_search_index(connection)
+
+
+def to_fts5_query(search: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix."""
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return "{title description}: (" + " ".join(terms) + ")"
+
+
+def search_subquery(dialect: str, search: str) -> Subquery | None:
+    """Return (uuid, rank) for tasks matching `search`, lower rank is better.
+
+    Returns None when the search text contains no searchable words.
+    """
+    if dialect == "postgresql":
+        if not re.search(r"\w", search):
+            return None
+        document = literal_column(POSTGRES_DOCUMENT.format(config=SEARCH_CONFIG, prefix="task."))
+        query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), search)
+        return (
+            select(Task.uuid.label("uuid"), (-func.ts_rank(document, query)).label("rank"))
+            .where(document.op("@@")(query))
+            .subquery("task_search")
+        )
+
+    match = to_fts5_query(search)
+    if match is None:
+        return None
+
+    fts = literal_column(task_fts.name)
+    return (
+        select(task_fts.c.uuid, func.bm25(fts, *SQLITE_RANK_WEIGHTS).label("rank"))
+        .where(fts.op("MATCH")(match))
+        .subquery("task_search")
+    )
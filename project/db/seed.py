@@ -1,11 +1,24 @@
-"""Database seeder for development and testing."""
+"""Database seeder for development and testing.
 
-from datetime import datetime, timedelta
+    python -m project.db.seed                                   # demo data
+    python -m project.db.seed --users 10000 --tasks 5000000     # synthetic load
+"""
 
+import argparse
+import itertools
+import random
+import time
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import Engine, Table, insert
 from sqlalchemy.orm import Session
 
 from project.db.models.task import Task, TaskStatus
 from project.db.models.user import Role, User
+from project.db.search import create_search_index, drop_search_index
+from project.db.stats import rebuild_task_stats
 from project.security import encrypt_password
 
 
@@ -149,6 +162,8 @@ def seed_database(session: Session) -> None:
     tasks = seed_tasks(session, users)
     print(f"  Created {len(tasks)} tasks")
 
+    session.flush()
+    rebuild_task_stats(session.connection())
     session.commit()
     print("Database seeded successfully!")
 
@@ -157,18 +172,175 @@ def clear_database(session: Session) -> None:
     """Clear all data from the database."""
     session.query(Task).delete()
     session.query(User).delete()
+    rebuild_task_stats(session.connection())
     session.commit()
     print("Database cleared.")
 
 
-if __name__ == "__main__":
-    from project.db.db import SessionLocal
-    from project.db.models.base import Base
-    from project.db.db import engine
+# synthetic data distributions, loosely modelled on a team task tracker
+STATUS_WEIGHTS = {TaskStatus.DONE.value: 60, TaskStatus.IN_PROGRESS.value: 15, TaskStatus.TODO.value: 25}
+PRIORITY_WEIGHTS = {1: 10, 2: 20, 3: 40, 4: 20, 5: 10}
+UNASSIGNED_RATIO = 0.2
+DUE_DATE_RATIO = 0.4
+DESCRIPTION_RATIO = 0.7
+HISTORY_DAYS = 730
+SYNTHETIC_PASSWORD = "password123"
+
+TITLE_VERBS = ["Fix", "Implement", "Review", "Refactor", "Document", "Test", "Deploy", "Investigate", "Update"]
+TITLE_NOUNS = ["login flow", "task export", "search index", "billing report", "API client", "CI pipeline",
+               "dashboard", "email templates", "cache layer", "database migration", "audit log", "onboarding"]
+
+
+def random_uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_users(rng: random.Random, count: int, password_hash: str, now: datetime) -> Iterator[dict]:
+    """Synthetic user rows; about 1% are admins."""
+    for i in range(count):
+        yield {
+            "uuid": random_uuid(rng),
+            "username": f"user{i:07d}",
+            "email": f"user{i:07d}@example.com",
+            "password_hash": password_hash,
+            "role": Role.ADMIN.value if rng.random() < 0.01 else Role.USER.value,
+            "created_at": now - timedelta(days=HISTORY_DAYS, seconds=rng.randrange(86400)),
+        }
+
+
+def generate_tasks(rng: random.Random, count: int, user_uuids: list[UUID], now: datetime) -> Iterator[dict]:
+    """Synthetic task rows.
+
+    Creation times are spread over the last two years, most tasks are done,
+    and work is skewed towards a few busy users (Zipf-like weights) with a
+    share left unassigned. Some tasks get a due date after their creation.
+    """
+    statuses, status_weights = list(STATUS_WEIGHTS), list(itertools.accumulate(STATUS_WEIGHTS.values()))
+    priorities, priority_weights = list(PRIORITY_WEIGHTS), list(itertools.accumulate(PRIORITY_WEIGHTS.values()))
+    user_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(user_uuids) + 1)))
+
+    for _ in range(count):
+        created_at = now - timedelta(seconds=rng.randrange(HISTORY_DAYS * 86400))
+        status = rng.choices(statuses, cum_weights=status_weights)[0]
+        assignee = None
+        if rng.random() >= UNASSIGNED_RATIO:
+            assignee = rng.choices(user_uuids, cum_weights=user_weights)[0]
+        due_date = None
+        if rng.random() < DUE_DATE_RATIO:
+            due_date = created_at + timedelta(days=rng.randint(1, 60))
+
+        yield {
+            "uuid": random_uuid(rng),
+            "title": f"{rng.choice(TITLE_VERBS)} {rng.choice(TITLE_NOUNS)}",
+            "description": f"Synthetic task {rng.getrandbits(32):08x}" if rng.random() < DESCRIPTION_RATIO else None,
+            "status": status,
+            "priority": rng.choices(priorities, cum_weights=priority_weights)[0],
+            "due_date": due_date,
+            "version": 1,
+            "created_by": rng.choice(user_uuids),
+            "assigned_to": assignee,
+            "created_at": created_at,
+        }
+
+
+def insert_chunked(engine: Engine, table: Table, rows: Iterator[dict], chunk_size: int, total: int) -> None:
+    """Insert rows with Core executemany, one transaction per chunk, reporting rows/s."""
+    inserted = 0
+    start = time.perf_counter()
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        with engine.begin() as connection:
+            connection.execute(insert(table), chunk)
+        inserted += len(chunk)
+        rate = inserted / (time.perf_counter() - start)
+        print(f"  {table.name}: {inserted:,}/{total:,} ({rate:,.0f} rows/s)", end="\r", flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"  Created {inserted:,} {table.name} rows in {elapsed:.1f}s ({inserted / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def seed_synthetic(
+    engine: Engine,
+    users: int,
+    tasks: int,
+    seed: int = 0,
+    chunk_size: int = 10_000,
+    now: datetime | None = None,
+) -> None:
+    """Insert large amounts of synthetic users and tasks.
+
+    The data is deterministic from `seed` and `now`, which defaults to
+    today's midnight so runs on the same day produce identical rows.
+
+    Every synthetic user shares one password hash of SYNTHETIC_PASSWORD,
+    computed once, so hashing does not dominate the run.
+    """
+    if users <= 0:
+        raise ValueError("At least one user is needed to own tasks")
+
+    if now is None:
+        now = datetime.combine(date.today(), datetime.min.time())
+
+    rng = random.Random(seed)
+    password_hash = encrypt_password(SYNTHETIC_PASSWORD)
+
+    user_rows = list(generate_users(rng, users, password_hash, now))
+    insert_chunked(engine, User.__table__, iter(user_rows), chunk_size, users)
+
+    # maintaining the full-text index row by row costs more than rebuilding it once
+    with engine.begin() as connection:
+        drop_search_index(connection)
+
+    user_uuids = [row["uuid"] for row in user_rows]
+    insert_chunked(engine, Task.__table__, generate_tasks(rng, tasks, user_uuids, now), chunk_size, tasks)
+
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        create_search_index(connection)
+    print(f"  Rebuilt search index in {time.perf_counter() - start:.1f}s")
+
+    # the bulk insert bypasses the task service, so count once at the end
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        rebuild_task_stats(connection)
+    print(f"  Rebuilt task counters in {time.perf_counter() - start:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the database with demo or synthetic data.")
+    parser.add_argument("--users", type=int, help="Generate this many synthetic users")
+    parser.add_argument("--tasks", type=int, default=0, help="Generate this many synthetic tasks")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed, the same seed gives the same data")
+    parser.add_argument(
+        "--anchor",
+        type=datetime.fromisoformat,
+        help="Date the synthetic history ends at (default: today), part of what makes runs repeatable",
+    )
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows per INSERT transaction")
+    parser.add_argument("--clear", action="store_true", help="Delete existing users and tasks first")
+    args = parser.parse_args()
+    if args.tasks and args.users is None:
+        # without --users the demo data would be seeded and --tasks ignored
+        parser.error("--tasks needs --users")
+
+    from project.db.db import get_engine
+    from project.db.migrate import upgrade
 
     # create tables
-    Base.metadata.create_all(bind=engine)
+    engine = get_engine()
+    upgrade(engine)
+
+    with Session(engine, autoflush=False) as session:
+        if args.clear:
+            clear_database(session)
 
-    # seed data
-    with SessionLocal() as session:
-        seed_database(session)
+        if args.users is None:
+            seed_database(session)
+            return
+
+    print(f"Seeding {args.users:,} users and {args.tasks:,} tasks (seed {args.seed})...")
+    seed_synthetic(engine, args.users, args.tasks, seed=args.seed, chunk_size=args.chunk_size, now=args.anchor)
+    print(f"Synthetic users log in with password {SYNTHETIC_PASSWORD!r}")
+
+
+if __name__ == "__main__":
+    main()
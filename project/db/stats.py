@@ -0,0 +1,132 @@
+"""Task counters behind GET /tasks/stats.
+
+``task_stat`` holds one row per (dimension, key): how many tasks have each
+status, priority and assignee, and how many open tasks are due on each day.
+The task service adjusts the rows in the same transaction as every task
+write, so reading the statistics scans this small table, whose size depends
+on the number of assignees and due days but not on the number of tasks.
+
+Tasks written any other way (raw SQL, a restored backup) make the counters
+drift; rebuild them from the task table with
+
+    python -m project.db.stats
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Connection, delete, func, insert, literal_column, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from project.db.models.task import Task, TaskStat, TaskStatus
+
+STATUS = "status"
+PRIORITY = "priority"
+ASSIGNEE = "assignee"
+DUE = "due"
+UNASSIGNED = "none"
+
+task_stat = TaskStat.__table__
+
+# a literal, not a bound parameter, so SQLite can prove the partial index ix_task_open_due_date applies
+OPEN = Task.status != literal_column(f"'{TaskStatus.DONE.value}'")
+
+
+class StatDeltas(Counter):
+    """Pending counter changes, keyed by (dimension, key)."""
+
+    def add_task(self, status: str, priority: int, assigned_to: UUID | None, due_date: Any, count: int = 1) -> None:
+        """Count `count` tasks with these values; negative to uncount. `due_date` may be a datetime, date or string."""
+        self[(STATUS, status)] += count
+        self[(PRIORITY, str(priority))] += count
+        self[(ASSIGNEE, str(assigned_to) if assigned_to else UNASSIGNED)] += count
+        if due_date is not None and status != TaskStatus.DONE.value:
+            self[(DUE, str(due_date)[:10])] += count
+
+
+def grouped_tasks(connection: Connection, filters: list[ColumnElement[bool]]) -> list[tuple]:
+    """(status, priority, assigned_to, due day, count) of the tasks matching `filters`."""
+    columns = (Task.status, Task.priority, Task.assigned_to, func.date(Task.due_date))
+    query = select(*columns, func.count()).where(*filters).group_by(*columns)
+    return [tuple(row) for row in connection.execute(query)]
+
+
+def apply_stat_deltas(connection: Connection, deltas: StatDeltas) -> None:
+    """Add `deltas` to the counters in the connection's transaction.
+
+    Rows are upserted in key order, so concurrent writers lock them in the
+    same order.
+    """
+    rows = [
+        {"dimension": dimension, "key": key, "count": delta}
+        for (dimension, key), delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return
+
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        statement = dialect_insert(task_stat)
+        statement = statement.on_conflict_do_update(
+            index_elements=[task_stat.c.dimension, task_stat.c.key],
+            set_={"count": task_stat.c.count + statement.excluded.count},
+        )
+        connection.execute(statement, rows)
+        return
+
+    for row in rows:
+        result = connection.execute(
+            update(task_stat)
+            .where(task_stat.c.dimension == row["dimension"], task_stat.c.key == row["key"])
+            .values(count=task_stat.c.count + row["count"])
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(task_stat).values(**row))
+
+
+def rebuild_task_stats(connection: Connection) -> int:
+    """Recount every counter from the task table, returns the number of counter rows."""
+    # block counter updates until the recount commits; writes that commit
+    # earlier are counted by the scan, later ones are applied on top of it
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(f"LOCK TABLE {task_stat.name} IN EXCLUSIVE MODE"))
+    # on SQLite the delete takes the write lock for the same effect
+    connection.execute(delete(task_stat))
+
+    deltas = StatDeltas()
+    for status, priority, assigned_to, due_day, count in grouped_tasks(connection, []):
+        deltas.add_task(status, priority, assigned_to, due_day, count)
+
+    apply_stat_deltas(connection, deltas)
+    return sum(1 for delta in deltas.values() if delta)
+
+
+def read_task_stats(connection: Connection) -> dict[str, dict[str, int]]:
+    """Non-zero counters by dimension, then key."""
+    stats: dict[str, dict[str, int]] = {STATUS: {}, PRIORITY: {}, ASSIGNEE: {}, DUE: {}}
+    query = select(task_stat.c.dimension, task_stat.c.key, task_stat.c.count).where(task_stat.c.count != 0)
+    for dimension, key, count in connection.execute(query):
+        stats.setdefault(dimension, {})[key] = count
+    return stats
+
+
+def count_overdue(connection: Connection, due_per_day: dict[str, int], now: datetime) -> int:
+    """Open tasks due before `now`: whole days from the counters, today from the open due date index."""
+    today = now.date().isoformat()
+    overdue = sum(count for day, count in due_per_day.items() if day < today)
+
+    midnight = datetime.combine(now.date(), datetime.min.time())
+    query = select(func.count()).select_from(Task).where(OPEN, Task.due_date >= midnight, Task.due_date < now)
+    return overdue + connection.execute(query).scalar_one()
+
+
+if __name__ == "__main__":
+    from project.db.db import get_engine
+
+    with get_engine().begin() as connection:
+        rows = rebuild_task_stats(connection)
+    print(f"Rebuilt {rows} task counters")
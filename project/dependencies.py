@@ -1,50 +1,153 @@
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from project.db.db import get_session
+from project.config import Settings
+from project.db.db import get_database, get_db_session
 from project.db.models.user import Role, User
-from project.security import decode_token
+from project.db.replicas import WROTE_STATE
+from project.security import Principal, TokenData, decode_token
+from project.services import async_user_service
+from project.services.auth_service import load_principal
 from project.services.user_service import get_user_by_username
+from project.utils.timing import timed
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[Session | AsyncSession, Depends(get_db_session)]
 
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    session: SessionDep,
-) -> User:
-    """Get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    """401 raised for any token or user lookup failure."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def decode_credentials(token: str) -> TokenData:
+    """Decode the bearer token, raising 401 when it is invalid."""
     try:
         token_data = decode_token(token)
 
         if token_data.username is None:
-            raise credentials_exception
+            raise credentials_exception()
 
     except JWTError:
-        raise credentials_exception
+        raise credentials_exception()
+
+    return token_data
+
+
+def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: Session,
+) -> User:
+    """Get current authenticated user from JWT token."""
+    token_data = decode_credentials(token)
 
     try:
         user = get_user_by_username(session, token_data.username)
     except Exception:
-        raise credentials_exception
+        raise credentials_exception()
+
+    return user
+
+
+async def get_current_user_async(token: str, session: AsyncSession) -> User:
+    """Async variant of get_current_user."""
+    token_data = decode_credentials(token)
+
+    try:
+        user = await async_user_service.get_user_by_username(session, token_data.username)
+    except Exception:
+        raise credentials_exception()
 
     return user
 
 
+async def get_principal(token: str, session: Session | AsyncSession) -> Principal:
+    """Identity and role from verified token claims, for AUTH_MODE=claims.
+
+    The claims are compared with a short-lived cached copy of the user, so a
+    deleted user or a changed role invalidates existing tokens within the
+    cache TTL without a query on every request.
+    """
+    token_data = decode_credentials(token)
+
+    try:
+        principal = Principal(uuid=token_data.user_uuid, username=token_data.username, role=token_data.role)
+        current = await load_principal(session, principal.username)
+    except Exception:
+        raise credentials_exception()
+
+    if current != principal:
+        raise credentials_exception()
+
+    return principal
+
+
+def get_app_settings(request: Request) -> Settings:
+    """Settings of the app handling `request`."""
+    return request.app.state.settings
+
+
+async def resolve_user(token: str, session: Session | AsyncSession, auth_mode: str) -> User | Principal:
+    """Resolve the current user on either session type, per `auth_mode` (the AUTH_MODE setting)."""
+    with timed("auth"):
+        if auth_mode == "claims":
+            return await get_principal(token, session)
+        if isinstance(session, AsyncSession):
+            return await get_current_user_async(token, session)
+        return await run_in_threadpool(get_current_user, token, session)
+
+
+async def get_request_user(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: SessionDep,
+) -> User | Principal:
+    """Dependency resolving the current user through the primary session."""
+    return await resolve_user(token, session, get_app_settings(request).AUTH_MODE)
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[Session | AsyncSession, None]:
+    """Dependency that provides a replica session, or the primary for a client that just wrote."""
+    read_only = not request.app.state.read_your_writes.recently_wrote(request.cookies)
+    async with get_database(request).open_session(read_only=read_only) as session:
+        yield session
+
+
+ReadSessionDep = Annotated[Session | AsyncSession, Depends(get_read_db_session)]
+
+
+async def get_read_user(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: ReadSessionDep,
+) -> User | Principal:
+    """Dependency resolving the current user through the read session."""
+    return await resolve_user(token, session, get_app_settings(request).AUTH_MODE)
+
+
+def track_writes(request: Request) -> None:
+    """Keep the client's reads on the primary until its write has replicated.
+
+    ReadYourWritesMiddleware sends the client a cookie with the time of the
+    write, which get_read_db_session checks on its next reads.
+    """
+    setattr(request.state, WROTE_STATE, True)
+
+
 def require_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[User | Principal, Depends(get_request_user)],
+) -> User | Principal:
     """Require current user to have admin role."""
     if current_user.role != Role.ADMIN.value:
         raise HTTPException(
@@ -54,5 +157,6 @@ def require_admin(
     return current_user
 
 
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
-AdminUserDep = Annotated[User, Depends(require_admin)]
+CurrentUserDep = Annotated[User | Principal, Depends(get_request_user)]
+ReadUserDep = Annotated[User | Principal, Depends(get_read_user)]
+AdminUserDep = Annotated[User | Principal, Depends(require_admin)]
@@ -36,6 +36,28 @@ class EntityNotFoundError(ServiceError):
         super().__init__(message, context)
 
 
+class ConflictError(ServiceError):
+    """Raised when an entity kept changing under a concurrent write."""
+
+    def __init__(
+        self,
+        entity_type: str,
+        identifier: str | None = None,
+    ) -> None:
+        self.entity_type = entity_type
+        self.identifier = identifier
+
+        message = f"{entity_type} was modified concurrently"
+        if identifier:
+            message += f": {identifier}"
+
+        context = {"entity_type": entity_type}
+        if identifier:
+            context["identifier"] = identifier
+
+        super().__init__(message, context)
+
+
 class ValidationError(ServiceError):
     """Raised when validation fails."""
 
@@ -71,3 +93,10 @@ class AuthorizationError(ServiceError):
         if required_role:
             context["required_role"] = required_role
         super().__init__(message, context)
+
+
+class ServiceUnavailableError(ServiceError):
+    """Raised when a bounded resource is saturated and the request is shed."""
+
+    def __init__(self, message: str = "Service temporarily unavailable") -> None:
+        super().__init__(message)
@@ -1,20 +1,75 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from functools import partial
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import Engine
+from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
 
 from project.config import Settings, get_settings
-from project.db.db import engine
-from project.db.models.base import Base
+from project.db.db import Database
+from project.db.migrate import schema_is_current, upgrade
+from project.db.replicas import ReadYourWrites, ReadYourWritesMiddleware
 from project.routers import auth_router, tasks_router
+from project.services.auth_service import get_password_executor
+from project.utils.metrics import MetricsMiddleware, Sample, get_metrics
+from project.utils.timing import TimingMiddleware
+
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def check_schema(engine: Engine, mode: str) -> None:
+    """Make sure the database was migrated for the current models, per DB_SCHEMA_CHECK."""
+    if mode == "off":
+        return
+
+    if schema_is_current(engine):
+        return
+
+    if mode == "migrate":
+        upgrade(engine)
+        return
+
+    raise RuntimeError("Database schema is missing or out of date, run: python -m project.db.migrate")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Create tables on startup."""
-    Base.metadata.create_all(bind=engine)
+    """Check the database schema and start flushing metrics on startup, close connections on shutdown."""
+    settings: Settings = app.state.settings
+    db: Database = app.state.db
+    await run_in_threadpool(check_schema, db.primary_engine, settings.DB_SCHEMA_CHECK)
+    flusher = None
+    if settings.METRICS_ENABLED:
+        flusher = asyncio.create_task(get_metrics().flush_periodically(partial(runtime_gauges, db)))
     yield
+    if flusher is not None:
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+    await db.dispose()
+
+
+def runtime_gauges(db: Database) -> list[Sample]:
+    """Connection pool and password hashing gauges for /metrics."""
+    samples: list[Sample] = []
+    for name, db_engine in db.active_engines().items():
+        pool = db_engine.pool
+        if isinstance(pool, QueuePool):
+            labels = (("engine", name),)
+            samples.append(("db_pool_checked_out", "gauge", "Connections in use.", labels, pool.checkedout()))
+            overflow = max(pool.overflow(), 0)
+            samples.append(("db_pool_overflow", "gauge", "Connections open beyond the pool size.", labels, overflow))
+
+    stats = get_password_executor().stats()
+    samples.append(("password_hash_queued", "gauge", "Password hashes waiting for a worker.", (), stats.queued))
+    samples.append(("password_hash_running", "gauge", "Password hashes being computed.", (), stats.running))
+    samples.append(("password_hash_rejected_total", "counter", "Logins rejected with 503.", (), stats.rejected))
+    return samples
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
@@ -29,6 +84,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         lifespan=lifespan,
         debug=settings.DEBUG,
     )
+    app.state.settings = settings
+    app.state.db = Database(settings)
+    app.state.read_your_writes = ReadYourWrites(window=settings.DB_READ_YOUR_WRITES_SECONDS)
 
     # cors middleware
     app.add_middleware(
@@ -39,6 +97,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.REQUEST_TIMING_ENABLED:
+        app.add_middleware(TimingMiddleware, header=settings.REQUEST_TIMING_HEADER)
+
+    if settings.DB_REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware, read_your_writes=app.state.read_your_writes)
+
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware, metrics=get_metrics())
+
     # register routers
     app.include_router(auth_router)
     app.include_router(tasks_router)
@@ -52,6 +119,13 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     def health_check() -> dict[str, str]:
         return {"status": "healthy"}
 
+    if settings.METRICS_ENABLED:
+        # async so rendering runs on the event loop, the only thread that updates the metrics
+        @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+        async def metrics(request: Request) -> PlainTextResponse:
+            body = get_metrics().render(runtime_gauges(request.app.state.db))
+            return PlainTextResponse(body, media_type=METRICS_MEDIA_TYPE)
+
     return app
 
 
@@ -4,21 +4,22 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from project.dependencies import SessionDep
-from project.exceptions import AuthenticationError
+from project.exceptions import AuthenticationError, ServiceUnavailableError
 from project.security import Token
-from project.services.auth_service import login_user
+from project.services.auth_service import login_user_async
+from project.utils.timing import TimedRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=TimedRoute)
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: SessionDep,
 ) -> Token:
     """Authenticate user and return access token."""
     try:
-        token = login_user(session, form_data.username, form_data.password)
+        token = await login_user_async(session, form_data.username, form_data.password)
         return token
     except AuthenticationError as e:
         raise HTTPException(
@@ -26,3 +27,9 @@ def login(
             detail=str(e.message),
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
@@ -1,51 +1,352 @@
-from typing import Annotated
+import json
+from dataclasses import replace
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from project.db.models.task import TaskCreate, TaskResponse, TaskStatus, TaskUpdate
-from project.dependencies import AdminUserDep, CurrentUserDep, SessionDep
-from project.exceptions import EntityNotFoundError, ValidationError
+from project.db.db import is_replica_session, iterate_from_thread, run_in_session
+from project.db.models.task import (
+    BulkCreateResponse,
+    BulkItemError,
+    BulkMutationResponse,
+    Task,
+    TaskChangesResponse,
+    TaskCreate,
+    TaskResponse,
+    TaskStatsResponse,
+    TaskStatus,
+    TaskUpdate,
+    sparse_task_response,
+)
+from project.dependencies import AdminUserDep, CurrentUserDep, ReadSessionDep, ReadUserDep, SessionDep, track_writes
+from project.exceptions import ConflictError, EntityNotFoundError, ValidationError
 from project.services import task_service
-from project.utils.pagination import PaginatedResponse, PaginationParams, get_pagination_params
+from project.services.task_cache import CachedPage, get_task_list_cache
+from project.utils.etag import etag_matches, make_etag
+from project.utils.export import EXPORT_MEDIA_TYPES, csv_chunks, gzip_chunks, ndjson_chunks
+from project.utils.pagination import PaginatedData, PaginatedResponse, PaginationParams, get_pagination_params
+from project.utils.serialization import JSONBytesResponse, encode_json, loaded_values
+from project.utils.timing import TimedRoute, timed
 
-router = APIRouter(prefix="/tasks", tags=["Tasks"])
+router = APIRouter(prefix="/tasks", tags=["Tasks"], route_class=TimedRoute)
 
+BULK_CREATE_MAX_ITEMS = 50_000
+EXPORT_BATCH_SIZE = 1000
 
-@router.get("", response_model=PaginatedResponse[TaskResponse])
-def list_tasks(
-    session: SessionDep,
-    current_user: CurrentUserDep,
+# clients may reuse a response only after revalidating it with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+NOT_MODIFIED_RESPONSE = {304: {"description": "Not Modified"}}
+
+TASK_ADAPTER = TypeAdapter(TaskResponse)
+TASK_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[TaskResponse])
+TASK_FIELDS = tuple(TaskResponse.model_fields)
+TASK_CHANGES_ADAPTER = TypeAdapter(TaskChangesResponse)
+
+FIELDS_QUERY = Query(
+    default=None,
+    description=f"Comma-separated fields to return and load, from: {','.join(TASK_FIELDS)}",
+)
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """Validate a sparse fieldset; None means every field."""
+    if fields is None:
+        return None
+
+    requested = {name.strip() for name in fields.split(",")} - {""}
+    unknown = requested - set(TASK_FIELDS)
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {','.join(sorted(unknown))}" if unknown else "No fields requested",
+        )
+
+    if len(requested) == len(TASK_FIELDS):
+        return None
+    return tuple(name for name in TASK_FIELDS if name in requested)
+
+
+@lru_cache(maxsize=128)
+def task_adapters(fields: tuple[str, ...] | None) -> tuple[TypeAdapter, TypeAdapter]:
+    """Adapters for one task and for a page of tasks, trimmed to a sparse fieldset."""
+    if fields is None:
+        return TASK_ADAPTER, TASK_PAGE_ADAPTER
+    model = sparse_task_response(fields)
+    return TypeAdapter(model), TypeAdapter(PaginatedResponse[model])
+
+
+def task_etag(task_uuid: UUID, version: int, fields: tuple[str, ...] | None = None) -> str:
+    """Strong ETag for a single task representation."""
+    parts: list[Any] = ["task", task_uuid.hex, version]
+    if fields is not None:
+        parts.append(",".join(fields))
+    return make_etag(parts)
+
+
+def page_etag(filters: dict[str, Any], page: PaginatedData) -> str:
+    """Strong ETag for a page, from its filters and the versions of its rows."""
+    parts: list[Any] = ["tasks", sorted(filters.items()), page.total, page.offset, page.limit]
+    parts.append(page.next_cursor)
+    parts.extend(f"{task.uuid.hex}:{task.version}" for task in page.results)
+    return make_etag(parts)
+
+
+def page_json(page: PaginatedData[Task], adapter: TypeAdapter = TASK_PAGE_ADAPTER) -> bytes:
+    """Encode a page of tasks, validating their loaded values directly instead of through attribute access."""
+    with timed("serialize"):
+        try:
+            return encode_json(adapter, replace(page, results=[loaded_values(task) for task in page.results]))
+        except PydanticValidationError:
+            # a field was expired or deferred; reading it through the ORM loads it
+            return encode_json(adapter, page)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+async def read_bulk_items(request: Request) -> list[Any]:
+    """Read a JSON array or an NDJSON request body into raw items."""
+    body = await request.body()
+
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            items = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            items = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Body must be a JSON array or NDJSON",
+        )
+
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Body must be a JSON array or NDJSON",
+        )
+    if len(items) > BULK_CREATE_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {BULK_CREATE_MAX_ITEMS} tasks per request",
+        )
+
+    return items
+
+
+def validate_bulk_items(items: list[Any]) -> tuple[list[TaskCreate], list[int], list[BulkItemError]]:
+    """Validate raw bulk items, returning valid items, their positions and per-item errors."""
+    errors = []
+    valid_items = []
+    positions = []
+    for index, item in enumerate(items):
+        try:
+            valid_items.append(TaskCreate.model_validate(item))
+            positions.append(index)
+        except PydanticValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc']) or 'item'}: {error['msg']}" for error in e.errors()
+            )
+            errors.append(BulkItemError(index=index, detail=detail))
+
+    return valid_items, positions, errors
+
+
+@router.get("", response_model=PaginatedResponse[TaskResponse], responses=NOT_MODIFIED_RESPONSE)
+async def list_tasks(
+    session: ReadSessionDep,
+    current_user: ReadUserDep,
     pagination: Annotated[PaginationParams, Depends(get_pagination_params)],
     status_filter: TaskStatus | None = Query(default=None, alias="status"),
     assigned_to: UUID | None = Query(default=None),
-) -> PaginatedResponse[TaskResponse]:
-    """List tasks with pagination and optional filters."""
-    result = task_service.get_tasks(
-        session=session,
-        pagination=pagination,
-        status_filter=status_filter,
-        assigned_to=assigned_to,
-    )
+    q: str | None = Query(default=None, min_length=1, max_length=200, description="Full-text search"),
+    fields: str | None = FIELDS_QUERY,
+    if_none_match: str | None = Header(default=None),
+) -> PaginatedResponse[TaskResponse] | Response:
+    """List tasks with pagination and optional filters.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to page by keyset,
+    which stays fast on deep pages and is stable under concurrent inserts.
+    Set ``include_total=false`` to skip counting and rely on ``has_next``.
+    With ``q``, results are ranked by relevance and paged by offset.
+    Send the ``ETag`` back as ``If-None-Match`` to get 304 when nothing changed.
+    Pages are served from the task list cache when it is enabled.
+    With ``fields``, each task has only those fields and only their columns are loaded.
+    """
+    sparse_fields = parse_fields(fields)
+    filters = {
+        **pagination.model_dump(),
+        "status": status_filter,
+        "assigned_to": assigned_to,
+        "q": q,
+        "fields": sparse_fields,
+    }
+    cache = get_task_list_cache()
+    cache_key = cache.key(filters, status_filter.value if status_filter else None, assigned_to)
+
+    page = cache.get(cache_key)
+    cache_status = "HIT"
+    if page is None:
+        cache_status = "MISS"
+        try:
+            result = await run_in_session(
+                session,
+                task_service.get_tasks,
+                pagination=pagination,
+                status_filter=status_filter,
+                assigned_to=assigned_to,
+                search=q,
+                fields=sparse_fields,
+            )
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=e.message,
+            )
+
+        # a replica may not have caught up with a write whose invalidation the key already includes,
+        # and caching its page would serve the old data to the writer too
+        cacheable = cache.enabled and not is_replica_session(session)
+        etag = page_etag(filters, result)
+        if not cacheable and etag_matches(if_none_match, etag):
+            return not_modified(etag)
 
-    return PaginatedResponse(
-        total=result.total,
-        offset=result.offset,
-        limit=result.limit,
-        results=[TaskResponse.model_validate(task) for task in result.results],
+        page = CachedPage(etag=etag, body=page_json(result, task_adapters(sparse_fields)[1]))
+        if cacheable:
+            # cached even when the client already has it, so the next poll skips the query
+            cache.set(cache_key, page)
+
+    if etag_matches(if_none_match, page.etag):
+        return not_modified(page.etag)
+
+    return JSONBytesResponse(
+        content=page.body,
+        headers={"ETag": page.etag, "Cache-Control": CACHE_CONTROL, "X-Cache": cache_status},
     )
 
 
-@router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    session: SessionDep,
+    current_user: CurrentUserDep,
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    compress: bool = Query(default=False, alias="gzip", description="Gzip the response body"),
+    sort_order: Literal["asc", "desc"] = Query(default="asc", description="Sort order"),
+    status_filter: TaskStatus | None = Query(default=None, alias="status"),
+    assigned_to: UUID | None = Query(default=None),
+    q: str | None = Query(default=None, min_length=1, max_length=200, description="Full-text search"),
+) -> StreamingResponse:
+    """Stream all matching tasks as NDJSON or CSV."""
+    try:
+        if isinstance(session, AsyncSession):
+            query = await session.run_sync(
+                task_service.export_query,
+                status_filter=status_filter,
+                assigned_to=assigned_to,
+                sort_order=sort_order,
+                search=q,
+            )
+            result = await session.stream(query, execution_options={"yield_per": EXPORT_BATCH_SIZE})
+            batches = iterate_from_thread(result.mappings().partitions(EXPORT_BATCH_SIZE))
+            rows = (row for batch in batches for row in batch)
+        else:
+            rows = await run_in_session(
+                session,
+                task_service.iter_tasks,
+                status_filter=status_filter,
+                assigned_to=assigned_to,
+                sort_order=sort_order,
+                search=q,
+                batch_size=EXPORT_BATCH_SIZE,
+            )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
+    tasks = (TaskResponse.model_validate(dict(row)) for row in rows)
+
+    if export_format == "csv":
+        chunks = csv_chunks(tasks, fieldnames=list(TaskResponse.model_fields))
+    else:
+        chunks = ndjson_chunks(tasks)
+
+    headers = {"Content-Disposition": f'attachment; filename="tasks.{export_format}"'}
+    if compress:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers)
+
+
+@router.get("/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    session: ReadSessionDep,
+    current_user: ReadUserDep,
+) -> TaskStatsResponse:
+    """Task counts by status, priority and assignee, and how many open tasks are overdue.
+
+    Served from counters kept up to date by every task write, so polling it
+    costs the same however many tasks there are.
+    """
+    return await run_in_session(session, task_service.get_task_stats)
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+async def get_task_changes(
+    session: ReadSessionDep,
+    current_user: ReadUserDep,
+    since: int = Query(default=0, ge=0, description="Last revision the client has synced, 0 for everything"),
+    limit: int = Query(default=100, gt=0, le=1000, description="Changes per page"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+) -> Response:
+    """Tasks created, updated or deleted after revision ``since``, oldest first.
+
+    Follow ``next_cursor`` while ``has_more`` is true, then keep ``revision``
+    and pass it as ``since`` on the next sync. Deleted tasks are listed by
+    UUID in ``deleted``.
+    """
+    try:
+        changes = await run_in_session(session, task_service.get_task_changes, since, limit, cursor)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
+
+    with timed("serialize"):
+        body = encode_json(TASK_CHANGES_ADAPTER, changes)
+    return JSONBytesResponse(body)
+
+
+@router.post(
+    "",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(track_writes)],
+)
+async def create_task(
     task_data: TaskCreate,
     session: SessionDep,
     current_user: CurrentUserDep,
-) -> TaskResponse:
+) -> Response:
     """Create a new task."""
     try:
-        task = task_service.create_task(session, task_data, current_user)
-        return TaskResponse.model_validate(task)
+        task = await run_in_session(session, task_service.create_task, task_data, current_user)
+        with timed("serialize"):
+            body = encode_json(TASK_ADAPTER, task)
+        return JSONBytesResponse(body, status_code=status.HTTP_201_CREATED)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -53,39 +354,156 @@ def create_task(
         )
 
 
-@router.get("/{task_uuid}", response_model=TaskResponse)
-def get_task(
-    task_uuid: UUID,
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResponse,
+    dependencies=[Depends(track_writes)],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/TaskCreate"}},
+                },
+                "application/x-ndjson": {
+                    "schema": {"$ref": "#/components/schemas/TaskCreate"},
+                },
+            },
+        },
+    },
+)
+async def create_tasks_bulk(
+    items: Annotated[list[Any], Depends(read_bulk_items)],
     session: SessionDep,
     current_user: CurrentUserDep,
-) -> TaskResponse:
-    """Get a specific task by UUID."""
+) -> BulkCreateResponse:
+    """Create many tasks at once, reporting invalid items individually."""
+    valid_items, positions, errors = await run_in_threadpool(validate_bulk_items, items)
+
+    result = await run_in_session(session, task_service.create_tasks_bulk, valid_items, current_user)
+    errors.extend(BulkItemError(index=positions[position], detail=detail) for position, detail in result.errors.items())
+
+    return BulkCreateResponse(
+        created=len(result.created),
+        uuids=result.created,
+        errors=sorted(errors, key=lambda error: error.index),
+    )
+
+
+@router.patch("", response_model=BulkMutationResponse, dependencies=[Depends(track_writes)])
+async def update_tasks(
+    task_data: TaskUpdate,
+    session: SessionDep,
+    current_user: CurrentUserDep,
+    status_filter: TaskStatus | None = Query(default=None, alias="status"),
+    assigned_to: UUID | None = Query(default=None),
+    dry_run: bool = Query(default=False, description="Only count the tasks that would change"),
+) -> BulkMutationResponse:
+    """Update every task matching the filters in one statement."""
     try:
-        task = task_service.get_task_by_uuid(session, task_uuid)
-        return TaskResponse.model_validate(task)
+        affected = await run_in_session(
+            session,
+            task_service.update_tasks,
+            task_data=task_data,
+            status_filter=status_filter,
+            assigned_to=assigned_to,
+            dry_run=dry_run,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
+
+    return BulkMutationResponse(affected=affected, dry_run=dry_run)
+
+
+@router.delete("", response_model=BulkMutationResponse, dependencies=[Depends(track_writes)])
+async def delete_tasks(
+    session: SessionDep,
+    admin_user: AdminUserDep,
+    status_filter: TaskStatus | None = Query(default=None, alias="status"),
+    assigned_to: UUID | None = Query(default=None),
+    dry_run: bool = Query(default=False, description="Only count the tasks that would be deleted"),
+) -> BulkMutationResponse:
+    """Delete every task matching the filters in one statement (admin only)."""
+    try:
+        affected = await run_in_session(
+            session,
+            task_service.delete_tasks,
+            status_filter=status_filter,
+            assigned_to=assigned_to,
+            dry_run=dry_run,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
+
+    return BulkMutationResponse(affected=affected, dry_run=dry_run)
+
+
+@router.get("/{task_uuid}", response_model=TaskResponse, responses=NOT_MODIFIED_RESPONSE)
+async def get_task(
+    task_uuid: UUID,
+    session: ReadSessionDep,
+    current_user: ReadUserDep,
+    fields: str | None = FIELDS_QUERY,
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Get a specific task by UUID.
+
+    A matching ``If-None-Match`` is answered with 304 from the row version
+    alone, without loading the task.
+    With ``fields``, only those fields are returned and only their columns are loaded.
+    """
+    sparse_fields = parse_fields(fields)
+    try:
+        if if_none_match:
+            version = await run_in_session(session, task_service.get_task_version, task_uuid)
+            etag = task_etag(task_uuid, version, sparse_fields)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+        task = await run_in_session(session, task_service.get_task_by_uuid, task_uuid, sparse_fields)
     except EntityNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
 
+    with timed("serialize"):
+        body = encode_json(task_adapters(sparse_fields)[0], task)
+    return JSONBytesResponse(
+        body,
+        headers={"ETag": task_etag(task.uuid, task.version, sparse_fields), "Cache-Control": CACHE_CONTROL},
+    )
 
-@router.patch("/{task_uuid}", response_model=TaskResponse)
-def update_task(
+
+@router.patch("/{task_uuid}", response_model=TaskResponse, dependencies=[Depends(track_writes)])
+async def update_task(
     task_uuid: UUID,
     task_data: TaskUpdate,
     session: SessionDep,
     current_user: CurrentUserDep,
-) -> TaskResponse:
+) -> Response:
     """Update an existing task."""
     try:
-        task = task_service.update_task(session, task_uuid, task_data)
-        return TaskResponse.model_validate(task)
+        task = await run_in_session(session, task_service.update_task, task_uuid, task_data)
+        with timed("serialize"):
+            body = encode_json(TASK_ADAPTER, task)
+        return JSONBytesResponse(body, headers={"ETag": task_etag(task.uuid, task.version)})
     except EntityNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.message,
+        )
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -93,17 +511,26 @@ def update_task(
         )
 
 
-@router.delete("/{task_uuid}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+@router.delete(
+    "/{task_uuid}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(track_writes)],
+)
+async def delete_task(
     task_uuid: UUID,
     session: SessionDep,
     admin_user: AdminUserDep,
 ) -> None:
     """Delete a task (admin only)."""
     try:
-        task_service.delete_task(session, task_uuid)
+        await run_in_session(session, task_service.delete_task, task_uuid)
     except EntityNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.message,
+        )
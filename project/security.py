@@ -1,10 +1,22 @@
+import hashlib
+import hmac
+import secrets
+import time
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from uuid import UUID
 
 import bcrypt
 from jose import jwt
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from project.config import get_settings
+from project.config import Settings, get_settings
+from project.utils.cache import CacheStats, LRUCache
+
+if TYPE_CHECKING:
+    from project.db.models.user import User
 
 
 class Token(BaseModel):
@@ -16,7 +28,11 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     username: str | None = None
+    role: str | None = None
+    user_uuid: str | None = None
 
 
 class TokenPayload(BaseModel):
@@ -25,19 +41,117 @@ class TokenPayload(BaseModel):
     user_uuid: str
 
 
+class Principal(BaseModel):
+    """Authenticated identity built from verified token claims, without a DB row."""
+
+    model_config = ConfigDict(frozen=True)
+
+    uuid: UUID
+    username: str
+    role: str
+
+    @classmethod
+    def from_user(cls, user: "User") -> "Principal":
+        return cls(uuid=user.uuid, username=user.username, role=user.role)
+
+
+class PasswordScheme(ABC):
+    """A password hashing scheme, recognised by the prefix of its hashes."""
+
+    name: str
+    prefixes: tuple[str, ...]
+    secure: bool = True
+
+    @abstractmethod
+    def hash(self, password: str, rounds: int) -> str: ...
+
+    @abstractmethod
+    def verify(self, password: str, hashed: str) -> bool: ...
+
+    def needs_rehash(self, hashed: str, rounds: int) -> bool:
+        return False
+
+
+class BcryptScheme(PasswordScheme):
+    name = "bcrypt"
+    prefixes = ("$2a$", "$2b$", "$2y$")
+
+    def hash(self, password: str, rounds: int) -> str:
+        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds))
+        return hashed.decode("utf-8")
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+    def needs_rehash(self, hashed: str, rounds: int) -> bool:
+        # $2b$<cost>$<salt+digest>
+        return int(hashed.split("$")[2]) != rounds
+
+
+class FastTestScheme(PasswordScheme):
+    """Salted SHA-256 for test runs, where bcrypt would dominate fixture time.
+
+    Never use it in production: its hashes are only verified while it is the
+    configured scheme.
+    """
+
+    name = "test"
+    prefixes = ("$test$",)
+    secure = False
+
+    def hash(self, password: str, rounds: int) -> str:
+        salt = secrets.token_hex(8)
+        digest = hashlib.sha256(f"{salt}{password}".encode("utf-8")).hexdigest()
+        return f"$test${salt}${digest}"
+
+    def verify(self, password: str, hashed: str) -> bool:
+        _, _, salt, digest = hashed.split("$")
+        expected = hashlib.sha256(f"{salt}{password}".encode("utf-8")).hexdigest()
+        return hmac.compare_digest(expected, digest)
+
+
+PASSWORD_SCHEMES: dict[str, PasswordScheme] = {scheme.name: scheme for scheme in (BcryptScheme(), FastTestScheme())}
+
+
+def identify_scheme(hashed: str) -> PasswordScheme | None:
+    """Scheme that produced `hashed`, None for unknown formats."""
+    if not isinstance(hashed, str):
+        return None
+    return next(
+        (scheme for scheme in PASSWORD_SCHEMES.values() if hashed.startswith(scheme.prefixes)),
+        None,
+    )
+
+
 def encrypt_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    password_bytes = password.encode("utf-8")
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
-    return hashed.decode("utf-8")
+    """Hash a password with the configured scheme and work factor."""
+    settings = get_settings()
+    return PASSWORD_SCHEMES[settings.PASSWORD_HASH_SCHEME].hash(password, settings.PASSWORD_HASH_ROUNDS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"),
-        hashed_password.encode("utf-8"),
-    )
+    """Verify a password against its hash, whichever scheme produced it."""
+    scheme = identify_scheme(hashed_password)
+    if scheme is None:
+        return False
+    if not scheme.secure and scheme.name != get_settings().PASSWORD_HASH_SCHEME:
+        return False
+    return scheme.verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when a hash uses another scheme or work factor than configured.
+
+    Never true when the configured scheme is insecure: its hashes stop
+    verifying once the setting is changed back, which would lock users out.
+    """
+    settings = get_settings()
+    scheme = identify_scheme(hashed_password)
+    if scheme is None or not scheme.secure:
+        return False
+    if scheme.name != settings.PASSWORD_HASH_SCHEME:
+        return PASSWORD_SCHEMES[settings.PASSWORD_HASH_SCHEME].secure
+    return scheme.needs_rehash(hashed_password, settings.PASSWORD_HASH_ROUNDS)
 
 
 def create_access_token(
@@ -52,9 +166,7 @@ def create_access_token(
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode["exp"] = expire
 
@@ -67,15 +179,59 @@ def create_access_token(
     return Token(access_token=encoded_jwt)
 
 
+@lru_cache
+def get_token_cache() -> LRUCache:
+    """Process-wide cache of verified tokens, each entry lives until its `exp`."""
+    return LRUCache(max_entries=get_settings().TOKEN_CACHE_MAX_ENTRIES)
+
+
+def token_cache_stats() -> CacheStats:
+    return get_token_cache().stats()
+
+
+def _token_cache_key(token: str, settings: Settings) -> str:
+    """Digest of the token and the verifying key.
+
+    Including the secret and algorithm means rotating either turns every
+    cached entry into a miss, so old tokens are verified again and rejected.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for part in (settings.ALGORITHM, settings.SECRET_KEY, token):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def decode_token(token: str) -> TokenData:
-    """Decode a JWT token and return token data."""
+    """Decode a JWT token and return token data.
+
+    Verified tokens are cached until they expire, so a client reusing its
+    token skips signature verification and JSON parsing on later requests.
+    """
     settings = get_settings()
 
+    cache = get_token_cache() if settings.TOKEN_CACHE_ENABLED else None
+    if cache is not None:
+        key = _token_cache_key(token, settings)
+        token_data = cache.get(key)
+        if token_data is not None:
+            return token_data
+
     payload = jwt.decode(
         token,
         settings.SECRET_KEY,
         algorithms=[settings.ALGORITHM],
     )
 
-    username = payload.get("username")
-    return TokenData(username=username)
+    token_data = TokenData(
+        username=payload.get("username"),
+        role=payload.get("role"),
+        user_uuid=payload.get("user_uuid"),
+    )
+
+    # tokens without an expiry are never cached, there is no bound on their lifetime
+    expires_in = payload["exp"] - time.time() if isinstance(payload.get("exp"), (int, float)) else 0
+    if cache is not None and expires_in > 0:
+        cache.set(key, token_data, ttl=expires_in)
+
+    return token_data
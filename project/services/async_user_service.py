@@ -0,0 +1,41 @@
+"""Async variants of the user lookups used on every authenticated request."""
+
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.db.models.user import User
+from project.exceptions import EntityNotFoundError
+
+
+async def get_user_by_uuid(session: AsyncSession, user_uuid: UUID) -> User:
+    """Get user by UUID, raises EntityNotFoundError if not found."""
+    user = (await session.execute(select(User).where(User.uuid == user_uuid))).scalar_one_or_none()
+
+    if not user:
+        raise EntityNotFoundError("User", str(user_uuid))
+
+    return user
+
+
+async def get_user_by_username(session: AsyncSession, username: str) -> User:
+    """Get user by username, raises EntityNotFoundError if not found."""
+    user = (await session.execute(select(User).where(User.username == username))).scalar_one_or_none()
+
+    if not user:
+        raise EntityNotFoundError("User", username)
+
+    return user
+
+
+async def update_password_hash(session: AsyncSession, user_uuid: UUID, password_hash: str) -> None:
+    """Replace a user's stored password hash."""
+    await session.execute(update(User).where(User.uuid == user_uuid).values(password_hash=password_hash))
+    await session.commit()
+
+
+async def get_all_users(session: AsyncSession) -> list[User]:
+    """Get all users."""
+    result = await session.execute(select(User))
+    return list(result.scalars().all())
@@ -1,16 +1,34 @@
 from datetime import timedelta
+from functools import lru_cache
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from project.config import get_settings
 from project.db.models.user import User
 from project.exceptions import AuthenticationError
-from project.security import Token, TokenPayload, create_access_token, verify_password
-from project.services.user_service import get_user_by_username
+from project.security import (
+    Principal,
+    Token,
+    TokenPayload,
+    create_access_token,
+    encrypt_password,
+    password_needs_rehash,
+    verify_password,
+)
+from project.services import async_user_service
+from project.services.user_service import get_user_by_username, update_password_hash
+from project.utils.cache import LRUCache
+from project.utils.executor import BoundedExecutor
 
 
 def authenticate_user(session: Session, username: str, password: str) -> User:
-    """Authenticate user by username and password."""
+    """Authenticate user by username and password.
+
+    A hash made with another scheme or work factor than configured is
+    replaced on successful login, while the plain password is at hand.
+    """
     try:
         user = get_user_by_username(session, username)
     except Exception:
@@ -19,6 +37,58 @@ def authenticate_user(session: Session, username: str, password: str) -> User:
     if not verify_password(password, user.password_hash):
         raise AuthenticationError("Invalid username or password")
 
+    if password_needs_rehash(user.password_hash):
+        update_password_hash(session, user.uuid, encrypt_password(password))
+
+    return user
+
+
+def _get_detached_user(session: Session, username: str) -> User:
+    user = get_user_by_username(session, username)
+    session.close()
+    return user
+
+
+@lru_cache
+def get_password_executor() -> BoundedExecutor:
+    """Process-wide pool that bcrypt hashing and verification run on."""
+    settings = get_settings()
+    return BoundedExecutor(
+        workers=settings.PASSWORD_HASH_WORKERS,
+        max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+        processes=settings.PASSWORD_HASH_PROCESSES,
+        name="password-hash",
+    )
+
+
+async def authenticate_user_async(session: Session | AsyncSession, username: str, password: str) -> User:
+    """Async variant of authenticate_user.
+
+    bcrypt runs on the bounded password executor, so a burst of logins
+    cannot take over the threadpool other requests use. Raises
+    ServiceUnavailableError when that executor is saturated. The session is
+    closed before hashing so waiting logins do not hold pool connections.
+    """
+    try:
+        if isinstance(session, AsyncSession):
+            user = await async_user_service.get_user_by_username(session, username)
+            await session.close()
+        else:
+            user = await run_in_threadpool(_get_detached_user, session, username)
+    except Exception:
+        raise AuthenticationError("Invalid username or password")
+
+    executor = get_password_executor()
+    if not await executor.run(verify_password, password, user.password_hash):
+        raise AuthenticationError("Invalid username or password")
+
+    if password_needs_rehash(user.password_hash):
+        password_hash = await executor.run(encrypt_password, password)
+        if isinstance(session, AsyncSession):
+            await async_user_service.update_password_hash(session, user.uuid, password_hash)
+        else:
+            await run_in_threadpool(update_password_hash, session, user.uuid, password_hash)
+
     return user
 
 
@@ -41,3 +111,38 @@ def login_user(session: Session, username: str, password: str) -> Token:
     """Authenticate and return token."""
     user = authenticate_user(session, username, password)
     return create_user_token(user)
+
+
+async def login_user_async(session: Session | AsyncSession, username: str, password: str) -> Token:
+    """Async variant of login_user."""
+    user = await authenticate_user_async(session, username, password)
+    return create_user_token(user)
+
+
+@lru_cache
+def get_principal_cache() -> LRUCache:
+    """Process-wide cache of username -> Principal, used by claims auth."""
+    settings = get_settings()
+    return LRUCache(
+        max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+        ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    )
+
+
+async def load_principal(session: Session | AsyncSession, username: str) -> Principal:
+    """Current principal for `username`, from the cache or the user table.
+
+    Raises EntityNotFoundError if the user no longer exists.
+    """
+    cache = get_principal_cache()
+    principal = cache.get(username)
+
+    if principal is None:
+        if isinstance(session, AsyncSession):
+            user = await async_user_service.get_user_by_username(session, username)
+        else:
+            user = await run_in_threadpool(get_user_by_username, session, username)
+        principal = Principal.from_user(user)
+        cache.set(username, principal)
+
+    return principal
@@ -0,0 +1,96 @@
+"""Response cache for task list pages with write-driven invalidation."""
+
+import hashlib
+import json
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from project.config import get_settings
+from project.utils.cache import CacheBackend, CacheStats, LRUCache, NullCache
+
+ANY = "*"
+GLOBAL_GENERATION = "tasks:gen:all"
+
+
+class CachedPage(NamedTuple):
+    """A serialized list page and its ETag."""
+
+    etag: str
+    body: bytes
+
+
+def _scope(status: str | None, assigned_to: UUID | None) -> str:
+    return f"{status or ANY}|{assigned_to.hex if assigned_to else ANY}"
+
+
+class TaskListCache:
+    """Caches serialized task list pages keyed on normalized filters.
+
+    Every key embeds the generation of the (status, assigned_to) scope it
+    was read under. A write bumps the generation of each scope the task
+    belongs to, so affected pages are never looked up again while pages
+    for unrelated filters stay cached. Orphaned entries age out via TTL/LRU.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float | None = None) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        # False when caching is disabled, so callers can skip building pages only to store them
+        self.enabled = not isinstance(backend, NullCache)
+
+    def key(self, params: dict[str, Any], status: str | None, assigned_to: UUID | None) -> str:
+        """Build the cache key; call before querying so racing writes invalidate it."""
+        scope = _scope(status, assigned_to)
+        global_generation = self.backend.counter(GLOBAL_GENERATION)
+        scope_generation = self.backend.counter(f"tasks:gen:{scope}")
+        digest = hashlib.blake2b(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return f"tasks:list:{global_generation}:{scope_generation}:{scope}:{digest}"
+
+    def get(self, key: str) -> CachedPage | None:
+        return self.backend.get(key)
+
+    def set(self, key: str, page: CachedPage) -> None:
+        self.backend.set(key, page, ttl=self.ttl)
+
+    def invalidate_task(self, status: str, assigned_to: UUID | None) -> None:
+        """Invalidate every filter scope a task with these values appears in."""
+        scopes = {_scope(None, None), _scope(status, None)}
+        if assigned_to:
+            scopes.update({_scope(None, assigned_to), _scope(status, assigned_to)})
+
+        for scope in scopes:
+            self.backend.incr(f"tasks:gen:{scope}")
+
+    def invalidate_all(self) -> None:
+        """Invalidate every cached page, for writes whose reach is unknown."""
+        self.backend.incr(GLOBAL_GENERATION)
+
+    def stats(self) -> CacheStats:
+        return self.backend.stats()
+
+
+def _load_backend(path: str) -> CacheBackend:
+    """Instantiate a backend from a "package.module:ClassName" path."""
+    module_name, _, class_name = path.partition(":")
+    backend_class = getattr(import_module(module_name), class_name)
+    return backend_class()
+
+
+@lru_cache
+def get_task_list_cache() -> TaskListCache:
+    """Process-wide task list cache configured from settings."""
+    settings = get_settings()
+
+    if not settings.TASK_CACHE_ENABLED:
+        backend: CacheBackend = NullCache()
+    elif settings.TASK_CACHE_BACKEND == "memory":
+        backend = LRUCache(max_entries=settings.TASK_CACHE_MAX_ENTRIES)
+    else:
+        backend = _load_backend(settings.TASK_CACHE_BACKEND)
+
+    return TaskListCache(backend, ttl=settings.TASK_CACHE_TTL_SECONDS)
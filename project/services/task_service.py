@@ -1,18 +1,91 @@
-from uuid import UUID
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Literal, TypeVar
+from uuid import UUID, uuid4
 
-from sqlalchemy import asc, desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    RowMapping,
+    Select,
+    Subquery,
+    asc,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.exc import StaleDataError
 
-from project.db.models.task import Task, TaskCreate, TaskStatus, TaskUpdate
+from project.db.changes import add_tombstones, changed_after, next_revision
+from project.db.models.task import Task, TaskCreate, TaskStatsResponse, TaskStatus, TaskTombstone, TaskUpdate
 from project.db.models.user import User
-from project.exceptions import EntityNotFoundError, ValidationError
-from project.utils.pagination import PaginatedData, PaginationParams
+from project.db.search import search_subquery
+from project.db.stats import (
+    ASSIGNEE,
+    DUE,
+    PRIORITY,
+    STATUS,
+    UNASSIGNED,
+    StatDeltas,
+    apply_stat_deltas,
+    count_overdue,
+    grouped_tasks,
+    read_task_stats,
+)
+from project.exceptions import ConflictError, EntityNotFoundError, ValidationError
+from project.security import Principal
+from project.services.task_cache import get_task_list_cache
+from project.utils.pagination import (
+    PaginatedData,
+    PaginationParams,
+    decode_cursor,
+    decode_revision_cursor,
+    encode_cursor,
+    encode_revision_cursor,
+    has_next_page,
+)
 
+# Writes take a revision, then update the stats counters, then write tasks,
+# so concurrent writers lock those rows in the same order. The revision row
+# serialises task writers, so bulk writes group the tasks they change only
+# after taking it.
 
-def get_task_by_uuid(session: Session, task_uuid: UUID) -> Task:
-    """Get task by UUID, raises EntityNotFoundError if not found."""
+T = TypeVar("T")
+
+# attempts of a single-task write whose row version changed under it
+STALE_WRITE_ATTEMPTS = 2
+
+# columns a partial update may leave out but not set to null
+REQUIRED_UPDATE_FIELDS = ("title", "status", "priority")
+
+# loaded for every sparse fieldset: the key, the cursor sort key and the ETag version
+SPARSE_REQUIRED_FIELDS = ("uuid", "created_at", "version")
+
+
+def _select_tasks(fields: Sequence[str] | None) -> Select:
+    """select(Task), loading only `fields` (plus SPARSE_REQUIRED_FIELDS) when given."""
+    query = select(Task)
+    if fields is not None:
+        names = dict.fromkeys([*SPARSE_REQUIRED_FIELDS, *fields])
+        query = query.options(load_only(*(getattr(Task, name) for name in names), raiseload=True))
+    return query
+
+
+def get_task_by_uuid(session: Session, task_uuid: UUID, fields: Sequence[str] | None = None) -> Task:
+    """Get task by UUID, raises EntityNotFoundError if not found.
+
+    With `fields`, only those columns are loaded.
+    """
     task = session.execute(
-        select(Task).where(Task.uuid == task_uuid)
+        _select_tasks(fields).where(Task.uuid == task_uuid)
     ).scalar_one_or_none()
 
     if not task:
@@ -21,7 +94,19 @@ def get_task_by_uuid(session: Session, task_uuid: UUID) -> Task:
     return task
 
 
-def create_task(session: Session, task_data: TaskCreate, created_by: User) -> Task:
+def get_task_version(session: Session, task_uuid: UUID) -> int:
+    """Get only the row version of a task, raises EntityNotFoundError if not found."""
+    version = session.execute(
+        select(Task.version).where(Task.uuid == task_uuid)
+    ).scalar_one_or_none()
+
+    if version is None:
+        raise EntityNotFoundError("Task", str(task_uuid))
+
+    return version
+
+
+def create_task(session: Session, task_data: TaskCreate, created_by: User | Principal) -> Task:
     """Create a new task."""
     if task_data.priority < 1 or task_data.priority > 5:
         raise ValidationError("Priority must be between 1 and 5", field="priority")
@@ -37,18 +122,106 @@ def create_task(session: Session, task_data: TaskCreate, created_by: User) -> Ta
     )
 
     session.add(task)
+    task.revision = next_revision(session.connection())
+    deltas = StatDeltas()
+    deltas.add_task(task.status, task.priority, task.assigned_to, task.due_date)
+    apply_stat_deltas(session.connection(), deltas)
     session.commit()
     session.refresh(task)
 
+    get_task_list_cache().invalidate_task(task.status, task.assigned_to)
+
     return task
 
 
-def update_task(session: Session, task_uuid: UUID, task_data: TaskUpdate) -> Task:
-    """Update an existing task."""
-    task = get_task_by_uuid(session, task_uuid)
+@dataclass
+class BulkCreateResult:
+    """Outcome of a bulk create, errors are keyed by position in the input."""
+
+    created: list[UUID] = field(default_factory=list)
+    errors: dict[int, str] = field(default_factory=dict)
+
+
+def create_tasks_bulk(
+    session: Session,
+    items: Sequence[TaskCreate],
+    created_by: User | Principal,
+    batch_size: int = 1000,
+) -> BulkCreateResult:
+    """Create many tasks with batched multi-row inserts, one commit per batch.
+
+    Items that reference unknown assignees or fail to insert are reported in
+    the result instead of aborting the rest of the import.
+    """
+    result = BulkCreateResult()
+
+    assignees = {item.assigned_to for item in items if item.assigned_to}
+    known_users = set()
+    if assignees:
+        known_users = set(session.execute(select(User.uuid).where(User.uuid.in_(assignees))).scalars())
+
+    rows = []
+    for index, item in enumerate(items):
+        if item.assigned_to and item.assigned_to not in known_users:
+            result.errors[index] = f"User not found: {item.assigned_to}"
+            continue
+
+        rows.append((index, {
+            "uuid": uuid4(),
+            "title": item.title,
+            "description": item.description,
+            "status": item.status.value,
+            "priority": item.priority,
+            "due_date": item.due_date,
+            "created_by": created_by.uuid,
+            "assigned_to": item.assigned_to,
+        }))
+
+    for start in range(0, len(rows), batch_size):
+        _insert_task_batch(session, rows[start:start + batch_size], result)
+
+    return result
+
+
+def _insert_task_batch(
+    session: Session,
+    batch: list[tuple[int, dict[str, Any]]],
+    result: BulkCreateResult,
+) -> None:
+    """Insert one batch, retrying row by row to isolate failures."""
+    deltas = StatDeltas()
+    for _, row in batch:
+        deltas.add_task(row["status"], row["priority"], row["assigned_to"], row["due_date"])
+
+    try:
+        revision = next_revision(session.connection())
+        apply_stat_deltas(session.connection(), deltas)
+        session.execute(insert(Task), [{**row, "revision": revision} for _, row in batch])
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        if len(batch) == 1:
+            result.errors[batch[0][0]] = f"Could not insert task: {e.__class__.__name__}"
+            return
+        for item in batch:
+            _insert_task_batch(session, [item], result)
+        return
+
+    result.created.extend(row["uuid"] for _, row in batch)
+
+    cache = get_task_list_cache()
+    for status, assigned_to in {(row["status"], row["assigned_to"]) for _, row in batch}:
+        cache.invalidate_task(status, assigned_to)
 
+
+def _update_values(task_data: TaskUpdate) -> dict[str, Any]:
+    """Validate a partial update and return the column values to set."""
     update_data = task_data.model_dump(exclude_unset=True)
 
+    for name in REQUIRED_UPDATE_FIELDS:
+        if name in update_data and update_data[name] is None:
+            raise ValidationError(f"{name.capitalize()} cannot be null", field=name)
+
     if "priority" in update_data and update_data["priority"] is not None:
         if update_data["priority"] < 1 or update_data["priority"] > 5:
             raise ValidationError("Priority must be between 1 and 5", field="priority")
@@ -56,59 +229,373 @@ def update_task(session: Session, task_uuid: UUID, task_data: TaskUpdate) -> Tas
     if "status" in update_data and update_data["status"] is not None:
         update_data["status"] = update_data["status"].value
 
+    return update_data
+
+
+def _retry_stale(session: Session, task_uuid: UUID, write: Callable[[], T]) -> T:
+    """Run a single-task write, retrying on the freshly loaded row if another write bumped its version.
+
+    Raises ConflictError when every attempt lost the race.
+    """
+    for _ in range(STALE_WRITE_ATTEMPTS):
+        try:
+            return write()
+        except StaleDataError:
+            session.rollback()
+    raise ConflictError("Task", str(task_uuid))
+
+
+def update_task(session: Session, task_uuid: UUID, task_data: TaskUpdate) -> Task:
+    """Update an existing task.
+
+    A concurrent write to the same task makes the update reapply to the new
+    row once before giving up with ConflictError.
+    """
+    update_data = _update_values(task_data)
+    return _retry_stale(session, task_uuid, lambda: _update_task(session, task_uuid, update_data))
+
+
+def _update_task(session: Session, task_uuid: UUID, update_data: dict[str, Any]) -> Task:
+    task = get_task_by_uuid(session, task_uuid)
+    previous = (task.status, task.assigned_to)
+
+    deltas = StatDeltas()
+    deltas.add_task(task.status, task.priority, task.assigned_to, task.due_date, -1)
     for key, value in update_data.items():
         setattr(task, key, value)
+    deltas.add_task(task.status, task.priority, task.assigned_to, task.due_date)
 
+    task.revision = next_revision(session.connection())
+    apply_stat_deltas(session.connection(), deltas)
     session.commit()
     session.refresh(task)
 
+    cache = get_task_list_cache()
+    cache.invalidate_task(*previous)
+    cache.invalidate_task(task.status, task.assigned_to)
+
     return task
 
 
 def delete_task(session: Session, task_uuid: UUID) -> None:
-    """Delete a task."""
+    """Delete a task, retrying once if a concurrent write changed it first."""
+    _retry_stale(session, task_uuid, lambda: _delete_task(session, task_uuid))
+
+
+def _delete_task(session: Session, task_uuid: UUID) -> None:
     task = get_task_by_uuid(session, task_uuid)
+    previous = (task.status, task.assigned_to)
+
+    deltas = StatDeltas()
+    deltas.add_task(task.status, task.priority, task.assigned_to, task.due_date, -1)
+
+    session.add(TaskTombstone(uuid=task.uuid, revision=next_revision(session.connection())))
+    apply_stat_deltas(session.connection(), deltas)
     session.delete(task)
     session.commit()
 
+    get_task_list_cache().invalidate_task(*previous)
 
-def get_tasks(
+
+def _require_bulk_filters(
+    status_filter: TaskStatus | None,
+    assigned_to: UUID | None,
+) -> list[ColumnElement[bool]]:
+    """Return filter criteria, refusing to touch every task at once."""
+    filters = _task_filters(status_filter, assigned_to)
+    if not filters:
+        raise ValidationError("At least one filter is required for bulk operations")
+    return filters
+
+
+def update_tasks(
     session: Session,
-    pagination: PaginationParams,
+    task_data: TaskUpdate,
     status_filter: TaskStatus | None = None,
     assigned_to: UUID | None = None,
-) -> PaginatedData[Task]:
-    """Get paginated tasks with optional filters."""
-    query = select(Task)
+    dry_run: bool = False,
+) -> int:
+    """Apply one partial update to all matching tasks, returns the affected count."""
+    filters = _require_bulk_filters(status_filter, assigned_to)
 
-    # apply filters
-    if status_filter:
-        query = query.where(Task.status == status_filter.value)
+    update_data = _update_values(task_data)
+    if not update_data:
+        raise ValidationError("No fields to update")
 
-    if assigned_to:
-        query = query.where(Task.assigned_to == assigned_to)
+    if dry_run:
+        return count_tasks(session, status_filter, assigned_to)
+
+    # grouped under the revision lock, so no other writer changes the matching tasks in between
+    revision = next_revision(session.connection())
+
+    # every matching task gets the same new values, so each group moves as a whole
+    deltas = StatDeltas()
+    for status, priority, assignee, due_day, count in grouped_tasks(session.connection(), filters):
+        deltas.add_task(status, priority, assignee, due_day, -count)
+        deltas.add_task(
+            update_data.get("status", status),
+            update_data.get("priority", priority),
+            update_data.get("assigned_to", assignee),
+            update_data.get("due_date", due_day),
+            count,
+        )
+
+    apply_stat_deltas(session.connection(), deltas)
+    result = session.execute(
+        update(Task).where(*filters).values(**update_data, version=Task.version + 1, revision=revision),
+        execution_options={"synchronize_session": False},
+    )
+    session.commit()
+
+    get_task_list_cache().invalidate_all()
 
-    # count total
-    count_query = select(Task)
+    return result.rowcount
+
+
+def delete_tasks(
+    session: Session,
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+    dry_run: bool = False,
+) -> int:
+    """Delete all matching tasks, returns the affected count."""
+    filters = _require_bulk_filters(status_filter, assigned_to)
+
+    if dry_run:
+        return count_tasks(session, status_filter, assigned_to)
+
+    # grouped under the revision lock, so no other writer changes the matching tasks in between
+    revision = next_revision(session.connection())
+
+    deltas = StatDeltas()
+    for status, priority, assignee, due_day, count in grouped_tasks(session.connection(), filters):
+        deltas.add_task(status, priority, assignee, due_day, -count)
+
+    apply_stat_deltas(session.connection(), deltas)
+    add_tombstones(session.connection(), select(Task.uuid).where(*filters), revision)
+    result = session.execute(
+        delete(Task).where(*filters),
+        execution_options={"synchronize_session": False},
+    )
+    session.commit()
+
+    get_task_list_cache().invalidate_all()
+
+    return result.rowcount
+
+
+def get_task_stats(session: Session, now: datetime | None = None) -> TaskStatsResponse:
+    """Task counts by status, priority and assignee, plus overdue open tasks.
+
+    Served from the task_stat counters, so the cost does not grow with the
+    number of tasks.
+    """
+    connection = session.connection()
+    stats = read_task_stats(connection)
+    by_assignee = stats[ASSIGNEE]
+    unassigned = by_assignee.pop(UNASSIGNED, 0)
+
+    return TaskStatsResponse(
+        total=sum(stats[STATUS].values()),
+        by_status={status.value: stats[STATUS].get(status.value, 0) for status in TaskStatus},
+        by_priority={priority: stats[PRIORITY].get(str(priority), 0) for priority in range(1, 6)},
+        by_assignee={UUID(key): count for key, count in by_assignee.items()},
+        unassigned=unassigned,
+        overdue=count_overdue(connection, stats[DUE], now or datetime.now()),
+    )
+
+
+@dataclass
+class TaskChanges:
+    """One page of task changes after a revision, oldest first."""
+
+    changed: list[Task]
+    deleted: list[UUID]
+    revision: int
+    has_more: bool
+    next_cursor: str | None
+
+
+def get_task_changes(session: Session, since: int, limit: int, cursor: str | None = None) -> TaskChanges:
+    """Tasks written and deleted after revision `since`, paged by (revision, uuid).
+
+    A bulk write gives many tasks one revision, so a page can end inside a
+    revision; `cursor` resumes from there and takes precedence over `since`.
+    """
+    after = None
+    if cursor:
+        try:
+            since, after = decode_revision_cursor(cursor)
+        except ValueError:
+            raise ValidationError("Invalid cursor", field="cursor")
+
+    # one statement, so tasks and tombstones come from the same snapshot; two
+    # reads could miss a write committed between them for good
+    entries = union_all(
+        select(Task.revision, Task.uuid, literal(False).label("deleted")).where(
+            changed_after(Task.revision, Task.uuid, since, after)
+        ),
+        select(TaskTombstone.revision, TaskTombstone.uuid, literal(True)).where(
+            changed_after(TaskTombstone.revision, TaskTombstone.uuid, since, after)
+        ),
+    ).subquery()
+    rows = session.execute(select(entries).order_by(entries.c.revision, entries.c.uuid).limit(limit + 1)).all()
+    page = rows[:limit]
+    has_more = len(rows) > limit
+
+    # a task deleted since the read above is skipped here; its tombstone has a later revision
+    changed = [uuid for _, uuid, deleted in page if not deleted]
+    tasks = {task.uuid: task for task in session.execute(select(Task).where(Task.uuid.in_(changed))).scalars()}
+
+    return TaskChanges(
+        changed=[tasks[uuid] for uuid in changed if uuid in tasks],
+        deleted=[uuid for _, uuid, deleted in page if deleted],
+        revision=page[-1][0] if page else since,
+        has_more=has_more,
+        next_cursor=encode_revision_cursor(*page[-1][:2]) if has_more else None,
+    )
+
+
+def _task_filters(
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+) -> list[ColumnElement[bool]]:
+    """Build WHERE criteria shared by the task list and count queries."""
+    filters = []
     if status_filter:
-        count_query = count_query.where(Task.status == status_filter.value)
+        filters.append(Task.status == status_filter.value)
     if assigned_to:
-        count_query = count_query.where(Task.assigned_to == assigned_to)
+        filters.append(Task.assigned_to == assigned_to)
+    return filters
+
 
-    total = len(list(session.execute(count_query).scalars().all()))
+def _search_matches(session: Session, search: str) -> Subquery:
+    """Full-text matches for `search` as a (uuid, rank) subquery."""
+    matches = search_subquery(session.get_bind().dialect.name, search)
+    if matches is None:
+        raise ValidationError("Search query must contain at least one word", field="q")
+    return matches
 
-    # apply sorting
+
+def count_tasks(
+    session: Session,
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+) -> int:
+    """Count tasks matching the filters in the database."""
+    query = select(func.count()).select_from(Task).where(*_task_filters(status_filter, assigned_to))
+
+    if search is not None:
+        matches = _search_matches(session, search)
+        query = query.join(matches, matches.c.uuid == Task.uuid)
+
+    return session.execute(query).scalar_one()
+
+
+def get_tasks(
+    session: Session,
+    pagination: PaginationParams,
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+    fields: Sequence[str] | None = None,
+) -> PaginatedData[Task]:
+    """Get paginated tasks with optional filters.
+
+    With `search`, only full-text matches are returned, best match first.
+    With `fields`, only those columns are loaded.
+    """
+    filters = _task_filters(status_filter, assigned_to)
+    query = _select_tasks(fields).where(*filters)
+
+    # apply sorting, uuid breaks ties so the order is total
     order_func = asc if pagination.sort_order == "asc" else desc
-    query = query.order_by(order_func(Task.created_at))
+    if search is not None:
+        if pagination.cursor:
+            raise ValidationError("Cursor pagination is not supported with a search query", field="cursor")
+        matches = _search_matches(session, search)
+        query = query.join(matches, matches.c.uuid == Task.uuid).order_by(matches.c.rank, Task.uuid)
+    else:
+        query = query.order_by(order_func(Task.created_at), order_func(Task.uuid))
+
+    # apply pagination, seeking past the cursor key instead of skipping rows
+    if pagination.cursor:
+        try:
+            cursor_created_at, cursor_uuid = decode_cursor(pagination.cursor)
+        except ValueError:
+            raise ValidationError("Invalid cursor", field="cursor")
 
-    # apply pagination
-    query = query.offset(pagination.offset).limit(pagination.limit)
+        sort_key = tuple_(Task.created_at, Task.uuid)
+        if pagination.sort_order == "asc":
+            query = query.where(sort_key > tuple_(cursor_created_at, cursor_uuid))
+        else:
+            query = query.where(sort_key < tuple_(cursor_created_at, cursor_uuid))
+    else:
+        query = query.offset(pagination.offset)
 
-    results = list(session.execute(query).scalars().all())
+    # fetch one extra row to know whether another page follows
+    rows = list(session.execute(query.limit(pagination.limit + 1)).scalars().all())
+    results = rows[: pagination.limit]
+    has_next = has_next_page(pagination.offset + len(rows), pagination.offset, pagination.limit)
+
+    # search pages are ranked, not ordered by the cursor key, so they page by offset only
+    next_cursor = None
+    if has_next and search is None:
+        next_cursor = encode_cursor(results[-1].created_at, results[-1].uuid)
+
+    # count total, unless the page itself already tells us
+    total = None
+    if pagination.include_total:
+        if not pagination.cursor and not has_next and (results or pagination.offset == 0):
+            total = pagination.offset + len(results)
+        else:
+            total = count_tasks(session, status_filter, assigned_to, search)
 
     return PaginatedData(
         total=total,
-        offset=pagination.offset,
+        offset=0 if pagination.cursor else pagination.offset,
         limit=pagination.limit,
         results=results,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
+
+
+def export_query(
+    session: Session,
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+    sort_order: Literal["asc", "desc"] = "asc",
+    search: str | None = None,
+) -> Select:
+    """Query selecting every matching task row as plain columns, for export."""
+    order_func = asc if sort_order == "asc" else desc
+    query = (
+        select(Task.__table__)
+        .where(*_task_filters(status_filter, assigned_to))
+        .order_by(order_func(Task.created_at), order_func(Task.uuid))
     )
+
+    if search is not None:
+        query = query.where(Task.uuid.in_(select(_search_matches(session, search).c.uuid)))
+
+    return query
+
+
+def iter_tasks(
+    session: Session,
+    status_filter: TaskStatus | None = None,
+    assigned_to: UUID | None = None,
+    sort_order: Literal["asc", "desc"] = "asc",
+    search: str | None = None,
+    batch_size: int = 1000,
+) -> Iterator[RowMapping]:
+    """Stream every matching task row, fetching `batch_size` rows at a time.
+
+    Rows come from a server-side cursor as plain mappings rather than ORM
+    objects, so memory stays flat no matter how many rows match.
+    """
+    query = export_query(session, status_filter, assigned_to, sort_order, search)
+    result = session.execute(query, execution_options={"yield_per": batch_size, "stream_results": True})
+    return result.mappings()
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from project.db.models.user import User, UserCreate
@@ -48,6 +48,12 @@ def create_user(session: Session, user_data: UserCreate) -> User:
     return user
 
 
+def update_password_hash(session: Session, user_uuid: UUID, password_hash: str) -> None:
+    """Replace a user's stored password hash."""
+    session.execute(update(User).where(User.uuid == user_uuid).values(password_hash=password_hash))
+    session.commit()
+
+
 def get_all_users(session: Session) -> list[User]:
     """Get all users."""
     result = session.execute(select(User))
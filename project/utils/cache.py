@@ -0,0 +1,148 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Point-in-time counters of a cache backend."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class CacheBackend(ABC):
+    """Key/value store used for response caching.
+
+    Implementations for shared caches (Redis, memcached, ...) must make
+    `incr` atomic and must not evict counters, since cache keys embed
+    counter values to invalidate entries.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, expiring after `ttl` seconds if given."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+
+    @abstractmethod
+    def counter(self, key: str) -> int:
+        """Return the current value of a counter, 0 if it was never incremented."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter and return its new value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every value and counter."""
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters."""
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe in-process cache bounded by entry count and TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return value
+                del self._entries[key]
+
+            self._stats.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+            )
+
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing, used when caching is disabled."""
+
+    def __init__(self) -> None:
+        self._misses = 0
+
+    def get(self, key: str) -> Any | None:
+        self._misses += 1
+        return None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def counter(self, key: str) -> int:
+        return 0
+
+    def incr(self, key: str) -> int:
+        return 0
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> CacheStats:
+        return CacheStats(misses=self._misses)
@@ -0,0 +1,24 @@
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+
+def make_etag(parts: Iterable[Any]) -> str:
+    """Build a strong ETag from values that together identify a representation."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag.removeprefix("W/") in {candidate.removeprefix("W/") for candidate in candidates}
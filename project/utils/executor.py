@@ -0,0 +1,86 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import ParamSpec, TypeVar
+
+from project.exceptions import ServiceUnavailableError
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    workers: int
+    max_queue: int
+    running: int = 0
+    queued: int = 0
+    completed: int = 0
+    rejected: int = 0
+
+
+class BoundedExecutor:
+    """Runs blocking calls on a dedicated pool with a bounded queue.
+
+    At most ``workers`` calls run at once and at most ``max_queue`` more wait
+    for a worker; beyond that ``run`` raises ServiceUnavailableError at once
+    instead of piling work onto a shared threadpool.
+    """
+
+    def __init__(self, workers: int, max_queue: int, processes: bool = False, name: str = "bounded") -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if max_queue < 0:
+            raise ValueError("max_queue cannot be negative")
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if processes
+            else ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise ServiceUnavailableError("Too many concurrent requests, try again shortly")
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run `fn` on the pool, raising ServiceUnavailableError when saturated."""
+        self._acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        # released when the work finishes, even if the awaiting request was cancelled
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            running = min(self._in_flight, self.workers)
+            return ExecutorStats(
+                workers=self.workers,
+                max_queue=self.max_queue,
+                running=running,
+                queued=self._in_flight - running,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,52 @@
+import csv
+import io
+import zlib
+from collections.abc import Iterable, Iterator
+
+from pydantic import BaseModel
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def ndjson_chunks(items: Iterable[BaseModel], chunk_size: int = 500) -> Iterator[bytes]:
+    """Serialize models as newline-delimited JSON, one chunk per `chunk_size` rows."""
+    buffer: list[str] = []
+    for item in items:
+        buffer.append(item.model_dump_json())
+        if len(buffer) >= chunk_size:
+            yield ("\n".join(buffer) + "\n").encode("utf-8")
+            buffer.clear()
+
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode("utf-8")
+
+
+def csv_chunks(items: Iterable[BaseModel], fieldnames: list[str], chunk_size: int = 500) -> Iterator[bytes]:
+    """Serialize models as CSV with a header row, one chunk per `chunk_size` rows."""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    writer.writeheader()
+
+    for count, item in enumerate(items, start=1):
+        writer.writerow(item.model_dump(mode="json"))
+        if count % chunk_size == 0:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate()
+
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
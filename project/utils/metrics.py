@@ -0,0 +1,245 @@
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from project.config import get_settings
+
+# seconds; the last bucket (+Inf) is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+# (name, type, help, labels as (name, value) pairs, value)
+Sample = tuple[str, str, str, tuple[tuple[str, str], ...], float]
+
+
+class Histogram:
+    """Per-bucket counts (not cumulative until rendered) and the sum of observations."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+    def merge(self, counts: list[int], total: float) -> None:
+        self.counts = [a + b for a, b in zip(self.counts, counts)]
+        self.sum += total
+
+
+class Metrics:
+    """HTTP request metrics for one process.
+
+    Updates happen only on the event loop thread, so plain dict and list
+    updates need no locking. Series are keyed by tuples of label values, and
+    the label names are added only when rendering.
+
+    With `multiproc_dir`, every worker writes a snapshot to `<dir>/<pid>.json`
+    every `flush_interval` seconds from a background task (see
+    `flush_periodically`), and on every scrape. A scrape of any worker merges
+    all of the files. Counters from workers that have
+    exited are kept, while their gauges are dropped. Clear the directory when
+    the server starts.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        multiproc_dir: str | None = None,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.buckets = buckets
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self.in_flight = 0
+        self.requests: dict[tuple[str, str, int], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+
+    def observe(self, method: str, route: str, status_code: int, duration: float) -> None:
+        key = (method, route, status_code)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        histogram = self.latency.get((method, route))
+        if histogram is None:
+            histogram = self.latency[(method, route)] = Histogram(len(self.buckets) + 1)
+        histogram.counts[bisect_left(self.buckets, duration)] += 1
+        histogram.sum += duration
+
+    def snapshot(self, gauges: list[Sample]) -> dict[str, Any]:
+        gauges = [*self._own_gauges(), *gauges]
+        return {
+            "pid": os.getpid(),
+            "requests": [[*key, count] for key, count in self.requests.items()],
+            "latency": [[*key, histogram.counts, histogram.sum] for key, histogram in self.latency.items()],
+            "gauges": [
+                [name, kind, help, [list(label) for label in labels], value]
+                for name, kind, help, labels, value in gauges
+            ],
+        }
+
+    async def flush_periodically(self, collect_gauges: Callable[[], list[Sample]]) -> None:
+        """Write this worker's snapshot every `flush_interval` until cancelled, and once more then.
+
+        The snapshot is taken on the event loop, where the metrics are
+        updated, and written to disk from a worker thread.
+        """
+        if self.multiproc_dir is None:
+            return
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await run_in_threadpool(self._write_snapshot, self.snapshot(collect_gauges()))
+        finally:
+            self.flush(collect_gauges())
+
+    def flush(self, gauges: list[Sample]) -> None:
+        self._write_snapshot(self.snapshot(gauges))
+
+    def _write_snapshot(self, snapshot: dict[str, Any]) -> None:
+        path = os.path.join(self.multiproc_dir, f"{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
+    def render(self, gauges: list[Sample]) -> str:
+        """Prometheus text exposition of this process, or of all workers in multiprocess mode."""
+        if self.multiproc_dir is None:
+            return render(self._samples(self.requests, self.latency, [*self._own_gauges(), *gauges]))
+
+        self.flush(gauges)
+        requests: dict[tuple[str, str, int], int] = {}
+        latency: dict[tuple[str, str], Histogram] = {}
+        merged_gauges: dict[tuple[str, str, str, tuple], float] = {}
+        for snapshot in self._read_snapshots():
+            for method, route, status_code, count in snapshot["requests"]:
+                key = (method, route, status_code)
+                requests[key] = requests.get(key, 0) + count
+            for method, route, counts, total in snapshot["latency"]:
+                latency.setdefault((method, route), Histogram(len(self.buckets) + 1)).merge(counts, total)
+            if not pid_alive(snapshot["pid"]):
+                continue
+            for name, kind, help, labels, value in snapshot["gauges"]:
+                key = (name, kind, help, tuple(tuple(label) for label in labels))
+                merged_gauges[key] = merged_gauges.get(key, 0) + value
+
+        gauges = [(*key, value) for key, value in merged_gauges.items()]
+        return render(self._samples(requests, latency, gauges))
+
+    def _own_gauges(self) -> list[Sample]:
+        return [("http_requests_in_flight", "gauge", "Requests being handled.", (), self.in_flight)]
+
+    def _read_snapshots(self) -> Iterable[dict[str, Any]]:
+        for name in os.listdir(self.multiproc_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.multiproc_dir, name)) as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    def _samples(
+        self,
+        requests: dict[tuple[str, str, int], int],
+        latency: dict[tuple[str, str], Histogram],
+        gauges: list[Sample],
+    ) -> list[Sample]:
+        samples: list[Sample] = []
+        for (method, route, status_code), count in sorted(requests.items()):
+            labels = (("method", method), ("route", route), ("status", str(status_code)))
+            samples.append(("http_requests_total", "counter", "Requests handled.", labels, count))
+
+        bounds = [*(repr(bound) for bound in self.buckets), "+Inf"]
+        duration_help = "Request latency by route template."
+        for (method, route), histogram in sorted(latency.items()):
+            labels = (("method", method), ("route", route))
+            cumulative = 0
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                bucket = ("http_request_duration_seconds_bucket", "histogram", duration_help, (*labels, ("le", bound)))
+                samples.append((*bucket, cumulative))
+            samples.append(("http_request_duration_seconds_sum", "histogram", duration_help, labels, histogram.sum))
+            samples.append(("http_request_duration_seconds_count", "histogram", duration_help, labels, cumulative))
+
+        return samples + sorted(gauges, key=lambda sample: sample[0])
+
+
+def pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def render(samples: list[Sample]) -> str:
+    """Prometheus text format (version 0.0.4); samples of one family must be adjacent."""
+    lines = []
+    family = None
+    for name, kind, help, labels, value in samples:
+        base = name.removesuffix("_bucket").removesuffix("_sum").removesuffix("_count") if kind == "histogram" else name
+        if base != family:
+            family = base
+            lines.append(f"# HELP {base} {help}")
+            lines.append(f"# TYPE {base} {kind}")
+        if labels:
+            label_text = ",".join(f'{key}="{escape(value)}"' for key, value in labels)
+            lines.append(f"{name}{{{label_text}}} {value}")
+        else:
+            lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+@lru_cache
+def get_metrics() -> Metrics:
+    """Process-wide request metrics, configured from settings."""
+    settings = get_settings()
+    return Metrics(multiproc_dir=settings.METRICS_MULTIPROC_DIR, flush_interval=settings.METRICS_FLUSH_SECONDS)
+
+
+class MetricsMiddleware:
+    """Count requests and observe their latency, labelled by route template."""
+
+    def __init__(self, app: ASGIApp, metrics: Metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            route = scope.get("route")
+            route_path = route.path if route is not None else UNMATCHED_ROUTE
+            metrics.observe(scope["method"], route_path, status_code, time.perf_counter() - start)
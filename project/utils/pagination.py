@@ -1,5 +1,10 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Generic, Literal, Sequence, TypeVar
+from uuid import UUID
 
 from fastapi import Query
 from pydantic import BaseModel, Field
@@ -11,10 +16,12 @@ T = TypeVar("T")
 class PaginatedData(Generic[T]):
     """Container for paginated query results."""
 
-    total: int
+    total: int | None
     offset: int
     limit: int
     results: Sequence[T]
+    has_next: bool = False
+    next_cursor: str | None = None
 
 
 class PaginationParams(BaseModel):
@@ -23,24 +30,76 @@ class PaginationParams(BaseModel):
     limit: int = Field(default=10, gt=0, le=100)
     offset: int = Field(default=0, ge=0)
     sort_order: Literal["asc", "desc"] = "asc"
+    cursor: str | None = None
+    include_total: bool = True
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response for API endpoints."""
 
-    total: int
+    total: int | None
     offset: int
     limit: int
     results: list[T]
+    has_next: bool = False
+    next_cursor: str | None = None
 
 
 def get_pagination_params(
     limit: int = Query(default=10, gt=0, le=100, description="Items per page"),
     offset: int = Query(default=0, ge=0, description="Items to skip"),
     sort_order: Literal["asc", "desc"] = Query(default="asc", description="Sort order"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+    include_total: bool = Query(default=True, description="Count all matching items"),
 ) -> PaginationParams:
     """FastAPI dependency for pagination parameters."""
-    return PaginationParams(limit=limit, offset=offset, sort_order=sort_order)
+    return PaginationParams(
+        limit=limit,
+        offset=offset,
+        sort_order=sort_order,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+def _encode_key(key: list) -> str:
+    raw = json.dumps(key, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_key(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(created_at: datetime, uuid: UUID) -> str:
+    """Encode a (created_at, uuid) sort key into an opaque cursor."""
+    return _encode_key([created_at.isoformat(), uuid.hex])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode an opaque cursor, raises ValueError if it is malformed."""
+    try:
+        created_at, uuid = _decode_key(cursor)
+        return datetime.fromisoformat(created_at), UUID(uuid)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_revision_cursor(revision: int, uuid: UUID) -> str:
+    """Encode a (revision, uuid) sort key into an opaque cursor."""
+    return _encode_key([revision, uuid.hex])
+
+
+def decode_revision_cursor(cursor: str) -> tuple[int, UUID]:
+    """Decode an opaque revision cursor, raises ValueError if it is malformed."""
+    try:
+        revision, uuid = _decode_key(cursor)
+        if not isinstance(revision, int):
+            raise TypeError("revision must be an integer")
+        return revision, UUID(uuid)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
 
 
 def calculate_total_pages(total: int, limit: int) -> int:
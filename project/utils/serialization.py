@@ -0,0 +1,31 @@
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+
+T = TypeVar("T")
+
+
+class JSONBytesResponse(Response):
+    """A response whose body is already encoded JSON."""
+
+    media_type = "application/json"
+
+
+def encode_json(adapter: TypeAdapter[T], value: Any) -> bytes:
+    """Validate ORM objects, rows or dicts against `adapter` and encode them, in one pydantic-core pass.
+
+    Returning the bytes in a JSONBytesResponse also skips FastAPI's second
+    validation and serialization through ``response_model``, which routes
+    keep declaring for the OpenAPI schema.
+    """
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def loaded_values(instance: Any) -> dict[str, Any]:
+    """Loaded attribute values of an ORM instance, read without going through attribute instrumentation.
+
+    Expired or deferred attributes are missing, rather than loaded on access.
+    """
+    return inspect(instance).dict
@@ -0,0 +1,171 @@
+import functools
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("project.timing")
+
+
+@dataclass
+class RequestTimings:
+    """Where one request spent its time; durations are in seconds."""
+
+    spans: dict[str, float] = field(default_factory=dict)
+    db_queries: int = 0
+    db_time: float = 0.0
+    endpoint_finished: float | None = None
+
+    def add(self, name: str, duration: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + duration
+
+    def as_dict(self, total: float) -> dict[str, Any]:
+        """Durations in milliseconds, as logged."""
+        return {
+            "total_ms": round(total * 1000, 2),
+            "db_queries": self.db_queries,
+            "db_ms": round(self.db_time * 1000, 2),
+            **{f"{name}_ms": round(duration * 1000, 2) for name, duration in self.spans.items()},
+        }
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing header value (durations overlap: auth and endpoint include their queries)."""
+        entries = [f'db;dur={self.db_time * 1000:.2f};desc="{self.db_queries} queries"']
+        entries += [f"{name};dur={duration * 1000:.2f}" for name, duration in self.spans.items()]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    """Timings of the request being handled, or None outside the timing middleware."""
+    return _current.get()
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add the duration of the block to the current request's `name` span."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timings = _current.get()
+    if timings is not None and conn.info.get("query_start"):
+        timings.db_queries += 1
+        timings.db_time += time.perf_counter() - conn.info["query_start"].pop()
+
+
+def instrument_engines() -> None:
+    """Count statements and their time on every engine, including the sync side of async engines."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class TimedRoute(APIRoute):
+    """Route that records endpoint time, so the middleware can tell serialization apart.
+
+    Everything between the endpoint returning and the response starting is
+    FastAPI validating and rendering the return value.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timings = _current.get()
+        if timings is None:
+            return await endpoint(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            timings.endpoint_finished = time.perf_counter()
+            timings.add("endpoint", timings.endpoint_finished - start)
+
+    return wrapper
+
+
+class TimingMiddleware:
+    """Time each HTTP request and log where the time went.
+
+    With `header=True` the breakdown is also sent as a Server-Timing header,
+    which shows up in browser dev tools; it is off by default because it
+    reveals internals to clients.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = False) -> None:
+        self.app = app
+        self.header = header
+        instrument_engines()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                now = time.perf_counter()
+                if timings.endpoint_finished is not None:
+                    timings.add("serialize", now - timings.endpoint_finished)
+                if self.header:
+                    MutableHeaders(scope=message).append("Server-Timing", timings.server_timing(now - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            total = time.perf_counter() - start
+            logger.info(
+                "%s %s %s %.1fms db=%d/%.1fms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                total * 1000,
+                timings.db_queries,
+                timings.db_time * 1000,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "timings": timings.as_dict(total),
+                },
+            )
@@ -7,14 +7,23 @@ from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session
 
-from project.config import Settings
+from project.config import Settings, get_settings
+from project.db.db import get_db_session
 from project.db.models.base import Base
 from project.db.models.task import Task, TaskStatus
 from project.db.models.user import Role, User
+from project.dependencies import get_read_db_session
+from project.main import create_app
 from project.security import encrypt_password
+from project.services.auth_service import create_user_token
+
+# fixtures hash passwords with the fast test scheme instead of bcrypt
+os.environ.setdefault("PASSWORD_HASH_SCHEME", "test")
+get_settings.cache_clear()
 
 # =============================================================================
 # UNIT TEST FIXTURES (no database, mocks only)
@@ -100,6 +109,19 @@ def create_test_engine() -> Engine:
     return engine
 
 
+def create_test_client(settings: Settings, session: Session, user: User) -> TestClient:
+    """App client that authenticates as `user` and runs every request on `session`."""
+    app = create_app(settings)
+
+    def override_session():
+        yield session
+
+    app.dependency_overrides[get_db_session] = override_session
+    app.dependency_overrides[get_read_db_session] = override_session
+    token = create_user_token(user).access_token
+    return TestClient(app, headers={"Authorization": f"Bearer {token}"})
+
+
 def setup_test_database(engine: Engine) -> None:
     """Create all tables in the test database."""
     Base.metadata.create_all(bind=engine)
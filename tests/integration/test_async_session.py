@@ -0,0 +1,56 @@
+"""Integration tests for the async database path."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from project.db.db import run_in_session
+from project.db.models.task import Task
+from project.db.models.user import User
+from project.exceptions import EntityNotFoundError
+from project.services import async_user_service, task_service
+from project.utils.pagination import PaginationParams
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+
+def run_async(db_session: Session, fn):
+    """Run `fn(async_session)` against the test database through aiosqlite."""
+    url = db_session.get_bind().url.set(drivername="sqlite+aiosqlite")
+
+    async def main():
+        engine = create_async_engine(url)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.integration
+class TestAsyncSession:
+    """Services run unchanged on an AsyncSession via run_in_session."""
+
+    def test_get_user_by_username(self, db_session: Session, created_user: User):
+        user = run_async(db_session, lambda s: async_user_service.get_user_by_username(s, "testuser"))
+
+        assert user.uuid == created_user.uuid
+
+    def test_get_user_by_username_not_found(self, db_session: Session):
+        with pytest.raises(EntityNotFoundError):
+            run_async(db_session, lambda s: async_user_service.get_user_by_username(s, "nobody"))
+
+    def test_run_in_session_async(self, db_session: Session, created_task: Task):
+        page = run_async(db_session, lambda s: run_in_session(s, task_service.get_tasks, PaginationParams()))
+
+        assert [task.uuid for task in page.results] == [created_task.uuid]
+
+    def test_run_in_session_sync(self, db_session: Session, created_task: Task):
+        task = asyncio.run(run_in_session(db_session, task_service.get_task_by_uuid, created_task.uuid))
+
+        assert task.title == created_task.title
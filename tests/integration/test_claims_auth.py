@@ -0,0 +1,82 @@
+"""Integration tests for claims-only authentication."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+import project.dependencies as dependencies
+from project.config import Settings
+from project.db.models.user import Role, User
+from project.security import Principal, TokenPayload, create_access_token
+from project.services import auth_service
+from tests.conftest import create_test_client
+
+
+@pytest.fixture
+def claims_mode():
+    """A fresh principal cache for claims mode."""
+    auth_service.get_principal_cache.cache_clear()
+    yield
+    auth_service.get_principal_cache.cache_clear()
+
+
+def resolve(token: str, session: Session):
+    return asyncio.run(dependencies.resolve_user(token, session, "claims"))
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("claims_mode")
+class TestClaimsAuth:
+    """Claims mode trusts the token and re-checks the user only on cache misses."""
+
+    def test_returns_principal_from_claims(self, db_session: Session, created_user: User):
+        token = auth_service.create_user_token(created_user).access_token
+
+        principal = resolve(token, db_session)
+
+        assert principal == Principal(uuid=created_user.uuid, username="testuser", role=Role.USER.value)
+
+    def test_cached_principal_skips_user_query(self, db_session: Session, created_user: User):
+        token = auth_service.create_user_token(created_user).access_token
+
+        with patch.object(auth_service, "get_user_by_username", wraps=auth_service.get_user_by_username) as lookup:
+            resolve(token, db_session)
+            resolve(token, db_session)
+
+        assert lookup.call_count == 1
+
+    def test_role_change_revokes_token(self, db_session: Session, created_user: User):
+        token = auth_service.create_user_token(created_user).access_token
+        created_user.role = Role.ADMIN.value
+        db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            resolve(token, db_session)
+
+        assert exc_info.value.status_code == 401
+
+    def test_deleted_user_is_rejected(self, db_session: Session, created_user: User):
+        token = auth_service.create_user_token(created_user).access_token
+        db_session.delete(created_user)
+        db_session.commit()
+
+        with pytest.raises(HTTPException):
+            resolve(token, db_session)
+
+    def test_token_without_claims_is_rejected(self, db_session: Session, created_user: User):
+        token = create_access_token(TokenPayload(username="testuser", role="", user_uuid="not-a-uuid"))
+
+        with pytest.raises(HTTPException):
+            resolve(token.access_token, db_session)
+
+    def test_app_settings_select_claims_mode(self, test_settings: Settings, db_session: Session, created_user: User):
+        client = create_test_client(test_settings.model_copy(update={"AUTH_MODE": "claims"}), db_session, created_user)
+
+        with patch.object(auth_service, "get_user_by_username", wraps=auth_service.get_user_by_username) as lookup:
+            assert client.get("/tasks").status_code == 200
+            assert client.get("/tasks").status_code == 200
+
+        assert lookup.call_count == 1
@@ -0,0 +1,33 @@
+"""Integration tests for engine pool settings and SQLite pragmas."""
+
+import pytest
+from sqlalchemy import text
+
+from project.config import Settings
+from project.db.db import engine_options, get_engine
+
+
+@pytest.mark.integration
+class TestEngineTuning:
+    """get_engine applies pool settings and per-connection SQLite pragmas."""
+
+    def test_pragmas_applied_on_connect(self, tmp_path):
+        engine = get_engine(Settings(DB_URL=f"sqlite:///{tmp_path / 'app.db'}", SQLITE_BUSY_TIMEOUT_MS=1234))
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        engine.dispose()
+
+    def test_pool_settings_applied(self, tmp_path):
+        engine = get_engine(Settings(DB_URL=f"sqlite:///{tmp_path / 'app.db'}", DB_POOL_SIZE=7, DB_POOL_TIMEOUT=2.5))
+
+        assert engine.pool.size() == 7
+        assert engine.pool._timeout == 2.5
+        engine.dispose()
+
+    def test_memory_sqlite_skips_pool_options(self, test_settings: Settings):
+        assert engine_options(test_settings, test_settings.DB_URL) == {}
+        get_engine(test_settings).dispose()
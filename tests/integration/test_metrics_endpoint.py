@@ -0,0 +1,42 @@
+"""Integration tests for the /metrics endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from project.config import Settings
+from project.main import create_app
+from project.utils.metrics import get_metrics
+
+
+@pytest.fixture
+def client(test_settings: Settings) -> TestClient:
+    get_metrics.cache_clear()
+    yield TestClient(create_app(test_settings))
+    get_metrics.cache_clear()
+
+
+@pytest.mark.integration
+class TestMetricsEndpoint:
+    """/metrics exposes request metrics labelled by route template, plus runtime gauges."""
+
+    def test_labels_by_route_template(self, client: TestClient):
+        client.get("/tasks/00000000-0000-0000-0000-000000000000")
+        client.get("/no-such-page")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_requests_total{method="GET",route="/tasks/{task_uuid}",status="401"} 1' in response.text
+        assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in response.text
+
+    def test_runtime_gauges(self, client: TestClient):
+        text = client.get("/metrics").text
+
+        assert "http_requests_in_flight 1" in text
+        assert "password_hash_queued 0" in text
+
+    def test_disabled(self, test_settings: Settings):
+        client = TestClient(create_app(test_settings.model_copy(update={"METRICS_ENABLED": False})))
+
+        assert client.get("/metrics").status_code == 404
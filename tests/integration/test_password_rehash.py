@@ -0,0 +1,55 @@
+"""Integration tests for rehashing passwords on login."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import project.security as security
+from project.config import Settings
+from project.db.models.user import User
+from project.services.auth_service import authenticate_user, authenticate_user_async
+
+
+@pytest.fixture
+def bcrypt_user(db_session: Session, created_user: User, monkeypatch, test_settings: Settings) -> User:
+    """A user whose password was hashed with bcrypt cost 4, now configured for cost 5."""
+    monkeypatch.setattr(
+        security,
+        "get_settings",
+        lambda: test_settings.model_copy(update={"PASSWORD_HASH_SCHEME": "bcrypt", "PASSWORD_HASH_ROUNDS": 4}),
+    )
+    created_user.password_hash = security.encrypt_password("testpass123")
+    db_session.commit()
+
+    monkeypatch.setattr(
+        security,
+        "get_settings",
+        lambda: test_settings.model_copy(update={"PASSWORD_HASH_SCHEME": "bcrypt", "PASSWORD_HASH_ROUNDS": 5}),
+    )
+    return created_user
+
+
+@pytest.mark.integration
+class TestRehashOnLogin:
+    """A successful login upgrades hashes to the configured work factor."""
+
+    def test_authenticate_user_rehashes(self, db_session: Session, bcrypt_user: User):
+        authenticate_user(db_session, "testuser", "testpass123")
+
+        db_session.refresh(bcrypt_user)
+        assert bcrypt_user.password_hash.startswith("$2b$05$")
+
+    def test_authenticate_user_async_rehashes(self, db_session: Session, bcrypt_user: User):
+        asyncio.run(authenticate_user_async(db_session, "testuser", "testpass123"))
+
+        password_hash = db_session.execute(select(User.password_hash).where(User.uuid == bcrypt_user.uuid)).scalar_one()
+        assert password_hash.startswith("$2b$05$")
+
+    def test_failed_login_keeps_hash(self, db_session: Session, bcrypt_user: User):
+        with pytest.raises(Exception):
+            authenticate_user(db_session, "testuser", "wrong")
+
+        db_session.refresh(bcrypt_user)
+        assert bcrypt_user.password_hash.startswith("$2b$04$")
@@ -0,0 +1,137 @@
+"""Integration tests for read replica routing, with SQLite file copies as replicas."""
+
+import asyncio
+import shutil
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+import project.db.db as db
+import project.dependencies as dependencies
+from project.config import Settings
+from project.db.models.base import Base
+from project.db.models.task import Task
+from project.db.models.user import User
+from project.db.replicas import LAST_WRITE_COOKIE, ReadYourWrites
+from project.main import create_app
+from tests.conftest import create_test_client
+
+
+def add_task(session: Session, title: str) -> None:
+    session.add(Task(uuid=uuid4(), title=title, priority=3, created_by=uuid4()))
+    session.commit()
+
+
+def count_tasks(session: Session) -> int:
+    return session.execute(select(func.count()).select_from(Task)).scalar_one()
+
+
+@pytest.fixture
+def replicated(tmp_path) -> FastAPI:
+    """An app whose primary has two tasks and whose replica was copied after the first one."""
+    primary_file, replica_file = tmp_path / "primary.db", tmp_path / "replica.db"
+    settings = Settings(
+        DB_URL=f"sqlite:///{primary_file}",
+        DB_REPLICA_URLS=[f"sqlite:///{replica_file}"],
+        DB_READ_YOUR_WRITES_SECONDS=60,
+    )
+    primary = db.get_engine(settings)
+    Base.metadata.create_all(primary)
+
+    with Session(primary) as session:
+        add_task(session, "Replicated")
+        primary.dispose()
+        shutil.copy(primary_file, replica_file)
+        add_task(session, "Primary only")
+
+    primary.dispose()
+
+    app = create_app(settings)
+    yield app
+    asyncio.run(app.state.db.dispose())
+
+
+async def tasks_seen(app: FastAPI, cookie: str = "") -> int:
+    request = Request({"type": "http", "headers": [(b"cookie", cookie.encode())], "app": app})
+    async for session in dependencies.get_read_db_session(request):
+        return await db.run_in_session(session, count_tasks)
+
+
+async def reads_from_replica(app: FastAPI, cookie: str = "") -> bool:
+    request = Request({"type": "http", "headers": [(b"cookie", cookie.encode())], "app": app})
+    async for session in dependencies.get_read_db_session(request):
+        return db.is_replica_session(session)
+
+
+@pytest.mark.integration
+class TestReadReplicas:
+    """Reads go to a replica unless the client wrote within the window."""
+
+    def test_read_session_uses_replica(self, replicated: FastAPI):
+        assert asyncio.run(tasks_seen(replicated)) == 1
+
+    def test_primary_session_sees_all_writes(self, replicated: FastAPI):
+        async def primary_count() -> int:
+            request = Request({"type": "http", "headers": [], "app": replicated})
+            async for session in db.get_db_session(request):
+                return await db.run_in_session(session, count_tasks)
+
+        assert asyncio.run(primary_count()) == 2
+
+    def test_recent_writer_reads_from_primary(self, replicated: FastAPI):
+        # the cookie may come from any worker; routing only reads it from the request
+        cookie = ReadYourWrites(window=60).cookie()
+
+        assert asyncio.run(tasks_seen(replicated, cookie)) == 2
+        assert asyncio.run(tasks_seen(replicated)) == 1
+        assert asyncio.run(tasks_seen(replicated, f"{LAST_WRITE_COOKIE}=1.0")) == 1
+
+    def test_replica_sessions_are_marked(self, replicated: FastAPI):
+        assert asyncio.run(reads_from_replica(replicated))
+        assert not asyncio.run(reads_from_replica(replicated, ReadYourWrites(window=60).cookie()))
+
+
+@pytest.mark.integration
+class TestLastWriteCookie:
+    """Write endpoints send the last write cookie when replicas are configured."""
+
+    def test_set_on_successful_writes_only(
+        self, test_settings: Settings, db_session: Session, created_user: User, created_task: Task
+    ):
+        settings = test_settings.model_copy(update={"DB_REPLICA_URLS": ["sqlite:///replica.db"]})
+        client = create_test_client(settings, db_session, created_user)
+
+        assert LAST_WRITE_COOKIE not in client.get("/tasks").cookies
+        assert LAST_WRITE_COOKIE not in client.patch(f"/tasks/{uuid4()}", json={"priority": 5}).cookies
+
+        response = client.patch(f"/tasks/{created_task.uuid}", json={"priority": 5})
+
+        assert response.status_code == 200
+        assert LAST_WRITE_COOKIE in response.cookies
+        assert LAST_WRITE_COOKIE in client.cookies
+
+    def test_window_comes_from_the_app_settings(
+        self, test_settings: Settings, db_session: Session, created_user: User, created_task: Task
+    ):
+        settings = test_settings.model_copy(
+            update={"DB_REPLICA_URLS": ["sqlite:///replica.db"], "DB_READ_YOUR_WRITES_SECONDS": 90}
+        )
+        client = create_test_client(settings, db_session, created_user)
+
+        response = client.patch(f"/tasks/{created_task.uuid}", json={"priority": 5})
+
+        assert "Max-Age=90" in response.headers["Set-Cookie"]
+        assert client.app.state.read_your_writes.window == 90
+
+    def test_not_set_without_replicas(
+        self, test_settings: Settings, db_session: Session, created_user: User, created_task: Task
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.patch(f"/tasks/{created_task.uuid}", json={"priority": 5})
+
+        assert LAST_WRITE_COOKIE not in response.cookies
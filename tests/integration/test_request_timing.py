@@ -0,0 +1,80 @@
+"""Integration tests for the request timing middleware."""
+
+import logging
+import re
+import time
+
+import pytest
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.models.task import Task
+from project.routers import tasks as tasks_router
+from tests.conftest import create_test_client
+
+
+def server_timing(header: str) -> dict[str, str]:
+    return {entry.split(";")[0].strip(): entry for entry in header.split(",")}
+
+
+@pytest.mark.integration
+class TestRequestTiming:
+    """Requests are timed per span and summarized in a header and a log record."""
+
+    def test_server_timing_header(self, test_settings: Settings, db_session: Session, created_task: Task):
+        settings = test_settings.model_copy(update={"REQUEST_TIMING_HEADER": True})
+        client = create_test_client(settings, db_session, created_task.creator)
+
+        response = client.get(f"/tasks/{created_task.uuid}")
+
+        assert response.status_code == 200
+        entries = server_timing(response.headers["Server-Timing"])
+        assert set(entries) == {"db", "auth", "endpoint", "serialize", "total"}
+        queries = int(re.search(r'desc="(\d+) queries"', entries["db"]).group(1))
+        assert queries >= 2  # user lookup and task lookup
+
+    def test_serialize_includes_encoding_in_the_endpoint(
+        self, monkeypatch, test_settings: Settings, db_session: Session, created_task: Task
+    ):
+        encode_json = tasks_router.encode_json
+
+        def slow_encode_json(*args):
+            time.sleep(0.05)
+            return encode_json(*args)
+
+        monkeypatch.setattr(tasks_router, "encode_json", slow_encode_json)
+        settings = test_settings.model_copy(update={"REQUEST_TIMING_HEADER": True})
+        client = create_test_client(settings, db_session, created_task.creator)
+
+        for path in (f"/tasks/{created_task.uuid}", "/tasks"):
+            entries = server_timing(client.get(path).headers["Server-Timing"])
+            assert float(re.search(r"dur=([\d.]+)", entries["serialize"]).group(1)) >= 50
+
+    def test_header_is_off_by_default(self, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+
+        response = client.get(f"/tasks/{created_task.uuid}")
+
+        assert "Server-Timing" not in response.headers
+
+    def test_logs_timings(self, caplog, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+
+        with caplog.at_level(logging.INFO, logger="project.timing"):
+            client.get("/tasks?limit=5")
+
+        (record,) = caplog.records
+        assert record.path == "/tasks"
+        assert record.status_code == 200
+        assert record.timings["db_queries"] >= 2
+        assert {"total_ms", "db_ms", "auth_ms", "endpoint_ms", "serialize_ms"} <= set(record.timings)
+
+    def test_disabled(self, caplog, test_settings: Settings, db_session: Session, created_task: Task):
+        settings = test_settings.model_copy(update={"REQUEST_TIMING_ENABLED": False, "REQUEST_TIMING_HEADER": True})
+        client = create_test_client(settings, db_session, created_task.creator)
+
+        with caplog.at_level(logging.INFO, logger="project.timing"):
+            response = client.get(f"/tasks/{created_task.uuid}")
+
+        assert "Server-Timing" not in response.headers
+        assert not caplog.records
@@ -0,0 +1,106 @@
+"""Integration tests for lazy engines and the startup schema check."""
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+
+import project.main as main
+from project.config import Settings
+from project.db import db, migrate
+from project.db.migrate import schema_is_current, upgrade
+
+
+def app_settings(tmp_path, name: str = "app.db", **overrides) -> Settings:
+    return db.get_settings().model_copy(update={"DB_URL": f"sqlite:///{tmp_path / name}", **overrides})
+
+
+@pytest.fixture
+def engine(tmp_path) -> Engine:
+    """An empty database."""
+    engine = db.get_engine(app_settings(tmp_path))
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.integration
+class TestSchemaCheck:
+    """Startup compares the recorded schema fingerprint instead of running DDL."""
+
+    def test_current_only_after_migrate(self, engine: Engine):
+        assert not schema_is_current(engine)
+
+        upgrade(engine)
+
+        assert schema_is_current(engine)
+
+    def test_model_changes_need_migrate(self, engine: Engine, monkeypatch):
+        upgrade(engine)
+        monkeypatch.setattr(migrate, "schema_fingerprint", lambda: "changed")
+
+        assert not schema_is_current(engine)
+
+    def test_refuses_to_start_unmigrated(self, engine: Engine):
+        with pytest.raises(RuntimeError, match="project.db.migrate"):
+            main.check_schema(engine, "error")
+
+    def test_migrate_mode_upgrades(self, engine: Engine):
+        main.check_schema(engine, "migrate")
+
+        assert schema_is_current(engine)
+
+    def test_off_skips_check(self, engine: Engine):
+        main.check_schema(engine, "off")
+
+        assert not schema_is_current(engine)
+
+
+@pytest.mark.integration
+class TestLazyEngines:
+    """Engines are created on first use and released with the app."""
+
+    def test_import_creates_no_engine(self):
+        code = "import project.main; print(project.main.app.state.db.active_engines())"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "{}"
+
+    def test_dispose_forgets_engines(self, tmp_path):
+        database = db.Database(app_settings(tmp_path))
+        first = database.session_factory.kw["bind"]
+
+        asyncio.run(database.dispose())
+
+        assert "primary" not in database.active_engines()
+        assert database.session_factory.kw["bind"] is not first
+        asyncio.run(database.dispose())
+
+
+@pytest.mark.integration
+class TestAppEngines:
+    """Each app connects with its own settings and only closes its own engines."""
+
+    def test_app_uses_its_own_settings(self, tmp_path):
+        app = main.create_app(app_settings(tmp_path, "own.db", DB_SCHEMA_CHECK="migrate"))
+
+        with TestClient(app):
+            engine = app.state.db.primary_engine
+            assert engine.url.database == str(tmp_path / "own.db")
+            assert schema_is_current(engine)
+
+    def test_shutdown_leaves_other_apps_engines(self, tmp_path):
+        first = main.create_app(app_settings(tmp_path, "first.db", DB_SCHEMA_CHECK="migrate"))
+        second = main.create_app(app_settings(tmp_path, "second.db", DB_SCHEMA_CHECK="migrate"))
+
+        with TestClient(second):
+            engine = second.state.db.primary_engine
+            with TestClient(first):
+                pass
+
+            assert first.state.db.active_engines() == {}
+            assert second.state.db.active_engines() == {"primary": engine}
+            with engine.connect() as connection:
+                assert connection.execute(text("SELECT 1")).scalar_one() == 1
@@ -0,0 +1,77 @@
+"""Integration tests for the synthetic data generator."""
+
+from collections import Counter
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import Session
+
+from project.db import seed
+from project.db.models.task import Task, TaskStatus
+from project.db.models.user import User
+from project.db.search import task_fts
+from project.db.seed import seed_synthetic
+from tests.conftest import create_test_engine, setup_test_database, teardown_test_database
+
+ANCHOR = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def other_engine() -> Engine:
+    engine = create_test_engine()
+    setup_test_database(engine)
+    yield engine
+    teardown_test_database(engine)
+
+
+def task_rows(engine: Engine) -> list[tuple]:
+    with Session(engine) as session:
+        return session.execute(select(Task.uuid, Task.title, Task.status, Task.assigned_to).order_by(Task.uuid)).all()
+
+
+@pytest.mark.integration
+class TestSeedSynthetic:
+    """seed_synthetic loads repeatable, realistically skewed data."""
+
+    def test_inserts_requested_rows_and_search_index(self, db_session: Session):
+        engine = db_session.get_bind()
+        seed_synthetic(engine, users=20, tasks=500, seed=1, chunk_size=64, now=ANCHOR)
+
+        assert db_session.execute(select(func.count()).select_from(User)).scalar_one() == 20
+        assert db_session.execute(select(func.count()).select_from(Task)).scalar_one() == 500
+        assert db_session.execute(select(func.count()).select_from(task_fts)).scalar_one() == 500
+
+    def test_same_seed_gives_same_data(self, db_session: Session, other_engine: Engine):
+        seed_synthetic(db_session.get_bind(), users=10, tasks=200, seed=7, now=ANCHOR)
+        seed_synthetic(other_engine, users=10, tasks=200, seed=7, now=ANCHOR)
+
+        assert task_rows(db_session.get_bind()) == task_rows(other_engine)
+
+    def test_distributions_are_skewed(self, db_session: Session):
+        seed_synthetic(db_session.get_bind(), users=50, tasks=3000, seed=3, now=ANCHOR)
+        rows = task_rows(db_session.get_bind())
+
+        statuses = Counter(row.status for row in rows)
+        assert (
+            statuses[TaskStatus.DONE.value] > statuses[TaskStatus.TODO.value] > statuses[TaskStatus.IN_PROGRESS.value]
+        )
+
+        assignees = Counter(row.assigned_to for row in rows)
+        busiest = assignees.most_common(2)
+        assert None in dict(busiest)
+        assert max(count for uuid, count in assignees.items() if uuid) > 10 * min(assignees.values())
+
+
+@pytest.mark.integration
+class TestSeedCommand:
+    """The command line refuses option combinations it would silently ignore."""
+
+    def test_tasks_without_users_is_an_error(self, monkeypatch, capsys):
+        monkeypatch.setattr("sys.argv", ["seed", "--tasks", "1000"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            seed.main()
+
+        assert exc_info.value.code == 2
+        assert "--tasks needs --users" in capsys.readouterr().err
@@ -0,0 +1,264 @@
+"""Integration tests for bulk task operations."""
+
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.models.task import Task, TaskCreate, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.exceptions import ValidationError
+from project.routers import tasks as tasks_router
+from project.services import task_service
+from tests.conftest import create_test_client
+
+
+def count_rows(session: Session) -> int:
+    return session.execute(select(func.count()).select_from(Task)).scalar_one()
+
+
+@pytest.mark.integration
+class TestBulkCreate:
+    """create_tasks_bulk inserts in batches and reports failures per item."""
+
+    def test_creates_all_items_across_batches(self, db_session: Session, created_user: User):
+        items = [TaskCreate(title=f"Imported {i}", assigned_to=created_user.uuid) for i in range(7)]
+
+        result = task_service.create_tasks_bulk(db_session, items, created_user, batch_size=3)
+
+        assert len(result.created) == 7
+        assert result.errors == {}
+        assert count_rows(db_session) == 7
+
+    def test_unknown_assignee_is_reported_not_fatal(self, db_session: Session, created_user: User):
+        items = [
+            TaskCreate(title="Mine", assigned_to=created_user.uuid),
+            TaskCreate(title="Nobody's", assigned_to=uuid4()),
+            TaskCreate(title="Unassigned"),
+        ]
+
+        result = task_service.create_tasks_bulk(db_session, items, created_user)
+
+        assert list(result.errors) == [1]
+        assert "User not found" in result.errors[1]
+        assert len(result.created) == 2
+
+    def test_failing_row_is_isolated_within_its_batch(self, db_session: Session, created_user: User):
+        items = [TaskCreate(title=f"Task {i}") for i in range(4)]
+        # bypass validation so the database rejects the row (title is NOT NULL)
+        items[2] = TaskCreate.model_construct(
+            title=None, description=None, status=TaskStatus.TODO, priority=3, due_date=None, assigned_to=None
+        )
+
+        result = task_service.create_tasks_bulk(db_session, items, created_user, batch_size=10)
+
+        assert list(result.errors) == [2]
+        assert len(result.created) == 3
+        assert count_rows(db_session) == 3
+
+
+@pytest.mark.integration
+class TestBulkCreateEndpoint:
+    """POST /tasks/bulk accepts JSON arrays and NDJSON and reports errors by input position."""
+
+    def test_json_array_with_invalid_items(self, test_settings: Settings, db_session: Session, created_user: User):
+        client = create_test_client(test_settings, db_session, created_user)
+        items = [{"title": "First"}, {"title": ""}, {"title": "Third", "priority": 9}, {"title": "Fourth"}]
+
+        response = client.post("/tasks/bulk", json=items)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 2
+        assert [error["index"] for error in body["errors"]] == [1, 2]
+        assert "title" in body["errors"][0]["detail"]
+        assert "priority" in body["errors"][1]["detail"]
+        assert count_rows(db_session) == 2
+
+    def test_ndjson(self, test_settings: Settings, db_session: Session, created_user: User):
+        client = create_test_client(test_settings, db_session, created_user)
+        lines = [json.dumps({"title": "One"}), "", json.dumps({"title": "Two", "assigned_to": str(uuid4())})]
+
+        response = client.post(
+            "/tasks/bulk", content="\n".join(lines), headers={"Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["created"] == 1
+        assert [error["index"] for error in body["errors"]] == [1]
+        assert "User not found" in body["errors"][0]["detail"]
+
+    @pytest.mark.parametrize(
+        ("content", "content_type"),
+        [
+            ('{"title": "Not an array"}', "application/json"),
+            ("not json", "application/json"),
+            ("{", "application/x-ndjson"),
+        ],
+    )
+    def test_malformed_body_is_rejected(
+        self, test_settings: Settings, db_session: Session, created_user: User, content: str, content_type: str
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.post("/tasks/bulk", content=content, headers={"Content-Type": content_type})
+
+        assert response.status_code == 422
+        assert count_rows(db_session) == 0
+
+    def test_item_cap(
+        self, test_settings: Settings, db_session: Session, created_user: User, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(tasks_router, "BULK_CREATE_MAX_ITEMS", 3)
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.post("/tasks/bulk", json=[{"title": f"Task {i}"} for i in range(4)])
+
+        assert response.status_code == 422
+        assert "At most 3" in response.json()["detail"]
+        assert count_rows(db_session) == 0
+
+
+@pytest.fixture
+def assigned_tasks(db_session: Session, created_user: User, created_admin: User) -> list[Task]:
+    """Six tasks: four assigned to created_user (two done), two to the admin."""
+    tasks = [
+        Task(
+            uuid=uuid4(),
+            title=f"Task {i}",
+            status=TaskStatus.DONE.value if i in (0, 1) else TaskStatus.TODO.value,
+            priority=3,
+            created_by=created_admin.uuid,
+            assigned_to=created_user.uuid if i < 4 else created_admin.uuid,
+        )
+        for i in range(6)
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+    return tasks
+
+
+@pytest.mark.integration
+class TestBulkUpdateAndDelete:
+    """update_tasks / delete_tasks act on every match in one statement."""
+
+    def test_reassigns_all_tasks_of_a_user(
+        self, db_session: Session, created_user: User, created_admin: User, assigned_tasks: list[Task]
+    ):
+        affected = task_service.update_tasks(
+            db_session, TaskUpdate(assigned_to=created_admin.uuid), assigned_to=created_user.uuid
+        )
+
+        assert affected == 4
+        assert task_service.count_tasks(db_session, assigned_to=created_admin.uuid) == 6
+        assert task_service.count_tasks(db_session, assigned_to=created_user.uuid) == 0
+
+    def test_dry_run_counts_without_changing(self, db_session: Session, created_user: User, assigned_tasks: list[Task]):
+        affected = task_service.update_tasks(
+            db_session,
+            TaskUpdate(status=TaskStatus.DONE),
+            status_filter=TaskStatus.TODO,
+            assigned_to=created_user.uuid,
+            dry_run=True,
+        )
+
+        assert affected == 2
+        assert task_service.count_tasks(db_session, status_filter=TaskStatus.DONE) == 2
+
+    def test_deletes_matching_tasks(self, db_session: Session, assigned_tasks: list[Task]):
+        assert task_service.delete_tasks(db_session, status_filter=TaskStatus.DONE, dry_run=True) == 2
+
+        affected = task_service.delete_tasks(db_session, status_filter=TaskStatus.DONE)
+
+        assert affected == 2
+        assert count_rows(db_session) == 4
+
+    def test_requires_a_filter(self, db_session: Session, assigned_tasks: list[Task]):
+        with pytest.raises(ValidationError):
+            task_service.delete_tasks(db_session)
+
+        with pytest.raises(ValidationError):
+            task_service.update_tasks(db_session, TaskUpdate(priority=1))
+
+        assert count_rows(db_session) == 6
+
+
+@pytest.mark.integration
+class TestBulkMutationEndpoints:
+    """PATCH /tasks and DELETE /tasks apply to every match; deleting needs an admin."""
+
+    def test_patch_updates_matching_tasks(
+        self, test_settings: Settings, db_session: Session, created_user: User, assigned_tasks: list[Task]
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.patch("/tasks", params={"status": "todo"}, json={"priority": 1})
+
+        assert response.status_code == 200
+        assert response.json() == {"affected": 4, "dry_run": False}
+        db_session.expire_all()
+        assert {task.priority for task in assigned_tasks if task.status == "todo"} == {1}
+
+    @pytest.mark.parametrize("field", ["title", "status", "priority"])
+    def test_patch_rejects_null_for_required_fields(
+        self,
+        test_settings: Settings,
+        db_session: Session,
+        created_user: User,
+        assigned_tasks: list[Task],
+        field: str,
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        bulk = client.patch("/tasks", params={"status": "todo"}, json={field: None})
+        single = client.patch(f"/tasks/{assigned_tasks[0].uuid}", json={field: None})
+
+        assert (bulk.status_code, single.status_code) == (422, 422)
+
+    def test_patch_without_filter_is_rejected(
+        self, test_settings: Settings, db_session: Session, created_user: User, assigned_tasks: list[Task]
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.patch("/tasks", json={"priority": 1})
+
+        assert response.status_code == 422
+
+    def test_delete_requires_admin(
+        self, test_settings: Settings, db_session: Session, created_user: User, assigned_tasks: list[Task]
+    ):
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.delete("/tasks", params={"status": "done"})
+
+        assert response.status_code == 403
+        assert count_rows(db_session) == 6
+
+    def test_admin_deletes_matching_tasks(
+        self, test_settings: Settings, db_session: Session, created_admin: User, assigned_tasks: list[Task]
+    ):
+        client = create_test_client(test_settings, db_session, created_admin)
+
+        response = client.delete("/tasks", params={"status": "done"})
+
+        assert response.status_code == 200
+        assert response.json() == {"affected": 2, "dry_run": False}
+        assert count_rows(db_session) == 4
+
+    def test_dry_run_leaves_rows_unchanged(
+        self, test_settings: Settings, db_session: Session, created_admin: User, assigned_tasks: list[Task]
+    ):
+        client = create_test_client(test_settings, db_session, created_admin)
+
+        deleted = client.delete("/tasks", params={"status": "done", "dry_run": True})
+        patched = client.patch("/tasks", params={"status": "todo", "dry_run": True}, json={"priority": 5})
+
+        assert deleted.json() == {"affected": 2, "dry_run": True}
+        assert patched.json() == {"affected": 4, "dry_run": True}
+        assert count_rows(db_session) == 6
+        db_session.expire_all()
+        assert {task.priority for task in assigned_tasks} == {3}
@@ -0,0 +1,175 @@
+"""Integration tests for revisions, tombstones and GET /tasks/changes."""
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.changes import next_revision
+from project.db.migrate import upgrade
+from project.db.models.task import Task, TaskCreate, TaskRevision, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.exceptions import ValidationError
+from project.services import task_service
+from tests.conftest import create_test_client, create_test_engine, teardown_test_database
+
+
+def sync(session: Session, since: int, limit: int = 100) -> tuple[set, set, int]:
+    """Follow every page after `since`, returning changed uuids, deleted uuids and the new revision."""
+    changed, deleted, cursor = set(), set(), None
+    while True:
+        page = task_service.get_task_changes(session, since, limit, cursor)
+        changed.update(task.uuid for task in page.changed)
+        deleted.update(page.deleted)
+        if not page.has_more:
+            return changed, deleted, page.revision
+        cursor = page.next_cursor
+
+
+@pytest.mark.integration
+class TestRevisions:
+    """Every task write stamps a new revision."""
+
+    def test_writes_take_increasing_revisions(self, db_session: Session, created_user: User):
+        first = task_service.create_task(db_session, TaskCreate(title="A"), created_user)
+        second = task_service.create_task(db_session, TaskCreate(title="B"), created_user)
+        assert first.revision < second.revision
+
+        updated = task_service.update_task(db_session, first.uuid, TaskUpdate(priority=5))
+        assert updated.revision > second.revision
+
+    def test_bulk_create_shares_a_revision_per_batch(self, db_session: Session, created_user: User):
+        items = [TaskCreate(title=f"Task {i}") for i in range(5)]
+
+        result = task_service.create_tasks_bulk(db_session, items, created_user, batch_size=5)
+
+        revisions = {task_service.get_task_by_uuid(db_session, uuid).revision for uuid in result.created}
+        assert len(revisions) == 1
+
+    def test_counter_continues_after_existing_rows(self, db_session: Session, created_user: User):
+        db_session.execute(insert(Task), [{"title": "Raw", "created_by": created_user.uuid, "revision": 41}])
+        db_session.commit()
+
+        assert next_revision(db_session.connection()) == 42
+
+
+@pytest.mark.integration
+class TestTaskChanges:
+    """get_task_changes returns only what changed after a revision."""
+
+    def test_returns_changes_and_deletes_since_revision(self, db_session: Session, created_user: User):
+        kept = task_service.create_task(db_session, TaskCreate(title="Kept"), created_user)
+        removed = task_service.create_task(db_session, TaskCreate(title="Removed"), created_user)
+        untouched = task_service.create_task(db_session, TaskCreate(title="Untouched"), created_user)
+
+        changed, deleted, revision = sync(db_session, 0)
+        assert changed == {kept.uuid, removed.uuid, untouched.uuid}
+        assert deleted == set()
+
+        task_service.update_task(db_session, kept.uuid, TaskUpdate(title="Kept, renamed"))
+        task_service.delete_task(db_session, removed.uuid)
+
+        changed, deleted, new_revision = sync(db_session, revision)
+        assert changed == {kept.uuid}
+        assert deleted == {removed.uuid}
+        assert new_revision > revision
+
+        assert sync(db_session, new_revision) == (set(), set(), new_revision)
+
+    def test_pages_through_a_bulk_revision(self, db_session: Session, created_user: User):
+        items = [TaskCreate(title=f"Task {i}") for i in range(7)]
+        created = task_service.create_tasks_bulk(db_session, items, created_user).created
+
+        page = task_service.get_task_changes(db_session, 0, 3)
+        assert page.has_more
+        assert len(page.changed) == 3
+
+        changed, _, _ = sync(db_session, 0, limit=3)
+        assert changed == set(created)
+
+    def test_bulk_update_and_delete(self, db_session: Session, created_user: User):
+        items = [TaskCreate(title=f"Task {i}", status=TaskStatus.DONE if i % 2 else TaskStatus.TODO) for i in range(6)]
+        task_service.create_tasks_bulk(db_session, items, created_user)
+        _, _, revision = sync(db_session, 0)
+
+        task_service.update_tasks(db_session, TaskUpdate(priority=1), status_filter=TaskStatus.TODO)
+        task_service.delete_tasks(db_session, status_filter=TaskStatus.DONE)
+
+        changed, deleted, _ = sync(db_session, revision)
+        assert len(changed) == 3
+        assert len(deleted) == 3
+        assert not changed & deleted
+
+    def test_writes_committed_during_a_read_are_not_lost(
+        self, db_session: Session, created_user: User, monkeypatch: pytest.MonkeyPatch
+    ):
+        updated = task_service.create_task(db_session, TaskCreate(title="Updated"), created_user)
+        deleted = task_service.create_task(db_session, TaskCreate(title="Deleted"), created_user)
+        _, _, revision = sync(db_session, 0)
+        engine = db_session.get_bind()
+        execute = db_session.execute
+
+        def write_after_first_read(*args, **kwargs):
+            result = execute(*args, **kwargs).freeze()
+            monkeypatch.setattr(db_session, "execute", execute)
+            with Session(engine) as other:
+                task_service.update_task(other, updated.uuid, TaskUpdate(title="Renamed"))
+                task_service.delete_task(other, deleted.uuid)
+            return result()
+
+        monkeypatch.setattr(db_session, "execute", write_after_first_read)
+        page = task_service.get_task_changes(db_session, revision, 100)
+
+        changed, gone, _ = sync(db_session, page.revision)
+        assert updated.uuid in changed | {task.uuid for task in page.changed}
+        assert deleted.uuid in gone | set(page.deleted)
+
+    def test_invalid_cursor(self, db_session: Session):
+        with pytest.raises(ValidationError):
+            task_service.get_task_changes(db_session, 0, 10, cursor="not-a-cursor")
+
+    def test_endpoint(self, test_settings: Settings, db_session: Session, created_user: User):
+        task = task_service.create_task(db_session, TaskCreate(title="A"), created_user)
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.get("/tasks/changes", params={"since": 0})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["uuid"] for item in body["changed"]] == [str(task.uuid)]
+        assert body["deleted"] == []
+        assert body["revision"] == task.revision
+        assert body["has_more"] is False
+
+        assert client.get("/tasks/changes", params={"since": body["revision"]}).json()["changed"] == []
+
+
+@pytest.mark.integration
+class TestRevisionMigration:
+    """upgrade adds the revision column and starts the counter after existing rows."""
+
+    def test_upgrade_adds_revision(self):
+        engine = create_test_engine()
+        try:
+            upgrade(engine)
+            with Session(engine) as session:
+                user = User(username="u", email="u@example.com", password_hash="x", role="user")
+                session.add(user)
+                session.flush()
+                session.execute(insert(Task), [{"title": "Old", "created_by": user.uuid}])
+                session.commit()
+            with engine.begin() as connection:
+                connection.execute(text("DROP INDEX ix_task_revision_uuid"))
+                connection.execute(text("ALTER TABLE task DROP COLUMN revision"))
+                connection.execute(text(f"DROP TABLE {TaskRevision.__tablename__}"))
+
+            created = upgrade(engine)
+
+            assert "task.revision" in created
+            assert "ix_task_revision_uuid" in created
+            with Session(engine) as session:
+                changed, _, revision = sync(session, 0)
+                assert len(changed) == 1
+                assert next_revision(session.connection()) == revision + 1
+        finally:
+            teardown_test_database(engine)
@@ -0,0 +1,68 @@
+"""Integration tests for streaming task exports."""
+
+import csv
+import gzip
+import io
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from project.db.models.task import Task, TaskResponse, TaskStatus
+from project.db.models.user import User
+from project.services import task_service
+from project.utils.export import csv_chunks, gzip_chunks, ndjson_chunks
+
+
+@pytest.fixture
+def exported_tasks(db_session: Session, created_user: User) -> list[Task]:
+    """Persist a mix of tasks to export."""
+    tasks = [
+        Task(
+            uuid=uuid4(),
+            title=f"Task {i}",
+            description='needs "quoting", really' if i == 0 else None,
+            status=TaskStatus.TODO.value if i % 2 else TaskStatus.DONE.value,
+            priority=3,
+            created_by=created_user.uuid,
+        )
+        for i in range(25)
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+    return tasks
+
+
+@pytest.mark.integration
+class TestTaskExport:
+    """iter_tasks streams plain rows that serialize like TaskResponse."""
+
+    def test_iter_tasks_applies_filters(self, db_session: Session, exported_tasks: list[Task]):
+        rows = list(task_service.iter_tasks(db_session, status_filter=TaskStatus.TODO, batch_size=4))
+
+        assert len(rows) == 12
+        assert all(row["status"] == TaskStatus.TODO.value for row in rows)
+
+    def test_ndjson_round_trip(self, db_session: Session, exported_tasks: list[Task]):
+        rows = task_service.iter_tasks(db_session, batch_size=4)
+        tasks = (TaskResponse.model_validate(dict(row)) for row in rows)
+
+        body = b"".join(ndjson_chunks(tasks, chunk_size=10))
+        lines = [json.loads(line) for line in body.splitlines()]
+
+        assert len(lines) == 25
+        assert {line["uuid"] for line in lines} == {str(task.uuid) for task in exported_tasks}
+
+    def test_gzipped_csv_round_trip(self, db_session: Session, exported_tasks: list[Task]):
+        rows = task_service.iter_tasks(db_session, batch_size=4)
+        tasks = (TaskResponse.model_validate(dict(row)) for row in rows)
+        fieldnames = list(TaskResponse.model_fields)
+
+        body = gzip.decompress(b"".join(gzip_chunks(csv_chunks(tasks, fieldnames, chunk_size=10))))
+        records = list(csv.DictReader(io.StringIO(body.decode("utf-8"))))
+
+        by_title = {record["title"]: record for record in records}
+        assert len(by_title) == 25
+        assert by_title["Task 0"]["description"] == 'needs "quoting", really'
+        assert by_title["Task 1"]["assigned_to"] == ""
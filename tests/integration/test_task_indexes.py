@@ -0,0 +1,105 @@
+"""Integration tests proving task_service queries are served by indexes."""
+
+from collections.abc import Callable
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from project.db.migrate import create_missing_indexes
+from project.db.models.task import Task, TaskStatus
+from project.exceptions import EntityNotFoundError
+from project.services import task_service
+from project.utils.pagination import PaginationParams, encode_cursor
+
+FILTERS = [
+    {},
+    {"status_filter": TaskStatus.TODO},
+    {"assigned_to": uuid4()},
+    {"status_filter": TaskStatus.IN_PROGRESS, "assigned_to": uuid4()},
+]
+
+
+def capture_selects(session: Session, action: Callable[[], object]) -> list[tuple[str, tuple]]:
+    """Run `action` and return every SELECT it sent to the database."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def query_plan(session: Session, statement: str, parameters: tuple) -> list[str]:
+    """Return the detail column of SQLite's EXPLAIN QUERY PLAN."""
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_index(session: Session, action: Callable[[], object]) -> None:
+    statements = capture_selects(session, action)
+    assert statements
+
+    for statement, parameters in statements:
+        plan = query_plan(session, statement, parameters)
+        assert any("USING" in step and "INDEX" in step for step in plan), (statement, plan)
+        assert "SCAN task" not in plan, (statement, plan)
+        assert not any("TEMP B-TREE" in step for step in plan), (statement, plan)
+
+
+@pytest.mark.integration
+class TestTaskQueriesUseIndexes:
+    """Every task_service read is an index search or ordered index scan."""
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_get_tasks_offset_mode(self, db_session: Session, filters, sort_order):
+        pagination = PaginationParams(limit=10, offset=20, sort_order=sort_order)
+
+        assert_uses_index(db_session, lambda: task_service.get_tasks(db_session, pagination, **filters))
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_get_tasks_cursor_mode(self, db_session: Session, filters, sort_order):
+        cursor = encode_cursor(datetime(2024, 1, 1), uuid4())
+        pagination = PaginationParams(limit=10, sort_order=sort_order, cursor=cursor)
+
+        assert_uses_index(db_session, lambda: task_service.get_tasks(db_session, pagination, **filters))
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    def test_count_tasks(self, db_session: Session, filters):
+        assert_uses_index(db_session, lambda: task_service.count_tasks(db_session, **filters))
+
+    def test_get_task_by_uuid(self, db_session: Session):
+        def lookup():
+            with pytest.raises(EntityNotFoundError):
+                task_service.get_task_by_uuid(db_session, uuid4())
+
+        assert_uses_index(db_session, lookup)
+
+
+@pytest.mark.integration
+class TestCreateMissingIndexes:
+    """Indexes can be added to a database created before they existed."""
+
+    def test_creates_only_missing_indexes(self, db_session: Session):
+        engine = db_session.get_bind()
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_task_status_created_at_uuid"))
+            conn.execute(text("DROP INDEX ix_task_open_due_date"))
+
+        created = create_missing_indexes(engine)
+
+        assert created == ["ix_task_open_due_date", "ix_task_status_created_at_uuid"]
+        names = {index["name"] for index in inspect(engine).get_indexes(Task.__tablename__)}
+        assert names >= {index.name for index in Task.__table__.indexes}
+        assert create_missing_indexes(engine) == []
@@ -0,0 +1,106 @@
+"""Integration tests for the task list cache behind GET /tasks."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.db import REPLICA_SESSION
+from project.db.models.task import Task, TaskCreate, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.routers import tasks as tasks_router
+from project.services import task_cache, task_service
+from tests.conftest import create_test_client
+
+
+@pytest.fixture
+def client(monkeypatch, test_settings: Settings, db_session: Session, created_user: User) -> TestClient:
+    """API client with the in-memory task list cache enabled."""
+    settings = test_settings.model_copy(update={"TASK_CACHE_ENABLED": True})
+    monkeypatch.setattr(task_cache, "get_settings", lambda: settings)
+    task_cache.get_task_list_cache.cache_clear()
+    yield create_test_client(test_settings, db_session, created_user)
+    task_cache.get_task_list_cache.cache_clear()
+
+
+def cache_status(client: TestClient, **params) -> str:
+    response = client.get("/tasks", params=params)
+    assert response.status_code == 200
+    return response.headers["X-Cache"]
+
+
+@pytest.mark.integration
+class TestTaskListCache:
+    """Writes through the service invalidate the pages they affect and nothing else."""
+
+    def test_not_modified_miss_still_fills_the_cache(self, client: TestClient, created_task: Task):
+        etag = client.get("/tasks").headers["ETag"]
+        task_cache.get_task_list_cache().invalidate_all()
+
+        first = client.get("/tasks", headers={"If-None-Match": etag})
+        second = client.get("/tasks", headers={"If-None-Match": etag})
+
+        assert first.status_code == second.status_code == 304
+        assert cache_status(client) == "HIT"
+
+    def test_replica_pages_are_not_cached(self, client: TestClient, db_session: Session, created_task: Task):
+        db_session.info[REPLICA_SESSION] = True
+
+        assert [cache_status(client), cache_status(client)] == ["MISS", "MISS"]
+
+        db_session.info[REPLICA_SESSION] = False
+
+        assert [cache_status(client), cache_status(client)] == ["MISS", "HIT"]
+
+    def test_create_invalidates_affected_filters_only(
+        self, client: TestClient, db_session: Session, created_user: User, created_task: Task
+    ):
+        filters = [{}, {"status": "todo"}, {"status": "done"}, {"assigned_to": str(created_user.uuid)}]
+        assert [cache_status(client, **params) for params in filters] == ["MISS"] * 4
+
+        task_service.create_task(db_session, TaskCreate(title="New", status=TaskStatus.DONE), created_user)
+
+        assert [cache_status(client, **params) for params in filters] == ["MISS", "HIT", "MISS", "HIT"]
+
+    def test_update_invalidates_old_and_new_scopes(
+        self, client: TestClient, db_session: Session, created_user: User, created_task: Task
+    ):
+        filters = [{"status": "todo"}, {"status": "in_progress"}, {"status": "done"}]
+        for params in filters:
+            cache_status(client, **params)
+
+        task_service.update_task(db_session, created_task.uuid, TaskUpdate(status=TaskStatus.IN_PROGRESS))
+
+        assert [cache_status(client, **params) for params in filters] == ["MISS", "MISS", "HIT"]
+
+    def test_delete_invalidates_affected_filters_only(
+        self, client: TestClient, db_session: Session, created_user: User, created_task: Task
+    ):
+        filters = [{"status": "todo"}, {"status": "done"}, {"assigned_to": str(created_user.uuid)}]
+        for params in filters:
+            cache_status(client, **params)
+
+        task_service.delete_task(db_session, created_task.uuid)
+
+        assert [cache_status(client, **params) for params in filters] == ["MISS", "HIT", "HIT"]
+
+
+@pytest.mark.integration
+class TestUncachedTaskList:
+    """With the cache disabled, a 304 is answered without encoding the page."""
+
+    def test_not_modified_skips_encoding(
+        self, monkeypatch, test_settings: Settings, db_session: Session, created_user: User, created_task: Task
+    ):
+        task_cache.get_task_list_cache.cache_clear()
+        client = create_test_client(test_settings, db_session, created_user)
+        etag = client.get("/tasks").headers["ETag"]
+        encoded = []
+        page_json = tasks_router.page_json
+        monkeypatch.setattr(tasks_router, "page_json", lambda *args: encoded.append(args) or page_json(*args))
+
+        assert client.get("/tasks", headers={"If-None-Match": etag}).status_code == 304
+        assert encoded == []
+
+        assert client.get("/tasks", headers={"If-None-Match": '"stale"'}).status_code == 200
+        assert len(encoded) == 1
@@ -0,0 +1,125 @@
+"""Integration tests for task list pagination (offset and keyset modes)."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from project.db.models.task import Task, TaskStatus
+from project.db.models.user import User
+from project.exceptions import ValidationError
+from project.services import task_service
+from project.utils.pagination import PaginationParams
+
+
+def create_tasks(session: Session, user: User, count: int) -> list[Task]:
+    """Persist `count` tasks, several sharing a created_at to exercise tie-breaking."""
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    tasks = [
+        Task(
+            uuid=uuid4(),
+            title=f"Task {i:02d}",
+            status=TaskStatus.DONE.value if i % 3 == 0 else TaskStatus.TODO.value,
+            priority=3,
+            created_by=user.uuid,
+            assigned_to=user.uuid if i % 2 == 0 else None,
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    session.add_all(tasks)
+    session.commit()
+    return tasks
+
+
+def walk_cursor(session: Session, pagination: PaginationParams, **filters) -> list[Task]:
+    """Follow next_cursor until exhausted and return every task seen."""
+    seen = []
+    while True:
+        page = task_service.get_tasks(session, pagination, **filters)
+        seen.extend(page.results)
+        if page.next_cursor is None:
+            return seen
+        pagination = pagination.model_copy(update={"cursor": page.next_cursor})
+
+
+@pytest.mark.integration
+class TestKeysetPagination:
+    """Keyset pagination returns every row exactly once, in order."""
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_cursor_walk_matches_offset_order(self, db_session: Session, created_user: User, sort_order):
+        create_tasks(db_session, created_user, 17)
+
+        everything = task_service.get_tasks(db_session, PaginationParams(limit=100, sort_order=sort_order))
+        walked = walk_cursor(db_session, PaginationParams(limit=4, sort_order=sort_order))
+
+        assert [t.uuid for t in walked] == [t.uuid for t in everything.results]
+        assert everything.next_cursor is None
+
+    def test_cursor_walk_respects_filters(self, db_session: Session, created_user: User):
+        create_tasks(db_session, created_user, 20)
+
+        walked = walk_cursor(
+            db_session,
+            PaginationParams(limit=3, sort_order="desc"),
+            status_filter=TaskStatus.TODO,
+            assigned_to=created_user.uuid,
+        )
+
+        assert len(walked) == 6
+        assert all(t.status == TaskStatus.TODO.value and t.assigned_to == created_user.uuid for t in walked)
+
+    def test_cursor_is_stable_under_concurrent_inserts(self, db_session: Session, created_user: User):
+        tasks = create_tasks(db_session, created_user, 6)
+
+        page1 = task_service.get_tasks(db_session, PaginationParams(limit=3, sort_order="desc"))
+        # a newer task appears before the client asks for page 2
+        create_tasks(db_session, created_user, 1)[0].created_at = datetime(2030, 1, 1)
+        db_session.commit()
+        page2 = task_service.get_tasks(
+            db_session, PaginationParams(limit=3, sort_order="desc", cursor=page1.next_cursor)
+        )
+
+        seen = [t.uuid for t in page1.results + page2.results]
+        assert sorted(seen) == sorted(t.uuid for t in tasks)
+
+    def test_invalid_cursor_raises_validation_error(self, db_session: Session):
+        with pytest.raises(ValidationError) as exc_info:
+            task_service.get_tasks(db_session, PaginationParams(cursor="not-a-cursor"))
+
+        assert exc_info.value.field == "cursor"
+
+
+@pytest.mark.integration
+class TestPaginationTotals:
+    """Totals are counted in the database and can be skipped."""
+
+    def test_total_counts_all_matching_rows(self, db_session: Session, created_user: User):
+        create_tasks(db_session, created_user, 12)
+
+        page = task_service.get_tasks(db_session, PaginationParams(limit=5, offset=5), status_filter=TaskStatus.TODO)
+
+        assert page.total == 8
+        assert page.has_next is False
+        assert len(page.results) == 3
+
+    def test_include_total_false_skips_count(self, db_session: Session, created_user: User):
+        create_tasks(db_session, created_user, 12)
+
+        first = task_service.get_tasks(db_session, PaginationParams(limit=5, include_total=False))
+        last = task_service.get_tasks(db_session, PaginationParams(limit=5, offset=10, include_total=False))
+
+        assert first.total is None
+        assert first.has_next is True
+        assert last.total is None
+        assert last.has_next is False
+
+    def test_total_with_offset_past_end(self, db_session: Session, created_user: User):
+        create_tasks(db_session, created_user, 3)
+
+        page = task_service.get_tasks(db_session, PaginationParams(limit=10, offset=100))
+
+        assert page.total == 3
+        assert page.results == []
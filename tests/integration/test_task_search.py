@@ -0,0 +1,98 @@
+"""Integration tests for full-text task search."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from project.db.migrate import upgrade
+from project.db.models.task import TaskCreate, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.exceptions import ValidationError
+from project.services import task_service
+from project.utils.pagination import PaginationParams, encode_cursor
+
+
+def search_titles(session: Session, q: str, **filters) -> list[str]:
+    page = task_service.get_tasks(session, PaginationParams(limit=50), search=q, **filters)
+    return [task.title for task in page.results]
+
+
+@pytest.fixture
+def searchable_tasks(db_session: Session, created_user: User) -> None:
+    for title, description, status in [
+        ("Deploy to staging", "Ship the release candidate", TaskStatus.TODO),
+        ("Write release notes", "Summarise what changed", TaskStatus.IN_PROGRESS),
+        ("Fix login bug", "Users cannot deploy after logging in", TaskStatus.DONE),
+        ("Order pizza", None, TaskStatus.TODO),
+    ]:
+        task_service.create_task(
+            db_session, TaskCreate(title=title, description=description, status=status), created_user
+        )
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("searchable_tasks")
+class TestTaskSearch:
+    """Search is ranked, filterable and follows every write."""
+
+    def test_title_matches_rank_above_description_matches(self, db_session: Session):
+        assert search_titles(db_session, "deploy") == ["Deploy to staging", "Fix login bug"]
+
+    def test_all_words_must_match_and_last_is_prefix(self, db_session: Session):
+        assert search_titles(db_session, "release not") == ["Write release notes"]
+
+    def test_combines_with_filters_and_totals(self, db_session: Session):
+        page = task_service.get_tasks(
+            db_session, PaginationParams(limit=1), status_filter=TaskStatus.TODO, search="deploy"
+        )
+
+        assert [task.title for task in page.results] == ["Deploy to staging"]
+        assert page.total == 1
+        assert task_service.count_tasks(db_session, search="release") == 2
+
+    def test_index_follows_updates_and_deletes(self, db_session: Session):
+        [pizza] = task_service.get_tasks(db_session, PaginationParams(), search="pizza").results
+
+        task_service.update_task(db_session, pizza.uuid, TaskUpdate(title="Order sushi"))
+        assert search_titles(db_session, "pizza") == []
+        assert search_titles(db_session, "sushi") == ["Order sushi"]
+
+        task_service.delete_task(db_session, pizza.uuid)
+        assert search_titles(db_session, "sushi") == []
+
+    def test_index_follows_bulk_writes(self, db_session: Session, created_user: User):
+        task_service.create_tasks_bulk(db_session, [TaskCreate(title="Bulk imported pizza")], created_user)
+        assert search_titles(db_session, "pizza") == ["Order pizza", "Bulk imported pizza"]
+
+        task_service.delete_tasks(db_session, status_filter=TaskStatus.TODO)
+        assert search_titles(db_session, "pizza") == []
+
+    def test_pages_by_offset_without_a_cursor(self, db_session: Session):
+        first = task_service.get_tasks(db_session, PaginationParams(limit=1), search="deploy")
+        second = task_service.get_tasks(db_session, PaginationParams(limit=1, offset=1), search="deploy")
+
+        assert first.has_next
+        assert first.next_cursor is None
+        assert [task.title for task in first.results + second.results] == ["Deploy to staging", "Fix login bug"]
+        assert not second.has_next
+
+    def test_rejects_queries_without_words_or_with_cursor(self, db_session: Session):
+        with pytest.raises(ValidationError):
+            search_titles(db_session, "!!")
+
+        with pytest.raises(ValidationError):
+            cursor = encode_cursor(datetime(2024, 1, 1), uuid4())
+            task_service.get_tasks(db_session, PaginationParams(cursor=cursor), search="deploy")
+
+    def test_upgrade_backfills_a_missing_index(self, db_session: Session):
+        engine = db_session.get_bind()
+        with engine.begin() as conn:
+            for trigger in ("task_fts_insert", "task_fts_update", "task_fts_delete"):
+                conn.execute(text(f"DROP TRIGGER {trigger}"))
+            conn.execute(text("DROP TABLE task_fts"))
+
+        assert "task search index" in upgrade(engine)
+        assert search_titles(db_session, "staging") == ["Deploy to staging"]
@@ -0,0 +1,50 @@
+"""Integration tests for the pre-encoded task JSON responses."""
+
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from project.db.models.task import Task, TaskResponse
+from project.routers.tasks import TASK_ADAPTER, page_json
+from project.services import task_service
+from project.utils.pagination import PaginatedResponse, PaginationParams
+from project.utils.serialization import encode_json
+
+
+def expected_page(page) -> bytes:
+    return (
+        PaginatedResponse[TaskResponse](
+            total=page.total,
+            offset=page.offset,
+            limit=page.limit,
+            results=[TaskResponse.model_validate(task) for task in page.results],
+            has_next=page.has_next,
+            next_cursor=page.next_cursor,
+        )
+        .model_dump_json()
+        .encode("utf-8")
+    )
+
+
+@pytest.mark.integration
+class TestTaskSerialization:
+    """The fast paths encode exactly what the response models would."""
+
+    def test_encode_task(self, created_task: Task):
+        assert (
+            encode_json(TASK_ADAPTER, created_task)
+            == TaskResponse.model_validate(created_task).model_dump_json().encode()
+        )
+
+    def test_page_json_matches_models(self, db_session: Session, created_task: Task):
+        page = task_service.get_tasks(db_session, PaginationParams())
+
+        assert page_json(page) == expected_page(page)
+        assert json.loads(page_json(page))["results"][0]["uuid"] == str(created_task.uuid)
+
+    def test_page_json_loads_expired_attributes(self, db_session: Session, created_task: Task):
+        page = task_service.get_tasks(db_session, PaginationParams())
+        db_session.expire(created_task, ["title"])
+
+        assert json.loads(page_json(page))["results"][0]["title"] == "Test Task"
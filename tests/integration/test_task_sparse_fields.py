@@ -0,0 +1,91 @@
+"""Integration tests for sparse fieldsets on task reads."""
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.models.task import Task
+from project.services import task_service
+from project.utils.pagination import PaginationParams
+from tests.conftest import create_test_client
+
+MOBILE_FIELDS = ("uuid", "title", "status", "priority")
+
+
+@pytest.fixture
+def statements(db_session: Session) -> list[str]:
+    """SQL statements executed on the test database."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.integration
+class TestSparseFieldsService:
+    """get_tasks and get_task_by_uuid load only the requested columns."""
+
+    def test_get_tasks_loads_only_fields(self, db_session: Session, created_task: Task, statements: list[str]):
+        db_session.expunge_all()
+
+        [task] = task_service.get_tasks(db_session, PaginationParams(), fields=("title",)).results
+
+        assert "title" in inspect(task).dict
+        assert "description" not in inspect(task).dict
+        assert "description" not in statements[-1]
+
+    def test_get_task_by_uuid_loads_only_fields(self, db_session: Session, created_task: Task, statements: list[str]):
+        task_uuid = created_task.uuid
+        db_session.expunge_all()
+
+        task = task_service.get_task_by_uuid(db_session, task_uuid, fields=("status",))
+
+        assert inspect(task).dict["status"] == "todo"
+        assert "description" not in statements[-1]
+        assert "title" not in statements[-1]
+
+
+@pytest.mark.integration
+class TestSparseFieldsApi:
+    """?fields= trims responses on GET /tasks and GET /tasks/{uuid}."""
+
+    def test_list_returns_only_fields(self, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+
+        response = client.get("/tasks", params={"fields": ",".join(MOBILE_FIELDS)})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 1
+        assert list(body["results"][0]) == list(MOBILE_FIELDS)
+
+    def test_get_returns_only_fields(self, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+
+        full = client.get(f"/tasks/{created_task.uuid}")
+        sparse = client.get(f"/tasks/{created_task.uuid}", params={"fields": "priority, title"})
+
+        assert sparse.json() == {"title": "Test Task", "priority": created_task.priority}
+        assert sparse.headers["ETag"] != full.headers["ETag"]
+
+    def test_sparse_etag_revalidates(self, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+        url = f"/tasks/{created_task.uuid}?fields=title"
+        etag = client.get(url).headers["ETag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        assert client.get(f"/tasks/{created_task.uuid}", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_unknown_field_is_rejected(self, test_settings: Settings, db_session: Session, created_task: Task):
+        client = create_test_client(test_settings, db_session, created_task.creator)
+
+        response = client.get("/tasks", params={"fields": "title,password_hash"})
+
+        assert response.status_code == 422
+        assert "password_hash" in response.json()["detail"]
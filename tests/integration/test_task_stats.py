@@ -0,0 +1,192 @@
+"""Integration tests for the task counters behind GET /tasks/stats."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, inspect, text
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db import changes
+from project.db.migrate import upgrade
+from project.db.models.task import Task, TaskCreate, TaskStat, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.db.stats import read_task_stats, rebuild_task_stats
+from project.services import task_service
+from tests.conftest import create_test_client, create_test_engine, teardown_test_database
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def rebuilt_stats(session: Session) -> dict[str, dict[str, int]]:
+    """Counters recounted from the task table, without committing."""
+    connection = session.connection()
+    incremental = read_task_stats(connection)
+    rebuild_task_stats(connection)
+    rebuilt = read_task_stats(connection)
+    session.rollback()
+    assert incremental == rebuilt
+    return rebuilt
+
+
+@pytest.mark.integration
+class TestStatCounters:
+    """Every task write keeps the counters equal to a full recount."""
+
+    def test_single_writes(self, db_session: Session, created_user: User):
+        task = task_service.create_task(
+            db_session, TaskCreate(title="A", priority=2, due_date=NOW, assigned_to=created_user.uuid), created_user
+        )
+        other = task_service.create_task(db_session, TaskCreate(title="B"), created_user)
+        rebuilt_stats(db_session)
+
+        task_service.update_task(db_session, task.uuid, TaskUpdate(status=TaskStatus.DONE, assigned_to=None))
+        task_service.update_task(db_session, other.uuid, TaskUpdate(priority=5, due_date=NOW))
+        rebuilt_stats(db_session)
+
+        task_service.delete_task(db_session, task.uuid)
+        stats = rebuilt_stats(db_session)
+
+        assert stats["status"] == {"todo": 1}
+        assert stats["priority"] == {"5": 1}
+        assert stats["due"] == {"2026-03-10": 1}
+
+    def test_bulk_writes(self, db_session: Session, created_user: User):
+        items = [
+            TaskCreate(
+                title=f"Task {i}",
+                priority=i % 5 + 1,
+                due_date=NOW + timedelta(days=i % 3) if i % 2 else None,
+                assigned_to=created_user.uuid if i % 3 else None,
+            )
+            for i in range(12)
+        ]
+        task_service.create_tasks_bulk(db_session, items, created_user, batch_size=5)
+        rebuilt_stats(db_session)
+
+        task_service.update_tasks(
+            db_session, TaskUpdate(status=TaskStatus.IN_PROGRESS, priority=1), assigned_to=created_user.uuid
+        )
+        rebuilt_stats(db_session)
+
+        task_service.delete_tasks(db_session, status_filter=TaskStatus.TODO)
+        stats = rebuilt_stats(db_session)
+
+        assert stats["status"] == {"in_progress": 8}
+        assert stats["assignee"] == {str(created_user.uuid): 8}
+
+    @pytest.mark.parametrize("bulk_write", ["update", "delete"])
+    def test_bulk_write_counts_a_concurrent_write(
+        self, db_session: Session, created_user: User, monkeypatch: pytest.MonkeyPatch, bulk_write: str
+    ):
+        task_service.create_task(db_session, TaskCreate(title="Existing"), created_user)
+        engine = db_session.get_bind()
+
+        def create_then_take_revision(connection):
+            # another writer commits a matching task just before the bulk write takes its revision
+            monkeypatch.setattr(task_service, "next_revision", changes.next_revision)
+            with Session(engine) as other:
+                task_service.create_task(other, TaskCreate(title="Concurrent"), created_user)
+            return changes.next_revision(connection)
+
+        monkeypatch.setattr(task_service, "next_revision", create_then_take_revision)
+        if bulk_write == "update":
+            count = task_service.update_tasks(db_session, TaskUpdate(priority=1), status_filter=TaskStatus.TODO)
+        else:
+            count = task_service.delete_tasks(db_session, status_filter=TaskStatus.TODO)
+
+        assert count == 2
+        stats = rebuilt_stats(db_session)
+        assert stats["priority"] == ({"1": 2} if bulk_write == "update" else {})
+
+    def test_failed_write_leaves_counters_alone(self, db_session: Session, created_user: User):
+        items = [
+            TaskCreate(title="Good"),
+            TaskCreate.model_construct(
+                title=None, description=None, status=TaskStatus.TODO, priority=3, due_date=None, assigned_to=None
+            ),
+        ]
+
+        task_service.create_tasks_bulk(db_session, items, created_user)
+
+        assert rebuilt_stats(db_session)["status"] == {"todo": 1}
+
+
+@pytest.mark.integration
+class TestGetTaskStats:
+    """get_task_stats reads the counters and counts overdue open tasks."""
+
+    def test_counts(self, db_session: Session, created_user: User):
+        due_dates = [NOW - timedelta(days=2), NOW - timedelta(hours=1), NOW + timedelta(hours=1), None]
+        for i, due_date in enumerate(due_dates):
+            task_service.create_task(
+                db_session,
+                TaskCreate(title=f"Task {i}", priority=4, due_date=due_date, assigned_to=created_user.uuid),
+                created_user,
+            )
+        task_service.create_task(
+            db_session, TaskCreate(title="Done", status=TaskStatus.DONE, due_date=NOW - timedelta(days=5)), created_user
+        )
+
+        stats = task_service.get_task_stats(db_session, now=NOW)
+
+        assert stats.total == 5
+        assert stats.by_status == {"todo": 4, "in_progress": 0, "done": 1}
+        assert stats.by_priority == {1: 0, 2: 0, 3: 1, 4: 4, 5: 0}
+        assert stats.by_assignee == {created_user.uuid: 4}
+        assert stats.unassigned == 1
+        assert stats.overdue == 2
+
+    def test_rebuild_repairs_drift(self, db_session: Session, created_user: User):
+        db_session.execute(
+            insert(Task),
+            [{"title": f"Raw {i}", "status": "todo", "priority": 3, "created_by": created_user.uuid} for i in range(3)],
+        )
+        db_session.commit()
+        assert task_service.get_task_stats(db_session).total == 0
+
+        rebuild_task_stats(db_session.connection())
+        db_session.commit()
+
+        assert task_service.get_task_stats(db_session).total == 3
+
+    def test_endpoint(self, test_settings: Settings, db_session: Session, created_user: User):
+        task_service.create_task(db_session, TaskCreate(title="A", priority=1), created_user)
+
+        response = create_test_client(test_settings, db_session, created_user).get("/tasks/stats")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 1,
+            "by_status": {"todo": 1, "in_progress": 0, "done": 0},
+            "by_priority": {"1": 1, "2": 0, "3": 0, "4": 0, "5": 0},
+            "by_assignee": {},
+            "unassigned": 1,
+            "overdue": 0,
+        }
+
+
+@pytest.mark.integration
+class TestStatsMigration:
+    """upgrade fills a newly created counters table from existing tasks."""
+
+    def test_upgrade_backfills_counters(self):
+        engine = create_test_engine()
+        try:
+            upgrade(engine)
+            with Session(engine) as session:
+                user = User(username="u", email="u@example.com", password_hash="x", role="user")
+                session.add(user)
+                session.flush()
+                session.execute(insert(Task), [{"title": "Old", "created_by": user.uuid}])
+                session.commit()
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP TABLE {TaskStat.__tablename__}"))
+
+            assert "task counters" in upgrade(engine)
+
+            assert inspect(engine).has_table(TaskStat.__tablename__)
+            with Session(engine) as session:
+                assert task_service.get_task_stats(session).by_status["todo"] == 1
+        finally:
+            teardown_test_database(engine)
@@ -0,0 +1,105 @@
+"""Integration tests for task row versions and schema upgrades."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, inspect, text, update
+from sqlalchemy.orm import Session
+
+from project.config import Settings
+from project.db.migrate import upgrade
+from project.db.models.task import Task, TaskStatus, TaskUpdate
+from project.db.models.user import User
+from project.exceptions import ConflictError, EntityNotFoundError
+from project.services import task_service
+from tests.conftest import create_test_client
+
+
+@pytest.mark.integration
+class TestTaskVersions:
+    """Every write path bumps the version that ETags are derived from."""
+
+    def test_new_task_starts_at_version_one(self, created_task: Task):
+        assert created_task.version == 1
+
+    def test_update_task_bumps_version(self, db_session: Session, created_task: Task):
+        task_service.update_task(db_session, created_task.uuid, TaskUpdate(priority=5))
+
+        assert task_service.get_task_version(db_session, created_task.uuid) == 2
+
+    def test_bulk_update_bumps_version(self, db_session: Session, created_task: Task):
+        task_service.update_tasks(db_session, TaskUpdate(priority=1), status_filter=TaskStatus.TODO)
+
+        assert task_service.get_task_version(db_session, created_task.uuid) == 2
+
+    def test_upgrade_adds_missing_version_column(self, db_session: Session, created_task: Task):
+        engine = db_session.get_bind()
+        db_session.close()
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE task DROP COLUMN version"))
+
+        created = upgrade(engine)
+
+        assert "task.version" in created
+        assert "version" in {column["name"] for column in inspect(engine).get_columns("task")}
+        assert task_service.get_task_version(db_session, created_task.uuid) == 1
+
+
+def bump_after_every_read(monkeypatch: pytest.MonkeyPatch, engine: Engine) -> None:
+    """Make another connection update each task right after the service loads it."""
+    get_task_by_uuid = task_service.get_task_by_uuid
+
+    def load_then_bump(session: Session, task_uuid: UUID, *args) -> Task:
+        task = get_task_by_uuid(session, task_uuid, *args)
+        with engine.begin() as connection:
+            connection.execute(update(Task).where(Task.uuid == task_uuid).values(version=Task.version + 1))
+        return task
+
+    monkeypatch.setattr(task_service, "get_task_by_uuid", load_then_bump)
+
+
+@pytest.mark.integration
+class TestConcurrentWrites:
+    """A write that loses the version race is retried once, then reported as a conflict."""
+
+    def test_update_after_concurrent_update_is_reapplied(self, db_session: Session, created_task: Task):
+        engine = db_session.get_bind()
+        task_service.get_task_by_uuid(db_session, created_task.uuid)  # session A holds version 1
+        with Session(engine) as other:
+            task_service.update_task(other, created_task.uuid, TaskUpdate(title="B"))
+
+        task = task_service.update_task(db_session, created_task.uuid, TaskUpdate(priority=5))
+
+        assert (task.title, task.priority, task.version) == ("B", 5, 3)
+
+    def test_delete_after_concurrent_update(self, db_session: Session, created_task: Task):
+        engine = db_session.get_bind()
+        task_service.get_task_by_uuid(db_session, created_task.uuid)
+        with Session(engine) as other:
+            task_service.update_task(other, created_task.uuid, TaskUpdate(title="B"))
+
+        task_service.delete_task(db_session, created_task.uuid)
+
+        with pytest.raises(EntityNotFoundError):
+            task_service.get_task_by_uuid(db_session, created_task.uuid)
+
+    def test_repeated_conflict_raises(self, db_session: Session, created_task: Task, monkeypatch: pytest.MonkeyPatch):
+        bump_after_every_read(monkeypatch, db_session.get_bind())
+
+        with pytest.raises(ConflictError):
+            task_service.update_task(db_session, created_task.uuid, TaskUpdate(priority=5))
+
+    def test_conflict_is_409(
+        self,
+        test_settings: Settings,
+        db_session: Session,
+        created_user: User,
+        created_task: Task,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        bump_after_every_read(monkeypatch, db_session.get_bind())
+        client = create_test_client(test_settings, db_session, created_user)
+
+        response = client.patch(f"/tasks/{created_task.uuid}", json={"priority": 5})
+
+        assert response.status_code == 409
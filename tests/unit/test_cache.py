@@ -0,0 +1,79 @@
+"""Unit tests for the LRU cache and task list cache invalidation."""
+
+from uuid import uuid4
+
+import pytest
+
+from project.services.task_cache import TaskListCache
+from project.utils.cache import LRUCache
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """LRUCache is bounded by size and TTL and counts hits and misses."""
+
+    def test_get_returns_value_and_counts_hits_and_misses(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+
+    def test_expired_entries_are_misses(self):
+        cache = LRUCache(max_entries=2, ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert cache.stats().size == 0
+
+    def test_counters_survive_eviction(self):
+        cache = LRUCache(max_entries=1)
+        cache.incr("generation")
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.counter("generation") == 1
+
+
+@pytest.mark.unit
+class TestTaskListCacheInvalidation:
+    """A task write only invalidates the filter scopes the task appears in."""
+
+    def test_invalidates_matching_scopes_only(self):
+        cache = TaskListCache(LRUCache())
+        alice, bob = uuid4(), uuid4()
+        scopes = {
+            "all": (None, None),
+            "todo": ("todo", None),
+            "done": ("done", None),
+            "alice": (None, alice),
+            "bob": (None, bob),
+            "todo_alice": ("todo", alice),
+        }
+        keys = {name: cache.key({}, *scope) for name, scope in scopes.items()}
+
+        cache.invalidate_task("todo", alice)
+
+        unchanged = {name for name, scope in scopes.items() if cache.key({}, *scope) == keys[name]}
+        assert unchanged == {"done", "bob"}
+
+    def test_invalidate_all_changes_every_key(self):
+        cache = TaskListCache(LRUCache())
+        before = cache.key({"limit": 10}, "done", None)
+
+        cache.invalidate_all()
+
+        assert cache.key({"limit": 10}, "done", None) != before
+
@@ -0,0 +1,30 @@
+"""Unit tests for ETag helpers."""
+
+import pytest
+
+from project.utils.etag import etag_matches, make_etag
+
+
+@pytest.mark.unit
+class TestEtag:
+    """make_etag is deterministic, etag_matches follows If-None-Match rules."""
+
+    def test_make_etag_is_stable_and_quoted(self):
+        etag = make_etag(["task", "abc", 1])
+
+        assert etag == make_etag(["task", "abc", 1])
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_make_etag_separates_parts(self):
+        assert make_etag(["ab", "c"]) != make_etag(["a", "bc"])
+
+    @pytest.mark.parametrize(
+        "header",
+        ['"x"', '"a", "x"', 'W/"x"', "*"],
+    )
+    def test_matching_headers(self, header):
+        assert etag_matches(header, '"x"') is True
+
+    @pytest.mark.parametrize("header", [None, "", '"y"', '"a", "b"'])
+    def test_non_matching_headers(self, header):
+        assert etag_matches(header, '"x"') is False
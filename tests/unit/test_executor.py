@@ -0,0 +1,47 @@
+"""Unit tests for the bounded executor used for password hashing."""
+
+import asyncio
+import threading
+
+import pytest
+
+from project.exceptions import ServiceUnavailableError
+from project.utils.executor import BoundedExecutor
+
+
+@pytest.mark.unit
+class TestBoundedExecutor:
+    """BoundedExecutor sheds work beyond workers + queue instead of queueing it."""
+
+    def test_runs_function_off_loop(self):
+        executor = BoundedExecutor(workers=1, max_queue=0)
+
+        async def main() -> str:
+            return await executor.run(lambda: threading.current_thread().name)
+
+        assert asyncio.run(main()) != threading.current_thread().name
+        assert executor.stats().completed == 1
+        executor.shutdown()
+
+    def test_rejects_when_saturated(self):
+        executor = BoundedExecutor(workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def main() -> None:
+            running = asyncio.ensure_future(executor.run(release.wait))
+            queued = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+
+            stats = executor.stats()
+            assert (stats.running, stats.queued) == (1, 1)
+            with pytest.raises(ServiceUnavailableError):
+                await executor.run(release.wait)
+
+            release.set()
+            await asyncio.gather(running, queued)
+
+        asyncio.run(main())
+
+        stats = executor.stats()
+        assert (stats.running, stats.queued, stats.completed, stats.rejected) == (0, 0, 2, 1)
+        executor.shutdown()
@@ -0,0 +1,99 @@
+"""Unit tests for the Prometheus request metrics."""
+
+import asyncio
+import json
+from contextlib import suppress
+
+import pytest
+
+from project.utils.metrics import Metrics
+
+GAUGES = [("db_pool_checked_out", "gauge", "Connections in use.", (("engine", "primary"),), 2)]
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Metrics aggregates per route template and renders the Prometheus text format."""
+
+    def test_counts_requests_by_route_and_status(self):
+        metrics = Metrics()
+        metrics.observe("GET", "/tasks/{task_uuid}", 200, 0.01)
+        metrics.observe("GET", "/tasks/{task_uuid}", 200, 0.02)
+        metrics.observe("GET", "/tasks/{task_uuid}", 404, 0.01)
+
+        text = metrics.render([])
+
+        assert 'http_requests_total{method="GET",route="/tasks/{task_uuid}",status="200"} 2' in text
+        assert 'http_requests_total{method="GET",route="/tasks/{task_uuid}",status="404"} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = Metrics(buckets=(0.1, 1.0))
+        for duration in (0.05, 0.1, 0.5, 3.0):
+            metrics.observe("GET", "/tasks", 200, duration)
+
+        text = metrics.render([])
+
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks",le="0.1"} 2' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks",le="1.0"} 3' in text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks",le="+Inf"} 4' in text
+        assert 'http_request_duration_seconds_count{method="GET",route="/tasks"} 4' in text
+        assert text.count("# TYPE http_request_duration_seconds histogram") == 1
+
+    def test_renders_gauges(self):
+        metrics = Metrics()
+        metrics.in_flight = 3
+
+        text = metrics.render(GAUGES)
+
+        assert "# TYPE db_pool_checked_out gauge" in text
+        assert 'db_pool_checked_out{engine="primary"} 2' in text
+        assert "http_requests_in_flight 3" in text
+
+    def test_multiprocess_merges_workers(self, tmp_path):
+        other_worker = Metrics(multiproc_dir=str(tmp_path))
+        other_worker.observe("GET", "/tasks", 200, 0.01)
+        snapshot = other_worker.snapshot(GAUGES)
+        # a worker that has exited: its counters stay, its gauges go
+        snapshot["pid"] = 2**22 + 1
+        (tmp_path / "other.json").write_text(json.dumps(snapshot))
+
+        metrics = Metrics(multiproc_dir=str(tmp_path))
+        metrics.observe("GET", "/tasks", 200, 0.01)
+        text = metrics.render(GAUGES)
+
+        assert 'http_requests_total{method="GET",route="/tasks",status="200"} 2' in text
+        assert 'db_pool_checked_out{engine="primary"} 2' in text
+
+    def test_flushes_periodically(self, tmp_path):
+        metrics = Metrics(multiproc_dir=str(tmp_path), flush_interval=0.01)
+        metrics.observe("GET", "/tasks", 200, 0.01)
+
+        async def first_snapshot() -> dict:
+            flusher = asyncio.create_task(metrics.flush_periodically(lambda: []))
+            try:
+                async with asyncio.timeout(5):
+                    while not list(tmp_path.glob("*.json")):
+                        await asyncio.sleep(0.01)
+            finally:
+                flusher.cancel()
+            (path,) = tmp_path.glob("*.json")
+            return json.loads(path.read_text())
+
+        assert asyncio.run(first_snapshot())["requests"] == [["GET", "/tasks", 200, 1]]
+
+    def test_flushes_on_shutdown_only_between_intervals(self, tmp_path):
+        metrics = Metrics(multiproc_dir=str(tmp_path), flush_interval=3600)
+
+        async def serve_then_stop() -> list:
+            flusher = asyncio.create_task(metrics.flush_periodically(lambda: []))
+            metrics.observe("GET", "/tasks", 200, 0.01)
+            await asyncio.sleep(0.05)
+            written_while_running = list(tmp_path.glob("*.json"))
+            flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await flusher
+            return written_while_running
+
+        assert asyncio.run(serve_then_stop()) == []
+        (path,) = tmp_path.glob("*.json")
+        assert json.loads(path.read_text())["requests"] == [["GET", "/tasks", 200, 1]]
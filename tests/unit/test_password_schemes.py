@@ -0,0 +1,66 @@
+"""Unit tests for the password scheme registry."""
+
+import pytest
+
+import project.security as security
+from project.config import Settings
+from project.security import encrypt_password, password_needs_rehash, verify_password
+
+
+@pytest.fixture
+def use_settings(monkeypatch, test_settings: Settings):
+    def apply(**overrides) -> Settings:
+        settings = test_settings.model_copy(update=overrides)
+        monkeypatch.setattr(security, "get_settings", lambda: settings)
+        return settings
+
+    return apply
+
+
+@pytest.mark.unit
+class TestPasswordSchemes:
+    """Hashes are verified by the scheme that made them and flagged for rehash."""
+
+    def test_bcrypt_uses_configured_rounds(self, use_settings):
+        use_settings(PASSWORD_HASH_SCHEME="bcrypt", PASSWORD_HASH_ROUNDS=4)
+
+        hashed = encrypt_password("secret")
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("secret", hashed)
+
+    def test_cost_change_needs_rehash(self, use_settings):
+        use_settings(PASSWORD_HASH_SCHEME="bcrypt", PASSWORD_HASH_ROUNDS=4)
+        hashed = encrypt_password("secret")
+
+        assert not password_needs_rehash(hashed)
+        use_settings(PASSWORD_HASH_SCHEME="bcrypt", PASSWORD_HASH_ROUNDS=5)
+        assert password_needs_rehash(hashed)
+
+    def test_test_scheme_only_verifies_while_configured(self, use_settings):
+        use_settings(PASSWORD_HASH_SCHEME="test")
+        hashed = encrypt_password("secret")
+
+        assert hashed.startswith("$test$")
+        assert verify_password("secret", hashed)
+        assert not verify_password("wrong", hashed)
+
+        use_settings(PASSWORD_HASH_SCHEME="bcrypt")
+        assert not verify_password("secret", hashed)
+
+    def test_never_rehashes_into_the_test_scheme(self, use_settings):
+        use_settings(PASSWORD_HASH_SCHEME="bcrypt", PASSWORD_HASH_ROUNDS=4)
+        hashed = encrypt_password("secret")
+
+        use_settings(PASSWORD_HASH_SCHEME="test")
+
+        assert not password_needs_rehash(hashed)
+        assert verify_password("secret", hashed)
+
+    def test_unknown_hash_never_verifies(self):
+        assert not verify_password("secret", "plain-text")
+        assert not password_needs_rehash("plain-text")
+
+    def test_rounds_are_validated(self):
+        with pytest.raises(ValueError):
+            Settings(PASSWORD_HASH_ROUNDS=3)
@@ -0,0 +1,41 @@
+"""Unit tests for read-your-writes tracking."""
+
+from http.cookies import SimpleCookie
+
+import pytest
+
+from project.db.replicas import LAST_WRITE_COOKIE, ReadYourWrites
+
+
+def cookies(set_cookie: str) -> dict[str, str]:
+    """What the client sends back after receiving `set_cookie`."""
+    return {name: morsel.value for name, morsel in SimpleCookie(set_cookie).items()}
+
+
+@pytest.mark.unit
+class TestReadYourWrites:
+    """ReadYourWrites routes a client to the primary for the window after its last write."""
+
+    def test_zero_window_disables_tracking(self):
+        read_your_writes = ReadYourWrites(window=0)
+
+        assert not read_your_writes.recently_wrote(cookies(read_your_writes.cookie()))
+
+    def test_cookie_marks_write_for_the_window(self):
+        read_your_writes = ReadYourWrites(window=5)
+        sent = cookies(read_your_writes.cookie(now=1000.0))
+
+        assert read_your_writes.recently_wrote(sent, now=1004.9)
+        assert not read_your_writes.recently_wrote(sent, now=1005.0)
+
+    def test_cookie_expires_with_the_window(self):
+        (morsel,) = SimpleCookie(ReadYourWrites(window=2.5).cookie()).values()
+
+        assert morsel["max-age"] == "3"
+        assert morsel["httponly"]
+
+    def test_missing_or_malformed_cookie(self):
+        read_your_writes = ReadYourWrites(window=60)
+
+        assert not read_your_writes.recently_wrote({})
+        assert not read_your_writes.recently_wrote({LAST_WRITE_COOKIE: "yesterday"})
@@ -0,0 +1,69 @@
+"""Unit tests for the verified-token cache in decode_token."""
+
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+
+import project.security as security
+from project.config import Settings
+from project.security import TokenPayload, create_access_token, decode_token
+
+PAYLOAD = TokenPayload(username="testuser", role="user", user_uuid="0c8b1a4e-7f55-4b8e-9d61-3c2a6f0e9b11")
+
+
+@pytest.fixture
+def use_settings(monkeypatch, test_settings: Settings):
+    """Point security at the given settings, with an empty token cache."""
+
+    def apply(**overrides) -> Settings:
+        settings = test_settings.model_copy(update=overrides)
+        monkeypatch.setattr(security, "get_settings", lambda: settings)
+        return settings
+
+    security.get_token_cache.cache_clear()
+    apply()
+    yield apply
+    security.get_token_cache.cache_clear()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("use_settings")
+class TestTokenCache:
+    """Verified tokens are reused until expiry and never outlive a key rotation."""
+
+    def test_second_decode_is_a_cache_hit(self):
+        token = create_access_token(PAYLOAD).access_token
+
+        first = decode_token(token)
+        second = decode_token(token)
+
+        assert first == second
+        assert first.username == "testuser"
+        assert security.token_cache_stats().hits == 1
+
+    def test_expired_token_is_not_cached(self):
+        token = create_access_token(PAYLOAD, expires_delta=timedelta(seconds=-1)).access_token
+
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+        assert security.token_cache_stats().size == 0
+
+    def test_key_rotation_bypasses_cached_tokens(self, use_settings):
+        token = create_access_token(PAYLOAD).access_token
+        decode_token(token)
+
+        use_settings(SECRET_KEY="rotated-secret-key")
+
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    def test_disabled_cache_stores_nothing(self, use_settings):
+        use_settings(TOKEN_CACHE_ENABLED=False)
+        token = create_access_token(PAYLOAD).access_token
+
+        decode_token(token)
+        decode_token(token)
+
+        assert security.token_cache_stats().size == 0